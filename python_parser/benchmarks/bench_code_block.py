@@ -0,0 +1,45 @@
+"""
+Scaling of `code_block` vs `fast_code_block` on large fences.
+
+Run from the repository root:
+
+    python -m python_parser.benchmarks.bench_code_block
+"""
+
+# Imports -----------------------------------------
+import sys
+
+# Library Imports ----------------------------------
+from python_parser.src.models import code_block, fast_code_block
+from python_parser.benchmarks.timing import best_of, format_rate
+
+# Constants ---------------------------------------------
+LOG_LINE = "2025-01-07 12:00:00,000 INFO  worker-3 processed batch id=4711 in 12ms\n"
+FENCE_SIZES_MB = [0.25, 0.5, 1, 2, 4]
+
+
+# Functions ---------------------------------------------
+def make_fence(size_mb: float) -> str:
+    """Build a ```log fence whose body is roughly `size_mb` megabytes"""
+    lines = int(size_mb * 1_000_000 / len(LOG_LINE))
+    return "```log\n" + LOG_LINE * lines + "```\n"
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    sizes = [float(size) for size in argv] or FENCE_SIZES_MB
+    print(f"{'fence':>8} {'lines':>8} | {'code_block':>22} | {'fast_code_block':>22}")
+    for size_mb in sizes:
+        fence = make_fence(size_mb)
+        assert code_block.parse(fence) == fast_code_block.parse(fence)
+        slow = best_of(code_block.parse, fence, repeat=3)
+        fast = best_of(fast_code_block.parse, fence, repeat=3)
+        print(
+            f"{size_mb:>6} MB {fence.count(chr(10)):>8} | "
+            f"{slow * 1000:8.1f} ms {format_rate(len(fence), slow)} | "
+            f"{fast * 1000:8.1f} ms {format_rate(len(fence), fast)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
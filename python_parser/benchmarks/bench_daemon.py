@@ -0,0 +1,111 @@
+"""
+Editor latency: a cold CLI parse vs requests to a warm ParserDaemon.
+
+Parses notes of a synthetic vault four ways and reports the median latency
+per note:
+
+    cold CLI          a fresh interpreter per note (imports, models, parse)
+    daemon, connect   one request per note on a new connection
+    daemon, kept      one request per note on a kept connection
+    daemon, batch     every note in one batched request, per note
+
+The daemon runs as its own process, as an editor would use it, without a
+parse cache so every request parses.
+
+Run from the repository root:
+
+    python -m python_parser.benchmarks.bench_daemon [notes]
+"""
+
+# Imports -----------------------------------------
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, List
+
+# Library Imports ----------------------------------
+from python_parser.src.daemon import DaemonClient
+from python_parser.benchmarks.bench_import import ROOT
+from python_parser.benchmarks.vault_gen import VaultSpec, write_vault
+
+# Constants ---------------------------------------------
+CLI_PARSE = (
+    "import sys\n"
+    "from python_parser.src.vault import parse_vault_file\n"
+    "assert parse_vault_file(sys.argv[1]).error is None\n"
+)
+
+
+# Functions ---------------------------------------------
+def latencies(run: Callable[[str], object], paths: List[str]) -> List[float]:
+    times = []
+    for path in paths:
+        start = time.perf_counter()
+        run(path)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def cold_parse(path: str) -> None:
+    subprocess.run([sys.executable, "-c", CLI_PARSE, path], cwd=ROOT, check=True)
+
+
+def start_daemon(socket_path: str) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "python_parser.src.daemon", "--socket", socket_path],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    # The daemon prints once it is listening, after warming up
+    line = process.stdout.readline()
+    if not line.startswith("Listening"):
+        process.kill()
+        raise ValueError(f"\nParser daemon did not start: {line!r}\n\n")
+    return process
+
+
+def main(argv: List[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    notes = int(argv[0]) if argv else 20
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_vault(directory, VaultSpec(notes=notes, mean_kb=4.0))
+        socket_path = os.path.join(directory, "parser.sock")
+        daemon = start_daemon(socket_path)
+        try:
+
+            def connect_parse(path: str) -> None:
+                with DaemonClient(socket_path) as client:
+                    assert client.request("parse_file", path=path)["error"] is None
+
+            with DaemonClient(socket_path) as kept:
+                results = {
+                    "cold CLI": latencies(cold_parse, paths),
+                    "daemon, connect": latencies(connect_parse, paths),
+                    "daemon, kept": latencies(
+                        lambda path: kept.request("parse_file", path=path), paths
+                    ),
+                }
+                start = time.perf_counter()
+                responses = kept.batch([("parse_file", {"path": p}) for p in paths])
+                batch_seconds = time.perf_counter() - start
+                assert all(response["ok"] for response in responses)
+                results["daemon, batch"] = [batch_seconds / len(paths)]
+        finally:
+            # SIGTERM: the daemon removes its socket on the way out
+            daemon.terminate()
+            daemon.wait()
+
+    cold = statistics.median(results["cold CLI"])
+    print(f"{notes} notes, median latency per note:")
+    for name, times in results.items():
+        median = statistics.median(times)
+        print(f"  {name:<16}: {median * 1000:9.2f} ms  ({cold / median:6.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
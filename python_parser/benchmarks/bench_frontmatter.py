@@ -0,0 +1,83 @@
+"""
+Frontmatter-only reads vs the full-file parse path.
+
+Times a "list all notes with status X" style pass over a temporary vault:
+`read_frontmatter` against `FileParserBase(parser=basic_markdown_parser)`,
+which reads and keeps every file to get at the YAML header.
+
+Run from the repository root:
+
+    python -m python_parser.benchmarks.bench_frontmatter [notes] [body_kb]
+"""
+
+# Imports -----------------------------------------
+import os
+import sys
+import tempfile
+
+# Library Imports ----------------------------------
+from python_parser.src.base import FileParserBase
+from python_parser.src.frontmatter import read_frontmatter
+from python_parser.src.models import basic_markdown_parser
+from python_parser.benchmarks.timing import best_of
+
+# Constants ---------------------------------------------
+FRONTMATTER = """---
+id: XcEgwWjA6pXuCBmGmckQrX
+aliases: ['Python_Parser']
+tags: ['project', 'python']
+category: PROJECT_NOTES
+status: {status}
+vault_path: Projects/python_parser/Notes.md
+---
+"""
+BODY_LINE = "Some body text for the note, long enough to look like prose.\n"
+
+
+# Functions ---------------------------------------------
+def write_vault(directory: str, notes: int, body_kb: int) -> list[str]:
+    body = BODY_LINE * (body_kb * 1024 // len(BODY_LINE))
+    paths = []
+    for i in range(notes):
+        path = os.path.join(directory, f"note_{i}.md")
+        status = "processed" if i % 3 else "new"
+        with open(path, "w") as file:
+            file.write(FRONTMATTER.format(status=status) + body)
+        paths.append(path)
+    return paths
+
+
+def full_parse_pass(paths: list[str]) -> int:
+    parser = FileParserBase(file_type="md", parser=basic_markdown_parser)
+    return sum(
+        parser(path).frontmatter.content["status"] == "new" for path in paths
+    )
+
+
+def frontmatter_pass(paths: list[str]) -> int:
+    return sum(read_frontmatter(path)[0].content["status"] == "new" for path in paths)
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    notes = int(argv[0]) if argv else 500
+    body_kb = int(argv[1]) if len(argv) > 1 else 64
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_vault(directory, notes, body_kb)
+        assert full_parse_pass(paths) == frontmatter_pass(paths)
+        full = best_of(full_parse_pass, paths, repeat=3)
+        fast = best_of(frontmatter_pass, paths, repeat=3)
+        total_bytes = sum(os.path.getsize(path) for path in paths)
+        header_bytes = sum(read_frontmatter(path)[1] for path in paths)
+
+    print(f"{notes} notes, {body_kb} KB body each")
+    print(f"  full parse       : {full * 1000:9.1f} ms  {total_bytes:>12,} bytes read")
+    print(
+        f"  read_frontmatter : {fast * 1000:9.1f} ms  {header_bytes:>12,} bytes read"
+        f"  ({full / fast:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
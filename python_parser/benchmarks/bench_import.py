@@ -0,0 +1,142 @@
+"""
+Startup cost of the package entry points, from `python -X importtime`.
+
+Each entry point is imported in a fresh interpreter `rounds` times and its best
+cumulative import time is checked against IMPORT_BUDGET_MS. Modules in DEFERRED
+must not be imported by any entry point at all: they load only when a feature
+needs them (PyYAML when frontmatter is read or written, python-dotenv when a
+setting is read, multiprocessing when `parse_vault` starts workers).
+
+Budget (best of the rounds, in ms):
+
+    python_parser.src.models            20   the lazy package surface alone
+    python_parser.src.models.parsers   350   pydantic models and combinators
+    python_parser.src.main             450   `parse-main` before parsing
+
+The parsers budget is mostly pydantic building the node models. The budgets
+hold on a laptop-class CPU and leave room for a noisy one. Timings depend on
+the machine, so the check is opt-in in the test suite: set
+PARSER_IMPORT_BUDGET=1 to run it with pytest, or run it directly (below).
+
+Run from the repository root:
+
+    python -m python_parser.benchmarks.bench_import
+    python -m python_parser.benchmarks.bench_import --check --rounds 7
+"""
+
+# Imports -----------------------------------------
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# Constants ---------------------------------------------
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+IMPORT_BUDGET_MS: Dict[str, float] = {
+    "python_parser.src.models": 20,
+    "python_parser.src.models.parsers": 350,
+    "python_parser.src.main": 450,
+}
+DEFERRED = ("yaml", "shortuuid", "dotenv", "multiprocessing")
+
+
+# Functions ---------------------------------------------
+def parse_importtime(output: str) -> Dict[str, Tuple[int, int]]:
+    """{module: (self us, cumulative us)} from `-X importtime` output"""
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # The header line
+        times[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return times
+
+
+def import_times(module: str) -> Dict[str, Tuple[int, int]]:
+    """Import `module` in a fresh interpreter and return its import times"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(process.stderr)
+
+
+def deferred_imports(times: Dict[str, Tuple[int, int]]) -> List[str]:
+    return sorted(
+        name
+        for name in times
+        if any(name == root or name.startswith(root + ".") for root in DEFERRED)
+    )
+
+
+def measure_import(
+    module: str, rounds: int = 5
+) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """
+    Returns:
+        The best cumulative import time of `module` in ms, and the import
+        times of the run that gave it.
+    """
+    best_ms, best_times = float("inf"), {}
+    for _ in range(rounds):
+        times = import_times(module)
+        ms = times[module][1] / 1000
+        if ms < best_ms:
+            best_ms, best_times = ms, times
+    return best_ms, best_times
+
+
+def check_budget(
+    results: Dict[str, float], budget: Dict[str, float] = IMPORT_BUDGET_MS
+) -> List[str]:
+    """A message for each module whose import time is over its budget"""
+    return [
+        f"{module}: {ms:.1f} ms is over its {budget[module]:g} ms budget"
+        for module, ms in results.items()
+        if module in budget and ms > budget[module]
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--top", type=int, default=8, help="Modules with the most self time to show"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Fail when over budget or not deferred"
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    failures = []
+    for module, budget_ms in IMPORT_BUDGET_MS.items():
+        ms, times = measure_import(module, rounds=args.rounds)
+        results[module] = ms
+        print(f"  {module:<36}{ms:9.1f} ms  (budget {budget_ms:g} ms)")
+        slowest = sorted(times.items(), key=lambda item: -item[1][0])
+        for name, (self_us, _) in slowest[: args.top]:
+            print(f"      {self_us / 1000:7.1f} ms  {name}")
+        loaded = deferred_imports(times)
+        if loaded:
+            failures.append(f"{module} imports deferred modules: {', '.join(loaded)}")
+    failures.extend(check_budget(results))
+
+    if args.check:
+        if failures:
+            print("\nImport budget exceeded:")
+            for failure in failures:
+                print(f"  {failure}")
+            return 1
+        print("\nWithin the import budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Pydantic DataType nodes vs slotted nodes on a large document.
+
+Parses a document of about 10k blocks with `fast_document` (DataType models),
+`compact_document` (slotted nodes) and `ColumnarContent` (typed arrays), and
+reports parse time and the memory held by the result beyond the source text.
+
+Run from the repository root:
+
+    python -m python_parser.benchmarks.bench_nodes [nodes]
+"""
+
+# Imports -----------------------------------------
+import gc
+import sys
+import tracemalloc
+
+# Library Imports ----------------------------------
+from python_parser.src.models import (
+    ColumnarContent,
+    Header,
+    compact_document,
+    fast_document,
+)
+from python_parser.benchmarks.timing import best_of
+
+# Constants ---------------------------------------------
+# Seven blocks: header, paragraph, two list items, code block, callout, tag
+SECTION = """## Section {i}
+Paragraph text for section {i}, with a [[link]] and some `code`.
+
+- first item
+  - nested item
+
+```python
+value = {i}
+```
+
+> [!note]
+> A callout line
+
+#tag{i}
+
+"""
+
+
+# Functions ---------------------------------------------
+def make_document(nodes: int) -> str:
+    return "".join(SECTION.format(i=i) for i in range(nodes // 7 + 1))
+
+
+def retained_bytes(parse, text: str) -> int:
+    """Bytes still allocated once the parse result is built"""
+    gc.collect()
+    tracemalloc.start()
+    result = parse(text)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    nodes = int(argv[0]) if argv else 10_000
+    text = make_document(nodes)
+
+    models = fast_document.parse(text)
+    compact = compact_document.parse(text)
+    assert compact.to_model() == models
+    count = len(models.nodes)
+
+    print(f"{count} nodes, {len(text):,} characters")
+    print(
+        f"{'':>18} | {'parse':>10} | {'per node':>9} | {'retained':>10} | {'per node':>9}"
+    )
+    parsers = {
+        "fast_document": fast_document.parse,
+        "compact_document": compact_document.parse,
+        "ColumnarContent": ColumnarContent,
+    }
+    for name, parse in parsers.items():
+        seconds = best_of(parse, text, repeat=3)
+        size = retained_bytes(parse, text)
+        print(
+            f"{name:>18} | {seconds * 1000:7.1f} ms | {seconds / count * 1e6:6.2f} us"
+            f" | {size / 1e6:7.2f} MB | {size / count:7.0f} B"
+        )
+    to_model = best_of(compact.to_model, repeat=3)
+    print(f"{'to_model()':>18} | {to_model * 1000:7.1f} ms |")
+
+    columns = ColumnarContent(text)
+    query = best_of(columns.select, Header, 2, repeat=3)
+    print(f"{'level-2 headers':>18} | {query * 1000:7.2f} ms | (columnar select)")
+
+
+if __name__ == "__main__":
+    main()
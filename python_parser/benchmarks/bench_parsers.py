@@ -0,0 +1,73 @@
+"""
+Per-call cost of the individual parsers.
+
+Times `parser.parse_partial(sample)` for each exported parser on a small
+representative input, so a change that makes one of them slower (for example
+building sub-parsers inside a generator body again) shows up on its own line.
+
+Run from the repository root:
+
+    python -m python_parser.benchmarks.bench_parsers [calls]
+"""
+
+# Imports -----------------------------------------
+import sys
+
+# Library Imports ----------------------------------
+from python_parser.src.models import parsers
+from python_parser.src.models.nix_parse_primitives import nix_parser
+from python_parser.benchmarks.timing import best_of
+
+# Constants ---------------------------------------------
+NIX_SAMPLE = """{ pkgs, lib, config, inputs, ...}:
+{
+  env = {
+    GREET = "devenv";
+  };
+  packages = [
+    pkgs.git
+  ];
+  languages = {
+    python = {
+      enable = true;
+    };
+  };
+  enterShell = ''hello'';
+}"""
+
+# (name, parser, sample input)
+SAMPLES = [
+    ("list_item", parsers.list_item, "  - a list item with some text\n"),
+    ("inline_code", parsers.inline_code, "`print('hello')`"),
+    ("wiki_link", parsers.wiki_link, "[[Some Note#Heading|alias]]"),
+    ("external_link", parsers.external_link, "[text](https://example.com/page)"),
+    ("image_link", parsers.image_link, "![alt text](https://example.com/x.png)"),
+    ("tag", parsers.tag, "#project"),
+    ("header", parsers.header, "## A section header\n"),
+    ("code_block", parsers.code_block, "```python\nx = 1\ny = 2\n```\n"),
+    ("callout", parsers.callout, "> [!note]\n> first line\n> second line\n"),
+    ("paragraph", parsers.paragraph, "First line of text.\nSecond line.\n"),
+    ("db_node_tag", parsers.db_node_tag, "%%XcEgwWjA6pXuCBmGmckQrX|0.0.1|Header%%"),
+    ("db_node", parsers.db_node, "%%XcEgwWjA6pXuCBmGmckQrX|0.0.1|Text%%body text"),
+    ("front_matter", parsers.front_matter, "---\ntitle: Note\ntags: [a, b]\n---\n"),
+    ("nix_parser", nix_parser, NIX_SAMPLE),
+]
+
+
+# Functions ---------------------------------------------
+def per_call(parser, sample: str, calls: int) -> float:
+    parse = parser.parse_partial
+    return best_of(parse, sample, repeat=5, number=calls)
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    calls = int(argv[0]) if argv else 2000
+
+    for name, parser, sample in SAMPLES:
+        seconds = per_call(parser, sample, calls)
+        print(f"  {name:<14}: {seconds * 1_000_000:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
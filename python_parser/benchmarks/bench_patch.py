@@ -0,0 +1,63 @@
+"""
+Re-rendering update vs header patch for a "mark notes processed" job.
+
+Sets `status: processed` on every note of a temporary vault three ways: the
+old parse + `ObsidianFile.write` path, `patch_frontmatter` one file at a time,
+and `patch_frontmatter_batch` on a thread pool.
+
+Run from the repository root:
+
+    python -m python_parser.benchmarks.bench_patch [notes] [body_kb]
+"""
+
+# Imports -----------------------------------------
+import sys
+import tempfile
+import time
+
+# Library Imports ----------------------------------
+from python_parser.src.frontmatter import patch_frontmatter, patch_frontmatter_batch
+from python_parser.src.models import basic_markdown_parser
+from python_parser.benchmarks.bench_frontmatter import write_vault
+
+
+# Functions ---------------------------------------------
+def rerender_pass(paths: list[str]) -> None:
+    for path in paths:
+        with open(path, "r") as file:
+            markdown_base = basic_markdown_parser.parse(file.read())
+        markdown_base.frontmatter.update(key="status", value="processed")
+        markdown_base.write(path)
+
+
+def patch_pass(paths: list[str]) -> None:
+    for path in paths:
+        patch_frontmatter(path, "status", "processed")
+
+
+def batch_pass(paths: list[str]) -> None:
+    patch_frontmatter_batch(paths, "status", "processed")
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    notes = int(argv[0]) if argv else 2000
+    body_kb = int(argv[1]) if len(argv) > 1 else 16
+
+    print(f"{notes} notes, {body_kb} KB body each")
+    for name, update in (
+        ("parse + write", rerender_pass),
+        ("patch_frontmatter", patch_pass),
+        ("batch (8 threads)", batch_pass),
+    ):
+        # A fresh vault per run, so every note still needs the change
+        with tempfile.TemporaryDirectory() as directory:
+            paths = write_vault(directory, notes, body_kb)
+            start = time.perf_counter()
+            update(paths)
+            seconds = time.perf_counter() - start
+        print(f"  {name:<18}: {seconds * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
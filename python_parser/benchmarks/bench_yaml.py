@@ -0,0 +1,49 @@
+"""
+Frontmatter YAML loading: `yaml.safe_load` vs `load_yaml`.
+
+Loads a set of frontmatter headers with the pure-Python safe loader, the
+libyaml CSafeLoader, the flat fast path alone, and `load_yaml` with its memo
+(templated headers repeat, so most loads are memo hits).
+
+Run from the repository root:
+
+    python -m python_parser.benchmarks.bench_yaml [headers] [distinct]
+"""
+
+# Imports -----------------------------------------
+import sys
+
+import yaml
+
+# Library Imports ----------------------------------
+from python_parser.src.models.yaml_loader import SafeLoader, load_flat, load_yaml
+from python_parser.benchmarks.bench_frontmatter import FRONTMATTER
+from python_parser.benchmarks.timing import best_of
+
+
+# Functions ---------------------------------------------
+def make_headers(headers: int, distinct: int) -> list[str]:
+    # The YAML between the delimiters, with `distinct` different statuses
+    template = FRONTMATTER.strip().strip("-").strip() + "\n"
+    return [template.format(status=f"status_{i % distinct}") for i in range(headers)]
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    headers = int(argv[0]) if argv else 5000
+    distinct = int(argv[1]) if len(argv) > 1 else 50
+
+    texts = make_headers(headers, distinct)
+    assert all(load_yaml(text) == yaml.safe_load(text) for text in texts)
+    for name, load in (
+        ("yaml.safe_load", yaml.safe_load),
+        (f"{SafeLoader.__name__}", lambda text: yaml.load(text, Loader=SafeLoader)),
+        ("load_flat", load_flat),
+        ("load_yaml (memo)", load_yaml),
+    ):
+        seconds = best_of(lambda: [load(text) for text in texts], repeat=3)
+        print(f"  {name:<17}: {seconds * 1000:9.1f} ms  ({headers / seconds:,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Bulk frontmatter rewrite: `yaml.safe_dump` vs the round-trip writer.
+
+Parses a set of frontmatter headers, sets `status: processed` on each and
+writes them back with `yaml.safe_dump` of the whole mapping and with
+`FrontMatter.to_string`, and counts the header lines each one changes.
+
+Run from the repository root:
+
+    python -m python_parser.benchmarks.bench_yaml_writer [headers]
+"""
+
+# Imports -----------------------------------------
+import sys
+
+import yaml
+
+# Library Imports ----------------------------------
+from python_parser.src.models.parsers import parse_frontmatter
+from python_parser.src.models.yaml_writer import DUMP_OPTIONS
+from python_parser.benchmarks.timing import best_of
+
+# Constants ---------------------------------------------
+HEADER = """id: XcEgwWjA6pXuCBmGmckQrX{i}
+aliases: ['Python_Parser']
+tags:
+  - project
+  - python   # primary
+category: PROJECT_NOTES
+created: 2024-01-{day:02d}
+status: new
+vault_path: "Projects/python_parser/Notes {i}.md\""""
+
+
+# Functions ---------------------------------------------
+def changed_lines(before: str, after: str) -> int:
+    return len(set(before.splitlines()) ^ set(after.splitlines()))
+
+
+def safe_dump_pass(frontmatters: list) -> list[str]:
+    return [
+        yaml.safe_dump(frontmatter.content, **DUMP_OPTIONS)[:-1]
+        for frontmatter in frontmatters
+    ]
+
+
+def round_trip_pass(frontmatters: list) -> list[str]:
+    return [frontmatter.to_string()[4:-4] for frontmatter in frontmatters]
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    headers = int(argv[0]) if argv else 5000
+
+    sources = [HEADER.format(i=i, day=i % 28 + 1) for i in range(headers)]
+    frontmatters = [parse_frontmatter(source) for source in sources]
+    for frontmatter in frontmatters:
+        frontmatter.update("status", "processed")
+
+    print(f"{headers} headers, one key changed in each")
+    for name, write in (
+        ("yaml.safe_dump", safe_dump_pass),
+        ("round-trip", round_trip_pass),
+    ):
+        texts = write(frontmatters)
+        assert all(
+            yaml.safe_load(text) == frontmatter.content
+            for text, frontmatter in zip(texts, frontmatters)
+        )
+        lines = sum(map(changed_lines, sources, texts)) / headers
+        seconds = best_of(write, frontmatters, repeat=3)
+        print(f"  {name:<15}: {seconds * 1000:9.1f} ms  {lines:.1f} lines changed/header")
+
+
+if __name__ == "__main__":
+    main()
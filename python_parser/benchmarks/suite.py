@@ -0,0 +1,272 @@
+"""
+Benchmark suite with stored baselines.
+
+Times each public parser on a deterministic synthetic vault (see vault_gen.py)
+and `main`'s end-to-end loop over the same vault written to disk. For every
+case it reports per-call timing stats, throughput and the peak Python memory
+of one call (in this process only, so not `main`'s parse workers). Results can
+be saved as a baseline and later checked against it: a case whose throughput
+(from its fastest round) falls more than the threshold below its baseline is
+a regression, and the check exits with status 1. The default threshold of 40%
+sits above the run-to-run noise seen on a shared machine (about 30%).
+
+Baselines are machine specific. The committed baselines.json was recorded on
+one machine (named in its "machine" field); regenerate it with --save on the
+machine that runs --check before relying on the check.
+
+Run from the repository root:
+
+    python -m python_parser.benchmarks.suite
+    python -m python_parser.benchmarks.suite --save
+    python -m python_parser.benchmarks.suite --check --threshold 0.2
+"""
+
+# Imports -----------------------------------------
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+# Library Imports ----------------------------------
+from python_parser.src.models import (
+    basic_markdown_parser,
+    compact_document,
+    db_nodes,
+    document,
+    extract_references,
+    fast_document,
+    section,
+    section_index,
+)
+from python_parser.benchmarks.timing import Stats, measure, peak_memory
+from python_parser.benchmarks.vault_gen import (
+    VaultSpec,
+    generate_db_nodes,
+    generate_section,
+    generate_vault,
+    write_vault,
+)
+
+# Constants ---------------------------------------------
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+BASELINE_FORMAT = 1
+DEFAULT_THRESHOLD = 0.4
+DB_NODES = 500
+SECTION_LINES = 2000
+# Short cases repeat for at least this long, so their minimum is stable
+MIN_TIME = 0.5
+
+
+# Classes -----------------------------------------------
+@dataclass
+class Case:
+    """One benchmark: `run()` processes `size` bytes of input"""
+
+    name: str
+    run: Callable[[], Any]
+    size: int
+
+
+@dataclass
+class CaseResult:
+    name: str
+    size: int
+    stats: Stats
+    peak_bytes: int
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.size / self.stats.min / 1_000_000
+
+
+# Functions ---------------------------------------------
+def parse_all(parser, texts: List[str]) -> Callable[[], Any]:
+    return lambda: [parser.parse(text) for text in texts]
+
+
+def build_cases(spec: VaultSpec, directory: str) -> List[Case]:
+    """
+    All suite cases for a spec; notes for `main` are written to `directory`.
+    """
+    # Imported here: main reads the environment configuration on import
+    from python_parser.src.main import main
+
+    texts = list(generate_vault(spec).values())
+    vault_bytes = sum(len(text) for text in texts)
+    db_text = generate_db_nodes(DB_NODES, seed=spec.seed)
+    section_text = generate_section(SECTION_LINES, seed=spec.seed)
+    write_vault(directory, spec)
+
+    def run_main() -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            main(directory)
+
+    return [
+        Case("document", parse_all(document, texts), vault_bytes),
+        Case(
+            "basic_markdown_parser", parse_all(basic_markdown_parser, texts), vault_bytes
+        ),
+        Case("fast_document", parse_all(fast_document, texts), vault_bytes),
+        Case("compact_document", parse_all(compact_document, texts), vault_bytes),
+        Case(
+            "extract_references",
+            lambda: [extract_references(text) for text in texts],
+            vault_bytes,
+        ),
+        Case("db_nodes", lambda: db_nodes.parse(db_text), len(db_text)),
+        Case("section", lambda: section.parse(section_text), len(section_text)),
+        Case(
+            "section_index", lambda: [section_index(text) for text in texts], vault_bytes
+        ),
+        Case("main", run_main, vault_bytes),
+    ]
+
+
+def run_cases(
+    cases: List[Case], rounds: int = 3, only: Optional[List[str]] = None
+) -> List[CaseResult]:
+    results = []
+    for case in cases:
+        if only and not any(name in case.name for name in only):
+            continue
+        stats = measure(case.run, rounds=rounds, min_time=MIN_TIME)
+        peak = peak_memory(case.run)
+        results.append(CaseResult(case.name, case.size, stats, peak))
+    return results
+
+
+def save_baseline(path: str, spec: VaultSpec, results: List[CaseResult]) -> None:
+    baseline = {
+        "format": BASELINE_FORMAT,
+        "machine": f"{platform.machine()} {platform.python_implementation()} "
+        f"{platform.python_version()}",
+        "spec": asdict(spec),
+        "results": {
+            result.name: {
+                "mb_per_s": round(result.mb_per_s, 3),
+                "min_ms": round(result.stats.min * 1000, 3),
+                "peak_kb": result.peak_bytes // 1024,
+            }
+            for result in results
+        },
+    }
+    with open(path, "w") as file:
+        json.dump(baseline, file, indent=2)
+        file.write("\n")
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    with open(path, "r") as file:
+        baseline = json.load(file)
+    if baseline.get("format") != BASELINE_FORMAT:
+        raise ValueError(f"\nUnsupported benchmark baseline format in: {path}\n\n")
+    return baseline
+
+
+def check_regressions(
+    results: List[CaseResult], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """
+    Compare results to a baseline.
+
+    Returns:
+        A message for each case whose throughput is more than `threshold`
+        (a fraction) below its baseline. Cases missing from the baseline are
+        not checked.
+    """
+    failures = []
+    for result in results:
+        expected = baseline["results"].get(result.name)
+        if expected is None:
+            continue
+        floor = expected["mb_per_s"] * (1 - threshold)
+        if result.mb_per_s < floor:
+            failures.append(
+                f"{result.name}: {result.mb_per_s:.2f} MB/s is below "
+                f"{floor:.2f} MB/s (baseline {expected['mb_per_s']:.2f} MB/s "
+                f"- {threshold:.0%})"
+            )
+    return failures
+
+
+def print_results(
+    results: List[CaseResult], baseline: Optional[Dict[str, Any]] = None
+) -> None:
+    print(
+        f"  {'case':<22}{'min ms':>10}{'mean ms':>10}{'stddev':>9}{'rounds':>7}"
+        f"{'MB/s':>9}{'peak KB':>10}{'vs base':>9}"
+    )
+    for result in results:
+        stats = result.stats
+        change = ""
+        if baseline and result.name in baseline["results"]:
+            base = baseline["results"][result.name]["mb_per_s"]
+            change = f"{result.mb_per_s / base - 1:+.0%}"
+        print(
+            f"  {result.name:<22}{stats.min * 1000:10.2f}{stats.mean * 1000:10.2f}"
+            f"{stats.stddev * 1000:9.2f}{stats.rounds:7d}{result.mb_per_s:9.2f}"
+            f"{result.peak_bytes // 1024:10,d}{change:>9}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--notes", type=int, default=VaultSpec.notes)
+    parser.add_argument("--mean-kb", type=float, default=VaultSpec.mean_kb)
+    parser.add_argument("--seed", type=int, default=VaultSpec.seed)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument(
+        "--only", action="append", help="Run cases whose name contains this"
+    )
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--save", action="store_true", help="Store the results as the baseline"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail on throughput regressions against the baseline (uses its spec)",
+    )
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.check or os.path.exists(args.baseline):
+        baseline = load_baseline(args.baseline)
+    if args.check:
+        spec = VaultSpec(**baseline["spec"])
+    else:
+        spec = VaultSpec(notes=args.notes, mean_kb=args.mean_kb, seed=args.seed)
+        if baseline and asdict(spec) != baseline["spec"]:
+            # Numbers from another vault are not comparable
+            baseline = None
+
+    with tempfile.TemporaryDirectory() as directory:
+        cases = build_cases(spec, directory)
+        vault_kb = cases[0].size // 1024
+        print(f"{spec.notes} notes, {vault_kb:,} KB (seed {spec.seed})")
+        results = run_cases(cases, rounds=args.rounds, only=args.only)
+    print_results(results, baseline)
+
+    if args.save:
+        save_baseline(args.baseline, spec, results)
+        print(f"\nSaved baseline to {args.baseline}")
+    if args.check:
+        failures = check_regressions(results, baseline, args.threshold)
+        if failures:
+            print("\nRegressions:")
+            for failure in failures:
+                print(f"  {failure}")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+# Imports -----------------------------------------
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+# Classes -----------------------------------------------
+@dataclass
+class Stats:
+    """Per-call timings of one benchmark, in seconds"""
+
+    min: float
+    max: float
+    mean: float
+    median: float
+    stddev: float
+    rounds: int
+
+
+# Functions ---------------------------------------------
+def best_of(fn: Callable[..., Any], *args, repeat: int = 5, number: int = 1) -> float:
+    """
+    Time `fn(*args)` and return the best per-call time in seconds.
+
+    Runs `repeat` rounds of `number` calls each and keeps the fastest round,
+    which is the least noisy estimate on a shared machine.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn(*args)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def measure(
+    fn: Callable[..., Any],
+    *args,
+    rounds: int = 5,
+    warmup: int = 1,
+    min_time: float = 0.0,
+) -> Stats:
+    """
+    Time `fn(*args)` over several rounds, pytest-benchmark style.
+
+    Args:
+        fn: The function to time
+        rounds: Minimum number of timed calls
+        warmup: Untimed calls first (imports, caches, lazy compilation)
+        min_time: Keep timing past `rounds` until this many seconds have run
+
+    Returns:
+        Stats over the per-call times.
+    """
+    for _ in range(warmup):
+        fn(*args)
+    times = []
+    total = 0.0
+    while len(times) < rounds or total < min_time:
+        start = time.perf_counter()
+        fn(*args)
+        elapsed = time.perf_counter() - start
+        times.append(elapsed)
+        total += elapsed
+    return Stats(
+        min=min(times),
+        max=max(times),
+        mean=statistics.fmean(times),
+        median=statistics.median(times),
+        stddev=statistics.stdev(times) if len(times) > 1 else 0.0,
+        rounds=len(times),
+    )
+
+
+def peak_memory(fn: Callable[..., Any], *args) -> int:
+    """Peak bytes allocated by Python during one call of `fn(*args)`"""
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+
+def format_rate(size_bytes: int, seconds: float) -> str:
+    """Format a throughput in MB/s"""
+    return f"{size_bytes / seconds / 1_000_000:8.2f} MB/s"
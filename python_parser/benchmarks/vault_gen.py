@@ -0,0 +1,211 @@
+"""
+Deterministic synthetic vault generator for the benchmarks.
+
+Notes are built from the block types the parsers handle (headers, lists, code
+blocks, callouts, DB-tagged paragraphs, paragraphs with links and tags) in
+configurable proportions, with lognormally distributed sizes. The same spec
+always gives the same notes, byte for byte, so timings are comparable across
+runs and machines.
+
+Usage:
+    spec = VaultSpec(notes=500, mean_kb=8, weights={"code": 3})
+    paths = write_vault(directory, spec)
+"""
+
+# Imports -----------------------------------------
+import math
+import os
+import random
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+# Constants ---------------------------------------------
+WORDS = (
+    "parser vault note link header block stream token index cache model "
+    "graph query frontmatter section callout python markdown value offset "
+    "scanner buffer project status review draft summary detail example"
+).split()
+LANGUAGES = ("python", "bash", "yaml", "json", "")
+CALLOUT_TYPES = ("note", "tip", "warning", "info")
+NODE_TYPES = ("Text_Node", "Header", "Content_Node", "Section_Node")
+ID_CHARS = "23456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+# Relative frequency of each block type; a spec's weights override these
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "header": 2.0,
+    "list": 3.0,
+    "code": 1.0,
+    "callout": 1.0,
+    "db_tag": 1.0,
+    "link": 2.0,
+    "paragraph": 4.0,
+}
+
+
+# Classes -----------------------------------------------
+@dataclass
+class VaultSpec:
+    """
+    Shape of a synthetic vault.
+
+    Attributes:
+        notes: Number of notes
+        mean_kb: Median note size in KB
+        size_sigma: Spread of the lognormal size distribution (0 = all equal)
+        seed: Seed for every random choice
+        weights: Relative frequency of each block type in DEFAULT_WEIGHTS
+    """
+
+    notes: int = 200
+    mean_kb: float = 4.0
+    size_sigma: float = 0.8
+    seed: int = 0
+    weights: Dict[str, float] = field(default_factory=dict)
+
+    def block_weights(self) -> Dict[str, float]:
+        return {**DEFAULT_WEIGHTS, **self.weights}
+
+
+# Functions ---------------------------------------------
+def _words(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+
+def _node_id(rng: random.Random) -> str:
+    return "".join(rng.choice(ID_CHARS) for _ in range(22))
+
+
+def db_tag(rng: random.Random, node_type: str = "") -> str:
+    node_type = node_type or rng.choice(NODE_TYPES)
+    return f"%%{_node_id(rng)}|0.0.{rng.randint(0, 9)}|{node_type}%%"
+
+
+def _header(rng: random.Random, spec: VaultSpec) -> str:
+    return f"{'#' * rng.randint(1, 4)} {_words(rng, 2, 6).title()}"
+
+
+def _list(rng: random.Random, spec: VaultSpec) -> str:
+    lines = []
+    for _ in range(rng.randint(2, 8)):
+        indent = "  " * (rng.random() < 0.3 and bool(lines))
+        lines.append(f"{indent}- {_words(rng, 3, 12)}")
+    return "\n".join(lines)
+
+
+def _code(rng: random.Random, spec: VaultSpec) -> str:
+    body = "\n".join(
+        f"{'    ' * rng.randint(0, 2)}{rng.choice(WORDS)} = {_words(rng, 1, 6)!r}"
+        for _ in range(rng.randint(3, 15))
+    )
+    return f"```{rng.choice(LANGUAGES)}\n{body}\n```"
+
+
+def _callout(rng: random.Random, spec: VaultSpec) -> str:
+    lines = [f"> {_words(rng, 4, 14)}" for _ in range(rng.randint(1, 4))]
+    return f"> [!{rng.choice(CALLOUT_TYPES)}]\n" + "\n".join(lines)
+
+
+def _db_tag(rng: random.Random, spec: VaultSpec) -> str:
+    return f"{db_tag(rng)}{_words(rng, 5, 20)}"
+
+
+def _link(rng: random.Random, spec: VaultSpec) -> str:
+    target = f"Note {rng.randrange(max(spec.notes, 1)):04d}"
+    if rng.random() < 0.3:
+        target += f"|{_words(rng, 1, 3)}"
+    pieces = [
+        _words(rng, 3, 10),
+        f"[[{target}]]",
+        _words(rng, 2, 8),
+        f"[{_words(rng, 1, 3)}](https://example.com/{rng.choice(WORDS)})",
+        f"#{rng.choice(WORDS)}",
+        _words(rng, 2, 8),
+    ]
+    return " ".join(pieces)
+
+
+def _paragraph(rng: random.Random, spec: VaultSpec) -> str:
+    return "\n".join(
+        _words(rng, 6, 18).capitalize() + "." for _ in range(rng.randint(1, 5))
+    )
+
+
+BLOCKS: Dict[str, Callable[[random.Random, VaultSpec], str]] = {
+    "header": _header,
+    "list": _list,
+    "code": _code,
+    "callout": _callout,
+    "db_tag": _db_tag,
+    "link": _link,
+    "paragraph": _paragraph,
+}
+
+
+def _frontmatter(rng: random.Random, index: int) -> str:
+    tags = ", ".join(rng.sample(WORDS, rng.randint(1, 4)))
+    return (
+        "---\n"
+        f"id: {_node_id(rng)}\n"
+        f"title: Note {index:04d}\n"
+        f"tags: [{tags}]\n"
+        f"status: {rng.choice(('new', 'processed', 'draft'))}\n"
+        f"created: 2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}\n"
+        "---\n"
+    )
+
+
+def generate_note(spec: VaultSpec, index: int) -> str:
+    """
+    Text of note `index`. Each note has its own random stream, so a note does
+    not change when the note count does.
+    """
+    rng = random.Random(f"{spec.seed}:{index}")
+    target = spec.mean_kb * 1024 * math.exp(rng.gauss(0, spec.size_sigma))
+    weights = spec.block_weights()
+    kinds = [kind for kind in BLOCKS if weights.get(kind, 0) > 0]
+    kind_weights = [weights[kind] for kind in kinds]
+
+    text = _frontmatter(rng, index)
+    blocks = []
+    size = len(text)
+    while size < target or not blocks:
+        kind = rng.choices(kinds, kind_weights)[0]
+        block = BLOCKS[kind](rng, spec)
+        blocks.append(block)
+        size += len(block) + 2
+    return text + "\n" + "\n\n".join(blocks) + "\n"
+
+
+def note_name(index: int) -> str:
+    return f"Note {index:04d}.md"
+
+
+def generate_vault(spec: VaultSpec) -> Dict[str, str]:
+    """{file name: text} for every note of a spec"""
+    return {
+        note_name(index): generate_note(spec, index) for index in range(spec.notes)
+    }
+
+
+def write_vault(directory: str, spec: VaultSpec) -> List[str]:
+    """Write a spec's notes into `directory` and return their paths"""
+    paths = []
+    for name, text in generate_vault(spec).items():
+        path = os.path.join(directory, name)
+        with open(path, "w") as file:
+            file.write(text)
+        paths.append(path)
+    return paths
+
+
+def generate_db_nodes(count: int, seed: int = 0) -> str:
+    """`count` DB nodes in the `db_nodes` format: `%%id|version|type%%content`"""
+    rng = random.Random(f"{seed}:db_nodes")
+    return "".join(f"{db_tag(rng)}{_words(rng, 5, 40)}\n" for _ in range(count))
+
+
+def generate_section(lines: int, seed: int = 0) -> str:
+    """A DB-tagged section body of `lines` lines, as read by `section`"""
+    rng = random.Random(f"{seed}:section")
+    body = "\n".join(_words(rng, 5, 15) for _ in range(lines))
+    return f"{db_tag(rng, 'Section_Node')}\n{body}\n"
@@ -0,0 +1,160 @@
+# Imports -----------------------------------------
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterator, Iterable, Optional
+
+# Library Imports ----------------------------------
+from python_parser.src.frontmatter import read_frontmatter
+from python_parser.src.vault import VaultParseResult, parse_vault_text
+
+
+# Functions ---------------------------------------------
+def _read_text(file_path: str) -> str:
+    with open(file_path, "r") as file:
+        return file.read()
+
+
+def _read_frontmatter_result(file_path: str) -> VaultParseResult:
+    frontmatter, _ = read_frontmatter(file_path)
+    return VaultParseResult(
+        path=file_path, frontmatter=frontmatter.content if frontmatter else None
+    )
+
+
+def _error_result(file_path: str, error: Exception) -> VaultParseResult:
+    return VaultParseResult(path=file_path, error=f"{type(error).__name__}: {error}")
+
+
+# Classes -----------------------------------------------
+class AsyncObsidianParser:
+    """
+    Asynchronous vault parser that overlaps file reads.
+
+    Reads run on a thread pool, so many slow opens/reads (e.g. on a network
+    mount) are in flight at once. Full parses are CPU bound and go to a pool of
+    worker processes; frontmatter-only reads parse the small YAML header in the
+    reading thread.
+
+    Usage:
+        async with AsyncObsidianParser() as parser:
+            async for result in parser.parse_many(paths, concurrency=32):
+                ...
+    """
+
+    def __init__(
+        self,
+        frontmatter_only: bool = False,
+        use_scanner: bool = False,
+        read_workers: int = 32,
+        parse_workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            frontmatter_only: Read and parse only each file's frontmatter
+            use_scanner: Parse content with `fast_document`
+            read_workers: Threads available for reading files
+            parse_workers: Worker processes for parsing (defaults to the CPU
+                count); 0 parses in the reading threads
+        """
+        self.frontmatter_only = frontmatter_only
+        self.use_scanner = use_scanner
+        self.read_workers = read_workers
+        self.parse_workers = parse_workers
+        self._readers: Optional[Executor] = None
+        self._parsers: Optional[Executor] = None
+
+    async def __aenter__(self) -> "AsyncObsidianParser":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # Waiting for the workers blocks, so not on the event loop
+        await asyncio.to_thread(self.close)
+
+    def close(self) -> None:
+        for executor in (self._parsers, self._readers):
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+        self._readers = self._parsers = None
+
+    def _executors(self) -> tuple:
+        use_processes = not self.frontmatter_only and self.parse_workers != 0
+        if self._parsers is None and use_processes:
+            # Forking a process that runs threads (the readers, the event
+            # loop's executor) can deadlock the child; start workers from a
+            # clean server process instead
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("forkserver")
+            else:
+                context = multiprocessing.get_context("spawn")
+            self._parsers = ProcessPoolExecutor(
+                max_workers=self.parse_workers, mp_context=context
+            )
+        if self._readers is None:
+            self._readers = ThreadPoolExecutor(
+                max_workers=self.read_workers, thread_name_prefix="vault-reader"
+            )
+        return self._readers, self._parsers
+
+    async def parse_one(self, file_path: str) -> VaultParseResult:
+        """Read and parse one file; errors are returned in the result"""
+        loop = asyncio.get_running_loop()
+        readers, parsers = self._executors()
+        try:
+            if self.frontmatter_only:
+                return await loop.run_in_executor(
+                    readers, _read_frontmatter_result, file_path
+                )
+            if parsers is None:
+                return await loop.run_in_executor(
+                    readers, self._read_and_parse, file_path
+                )
+            text = await loop.run_in_executor(readers, _read_text, file_path)
+            return await loop.run_in_executor(
+                parsers, parse_vault_text, file_path, text, self.use_scanner
+            )
+        except Exception as e:
+            return _error_result(file_path, e)
+
+    def _read_and_parse(self, file_path: str) -> VaultParseResult:
+        return parse_vault_text(file_path, _read_text(file_path), self.use_scanner)
+
+    async def parse_many(
+        self, file_paths: Iterable[str], concurrency: int = 16
+    ) -> AsyncIterator[VaultParseResult]:
+        """
+        Parse many files, yielding each result as soon as it is ready.
+
+        Args:
+            file_paths: Paths to parse; consumed lazily
+            concurrency: Maximum number of files being read or parsed at once
+
+        Yields:
+            One VaultParseResult per path, in completion order. A new file is
+            only started when one finishes, so a slow consumer holds at most
+            `concurrency` results in memory (backpressure).
+        """
+        paths = iter(file_paths)
+        pending = set()
+
+        def fill() -> None:
+            while len(pending) < concurrency:
+                file_path = next(paths, None)
+                if file_path is None:
+                    return
+                pending.add(asyncio.ensure_future(self.parse_one(file_path)))
+
+        try:
+            fill()
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    pending.discard(task)
+                    yield task.result()
+                fill()
+        finally:
+            # The consumer stopped early: drop the work still in flight
+            for task in pending:
+                task.cancel()
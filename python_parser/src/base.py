@@ -14,7 +14,10 @@ from python_parser.src.models import (
     MarkdownNode,
     ParsyBase,
     basic_markdown_parser,
+    fast_document,
 )
+from python_parser.src.source import MappedFile
+from python_parser.src.cache import ParseCache
 
 
 """
@@ -43,18 +46,30 @@ class FileParserBase(ParsyBase):
 
     file_type: str
     parser: Parser
+    # Decode straight from a memory map of the file. This still decodes the
+    # whole file; only the MappedFile frontmatter and tag helpers (behind the
+    # daemon's `tags` operation) decode lazily
+    use_mmap: bool = False
+
+    def read_file(self, file_path: str) -> str:
+        if self.use_mmap:
+            with MappedFile(file_path) as source:
+                return source.decode()
+        with open(file_path, "r") as file:
+            return file.read()
+
+    def parse_contents(self, file_contents: str, file_path: str = "") -> DataType:
+        parsed_result = self.parser.parse(file_contents)
+        if isinstance(parsed_result, DataType):
+            return parsed_result
+        else:
+            raise ValueError(
+                f"\nParser did not return a DataType object for file: {file_path}\n\n"
+            )
 
     def parse_file(self, file_path: str) -> DataType | None:
         if file_path.endswith(self.file_type):
-            with open(file_path, "r") as file:
-                file_contents = file.read()
-            parsed_result = self.parser.parse(file_contents)
-            if isinstance(parsed_result, DataType):
-                return parsed_result
-            else:
-                raise ValueError(
-                    f"\nParser did not return a DataType object for file: {file_path}\n\n"
-                )
+            return self.parse_contents(self.read_file(file_path), file_path)
         else:
             raise ValueError(
                 f"\nFile type does not match expected type for file: {file_path}\n\n"
@@ -73,14 +88,29 @@ class ObsidianParserBase(FileParserBase):
     file_type: str = "md"
     parser: Parser = basic_markdown_parser
     content_parser: Parser
+    use_scanner: bool = False  # Parse content with `fast_document` instead
+    cache: Optional[ParseCache] = None  # Reuse parses of unchanged files
 
     def parse(self, file_path: str) -> tuple[FrontMatter, DataType] | None:
         parsed_result = super().parse_file(file_path)
         # print(f"\nParsed Result: {parsed_result}\n")
-        if parsed_result and isinstance(parsed_result, ObsidianFileBase):
+        return self.parse_obsidian_content(parsed_result, file_path)
+
+    def parse_text(self, text: str, file_path: str = "") -> ObsidianFile | None:
+        """Parse file contents that have already been read"""
+        parsed_result = self.parse_contents(text, file_path)
+        return self.parse_obsidian_content(parsed_result, file_path)
+
+    def parse_obsidian_content(
+        self, parsed_result: DataType, file_path: str
+    ) -> ObsidianFile | None:
+        if parsed_result and isinstance(
+            parsed_result, (ObsidianFileBase, ObsidianFile)
+        ):
             frontmatter = parsed_result.frontmatter
             content = parsed_result.content
-            parsed_content = self.content_parser.parse(content)
+            content_parser = fast_document if self.use_scanner else self.content_parser
+            parsed_content = content_parser.parse(content)
             # print(f"\nParsed Content: {parsed_content}\n")
             if isinstance(parsed_content, ObsidianMarkdownContent):
                 return ObsidianFile(frontmatter=frontmatter, content=parsed_content)
@@ -99,6 +129,8 @@ class ObsidianParserBase(FileParserBase):
     #    return str(node)  # Fallback for any other type
 
     def __call__(self, file_path: str) -> tuple[FrontMatter, DataType] | None:
+        if self.cache is not None:
+            return self.cache.fetch(file_path, self.parse)
         return self.parse(file_path)
 
 
@@ -0,0 +1,273 @@
+# Imports -----------------------------------------
+import copy
+import hashlib
+import os
+import tempfile
+import tomllib
+from datetime import date, datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Callable, Optional
+
+import msgpack
+
+# Library Imports ----------------------------------
+from python_parser.src.models import FrontMatter, ObsidianFile, ObsidianMarkdownContent
+from python_parser.src.models.compact import compact_node, expand_node
+
+
+# Constants ---------------------------------------------
+ENTRY_SUFFIX = ".msgpack"
+# Bumped when the entry layout changes; entries of another format are misses
+ENTRY_FORMAT = 3
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# msgpack extension codes for YAML timestamps in frontmatter
+EXT_DATETIME = 1
+EXT_DATE = 2
+
+
+def parser_version() -> str:
+    """Installed package version, or the version in pyproject.toml for a checkout"""
+    try:
+        return metadata.version("python_parser")
+    except metadata.PackageNotFoundError:
+        pyproject = Path(__file__).resolve().parents[2] / "pyproject.toml"
+        with open(pyproject, "rb") as file:
+            return tomllib.load(file)["project"]["version"]
+
+
+# Functions ---------------------------------------------
+def _encode_ext(obj):
+    if isinstance(obj, datetime):
+        return msgpack.ExtType(EXT_DATETIME, obj.isoformat().encode())
+    if isinstance(obj, date):
+        return msgpack.ExtType(EXT_DATE, obj.isoformat().encode())
+    raise TypeError(f"Cannot cache value of type {type(obj).__name__}")
+
+
+def _decode_ext(code: int, data: bytes):
+    if code == EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == EXT_DATE:
+        return date.fromisoformat(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def file_identity(stat: os.stat_result) -> dict:
+    """
+    The stat fields an entry is checked against. Writing a file through a
+    rename always changes its inode and ctime, even if it keeps its mtime.
+    """
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "ctime_ns": stat.st_ctime_ns,
+        "inode": stat.st_ino,
+    }
+
+
+def file_digest(file_path: str) -> bytes:
+    with open(file_path, "rb") as file:
+        return hashlib.file_digest(file, "blake2b").digest()
+
+
+# Classes -----------------------------------------------
+class ParseCache:
+    """
+    On-disk cache of parsed ObsidianFiles, one msgpack file per source file.
+
+    An entry is valid while the source file's size, mtime, ctime and inode are
+    unchanged. With `use_hash`, an entry whose size is unchanged but whose
+    other fields changed is checked against a content hash before the file is
+    re-parsed (e.g. after a checkout or a `touch`). Entries written by another
+    parser version are ignored.
+
+    Entries are evicted least-recently-used first once the directory grows past
+    `max_bytes`. A cache directory should only be shared by parsers with the
+    same configuration.
+
+    Usage:
+        parser = ObsidianParserBase(content_parser=document, cache=ParseCache(dir))
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        use_hash: bool = False,
+        version: Optional[str] = None,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.use_hash = use_hash
+        self.version = version or parser_version()
+        self._size: Optional[int] = None  # Running total, scanned on first write
+        os.makedirs(directory, exist_ok=True)
+
+    def entry_path(self, file_path: str) -> str:
+        key = hashlib.blake2b(os.path.abspath(file_path).encode(), digest_size=16)
+        return os.path.join(self.directory, key.hexdigest() + ENTRY_SUFFIX)
+
+    # --- Lookup ---
+    def _load(self, entry_path: str) -> Optional[dict]:
+        try:
+            with open(entry_path, "rb") as file:
+                entry = msgpack.unpackb(file.read(), ext_hook=_decode_ext)
+        except (OSError, ValueError, msgpack.UnpackException):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != self.version:
+            return None
+        if entry.get("format") != ENTRY_FORMAT:
+            return None
+        return entry
+
+    def get(self, file_path: str) -> Optional[ObsidianFile]:
+        """Cached parse of `file_path`, or None if missing or stale"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        entry_path = self.entry_path(file_path)
+        entry = self._load(entry_path)
+        if entry is None or entry["size"] != stat.st_size:
+            return None
+        identity = file_identity(stat)
+        if any(entry[field] != value for field, value in identity.items()):
+            if not self.use_hash or entry["digest"] != file_digest(file_path):
+                return None
+            # Same content under a new stat: record it to skip the hash next time
+            entry.update(identity)
+            self._write(entry_path, entry)
+        else:
+            # Bump the entry's mtime, which is its LRU timestamp
+            try:
+                os.utime(entry_path)
+            except OSError:
+                pass
+        return self._expand(entry)
+
+    def fetch(
+        self, file_path: str, parse: Callable[[str], Optional[ObsidianFile]]
+    ) -> Optional[ObsidianFile]:
+        """Return the cached parse of `file_path`, calling `parse` and storing on a miss"""
+        cached = self.get(file_path)
+        if cached is not None:
+            return cached
+        # Stat before parsing so an edit made during the parse invalidates the entry
+        stat = os.stat(file_path)
+        result = parse(file_path)
+        if result is not None:
+            self.put(file_path, result, stat)
+        return result
+
+    # --- Storage ---
+    def put(
+        self,
+        file_path: str,
+        result: ObsidianFile,
+        stat: Optional[os.stat_result] = None,
+    ) -> None:
+        stat = stat or os.stat(file_path)
+        frontmatter = result.frontmatter
+        entry = {
+            "version": self.version,
+            "format": ENTRY_FORMAT,
+            **file_identity(stat),
+            "size": stat.st_size,
+            "digest": file_digest(file_path) if self.use_hash else None,
+            "frontmatter": frontmatter.content if frontmatter else None,
+            # For round-trip writes of unchanged keys after a cache hit
+            "frontmatter_source": frontmatter.source() if frontmatter else None,
+            "nodes": [compact_node(node) for node in result.content.nodes],
+        }
+        entry_path = self.entry_path(file_path)
+        try:
+            replaced = os.stat(entry_path).st_size
+        except OSError:
+            replaced = 0
+        size = self._write(entry_path, entry)
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += size - replaced
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def discard(self, file_path: str) -> None:
+        """Drop the entry of `file_path`, e.g. after writing to the file"""
+        entry_path = self.entry_path(file_path)
+        try:
+            size = os.stat(entry_path).st_size
+            os.unlink(entry_path)
+        except OSError:
+            return
+        if self._size is not None:
+            self._size -= size
+
+    def _write(self, entry_path: str, entry: dict) -> int:
+        data = msgpack.packb(entry, default=_encode_ext)
+        # Write then rename, so concurrent readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, entry_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return len(data)
+
+    def _expand(self, entry: dict) -> ObsidianFile:
+        frontmatter = None
+        if entry["frontmatter"] is not None:
+            frontmatter = FrontMatter(content=entry["frontmatter"])
+            source = entry["frontmatter_source"]
+            if source is not None:
+                # The cached content is what the source loaded as
+                frontmatter.set_source(source, copy.deepcopy(entry["frontmatter"]))
+        return ObsidianFile(
+            frontmatter=frontmatter,
+            content=ObsidianMarkdownContent(
+                nodes=[expand_node(record) for record in entry["nodes"]]
+            ),
+        )
+
+    # --- Eviction ---
+    def _entries(self) -> list:
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for item in scan:
+                if item.name.endswith(ENTRY_SUFFIX):
+                    try:
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, item.path))
+        return entries
+
+    def size(self) -> int:
+        """Total bytes held by cache entries"""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache is under budget"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        # Evict down to 90% of the budget so a full cache is not rescanned every write
+        target = self.max_bytes * 9 // 10
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+        self._size = total
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        self._size = 0
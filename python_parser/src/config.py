@@ -1,10 +1,25 @@
 import os
 
-from dotenv import load_dotenv
+# Settings come from the environment, with a `.env` file loaded on first
+# access (python-dotenv is only imported then). CACHE_DIR is the parse cache
+# location; unset disables it.
+SETTINGS = ("MD_MODEL_DIR", "TEST_DIR", "CACHE_DIR")
+logdir = "python_parser/logs/Log"
 
-load_dotenv()
+_loaded = False
 
 
-MD_MODEL_DIR = os.getenv("MD_MODEL_DIR")
-TEST_DIR = os.getenv("TEST_DIR")
-logdir = "python_parser/logs/Log"
+def load_settings() -> None:
+    global _loaded
+    if not _loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _loaded = True
+
+
+def __getattr__(name: str):
+    if name not in SETTINGS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    load_settings()
+    return os.getenv(name)
@@ -0,0 +1,404 @@
+# Imports -----------------------------------------
+import argparse
+import os
+import signal
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import tempfile
+import threading
+from dataclasses import asdict
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
+
+import msgpack
+
+# Library Imports ----------------------------------
+from python_parser.src import config
+from python_parser.src.cache import (
+    ParseCache,
+    _decode_ext,
+    _encode_ext,
+    parser_version,
+)
+from python_parser.src.frontmatter import patch_frontmatter, read_frontmatter
+from python_parser.src.models import extract_references
+from python_parser.src.models.compact import compact_node
+from python_parser.src.source import MappedFile
+from python_parser.src.vault import parse_vault_file, parse_vault_text
+
+# --- Parser Daemon ---
+#
+# A resident parser for editor integrations: the interpreter, imports, models
+# and parse cache stay warm between requests, so a request costs a parse (or a
+# cache hit) instead of a process start.
+#
+# Protocol: over a Unix domain socket, each message is a 4-byte big-endian
+# length followed by that many bytes of msgpack. A request is a map
+#
+#     {"id": any, "op": str, "args": {name: value}}
+#
+# and its response is {"id": id, "ok": true, "result": ...} or
+# {"id": id, "ok": false, "error": "Type: message"}. A message holding a list
+# of requests is a batch, answered by one message with the list of responses
+# in the same order. Frontmatter dates and datetimes use the extension types
+# of the parse cache. Operations:
+#
+#     parse_file         path, use_scanner        VaultParseResult as a map
+#     parse_text         text, path, use_scanner  VaultParseResult as a map
+#     frontmatter        path                     {frontmatter, offset}
+#     references         text                     [compact reference record]
+#     tags               path                     [tag name]
+#     update_frontmatter path, key, value,        True if the file changed
+#                        add_missing, preserve_mtime
+#     ping                                        parser version
+#     shutdown                                    stops the daemon after replying
+
+# Constants ---------------------------------------------
+HEADER = struct.Struct(">I")
+MAX_FRAME = 64 * 1024 * 1024
+SOCKET_NAME = "python_parser.sock"
+WARM_UP_NOTE = """---
+title: Warm up
+created: 2024-01-02
+tags: [a, b]
+---
+# Header
+Some text with a [[link]] and #tag
+- item
+```python
+print("hi")
+```
+> [!note] Callout
+> body
+"""
+
+
+# Functions ---------------------------------------------
+def default_socket_path() -> str:
+    """$PARSER_SOCKET, else a per-user socket in the runtime or temp directory"""
+    path = os.getenv("PARSER_SOCKET")
+    if path:
+        return path
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, SOCKET_NAME)
+    return os.path.join(tempfile.gettempdir(), f"python_parser-{os.getuid()}.sock")
+
+
+def write_frame(stream: BinaryIO, message: Any) -> None:
+    data = msgpack.packb(message, default=_encode_ext)
+    stream.write(HEADER.pack(len(data)) + data)
+    stream.flush()
+
+
+def _read_exactly(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("\nConnection closed inside a message\n\n")
+    return data
+
+
+def read_frame(stream: BinaryIO) -> Any:
+    """
+    Read one message.
+
+    Returns:
+        The unpacked message, or None if the connection closed between
+        messages.
+    """
+    header = stream.read(HEADER.size)
+    if not header:
+        return None
+    if len(header) != HEADER.size:
+        raise ValueError("\nConnection closed inside a message header\n\n")
+    (size,) = HEADER.unpack(header)
+    if size > MAX_FRAME:
+        raise ValueError(f"\nMessage of {size} bytes is over {MAX_FRAME}\n\n")
+    return msgpack.unpackb(
+        _read_exactly(stream, size), ext_hook=_decode_ext, strict_map_key=False
+    )
+
+
+def _connectable(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+# Classes -----------------------------------------------
+class _DaemonHandler(socketserver.StreamRequestHandler):
+    """Answers the messages of one connection until the client closes it"""
+
+    def handle(self) -> None:
+        while True:
+            try:
+                message = read_frame(self.rfile)
+            except (ValueError, msgpack.UnpackException) as e:
+                # The stream can't be resynchronised after a bad frame
+                write_frame(self.wfile, self.server.error_response(None, e))
+                return
+            if message is None:
+                return
+            write_frame(self.wfile, self.server.respond(message))
+
+
+class ParserDaemon(socketserver.ThreadingUnixStreamServer):
+    """
+    Parser server on a Unix domain socket, one thread per connection.
+
+    Usage:
+        with ParserDaemon(socket_path, cache_dir=CACHE_DIR) as daemon:
+            daemon.serve_forever()
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        use_scanner: bool = False,
+        warm_up: bool = True,
+    ):
+        """
+        Args:
+            socket_path: Socket to listen on (defaults to `default_socket_path`)
+            cache_dir: Directory of the ParseCache used for `parse_file`
+            use_scanner: Default for requests that don't set `use_scanner`
+            warm_up: Parse a sample note before serving, so the first request
+                doesn't pay for building validators and loading PyYAML
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.cache_dir = cache_dir
+        self.cache = ParseCache(cache_dir) if cache_dir else None
+        self.use_scanner = use_scanner
+        if os.path.lexists(self.socket_path):
+            if not stat.S_ISSOCK(os.lstat(self.socket_path).st_mode):
+                raise ValueError(
+                    f"\nSocket path exists and is not a socket: {self.socket_path}\n\n"
+                )
+            if _connectable(self.socket_path):
+                raise ValueError(
+                    f"\nA daemon is already listening on: {self.socket_path}\n\n"
+                )
+            # Left behind by a daemon that did not shut down cleanly
+            os.unlink(self.socket_path)
+        self.operations: Dict[str, Callable[..., Any]] = {
+            "parse_file": self.parse_file,
+            "parse_text": self.parse_text,
+            "frontmatter": self.frontmatter,
+            "references": self.references,
+            "tags": self.tags,
+            "update_frontmatter": self.update_frontmatter,
+            "ping": self.ping,
+            "shutdown": self.stop,
+        }
+        super().__init__(self.socket_path, _DaemonHandler)
+        os.chmod(self.socket_path, 0o600)
+        if warm_up:
+            parse_vault_text("", WARM_UP_NOTE, use_scanner=self.use_scanner)
+            extract_references(WARM_UP_NOTE)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    # --- Dispatch ---
+    def respond(self, message: Any) -> Any:
+        if isinstance(message, list):
+            return [self.respond_one(request) for request in message]
+        return self.respond_one(message)
+
+    def respond_one(self, request: Any) -> Dict[str, Any]:
+        request_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict):
+                raise ValueError("Request is not a map")
+            operation = self.operations.get(request.get("op"))
+            if operation is None:
+                raise ValueError(f"Unknown operation: {request.get('op')!r}")
+            result = operation(**request.get("args", {}))
+        except Exception as e:
+            return self.error_response(request_id, e)
+        return {"id": request_id, "ok": True, "result": result}
+
+    @staticmethod
+    def error_response(request_id: Any, error: Exception) -> Dict[str, Any]:
+        message = f"{type(error).__name__}: {str(error).strip()}"
+        return {"id": request_id, "ok": False, "error": message}
+
+    # --- Operations ---
+    def parse_file(self, path: str, use_scanner: Optional[bool] = None) -> dict:
+        if use_scanner is None:
+            use_scanner = self.use_scanner
+        return asdict(parse_vault_file(path, use_scanner, self.cache_dir))
+
+    def parse_text(
+        self, text: str, path: str = "", use_scanner: Optional[bool] = None
+    ) -> dict:
+        if use_scanner is None:
+            use_scanner = self.use_scanner
+        return asdict(parse_vault_text(path, text, use_scanner))
+
+    def frontmatter(self, path: str) -> dict:
+        frontmatter, offset = read_frontmatter(path)
+        return {
+            "frontmatter": frontmatter.content if frontmatter else None,
+            "offset": offset,
+        }
+
+    def references(self, text: str) -> list:
+        return [compact_node(reference) for reference in extract_references(text)]
+
+    def tags(self, path: str) -> list:
+        # Only the tag names are decoded from the mapped file
+        with MappedFile(path) as source:
+            return source.tags()
+
+    def update_frontmatter(
+        self,
+        path: str,
+        key: str,
+        value: Any,
+        add_missing: bool = False,
+        preserve_mtime: bool = False,
+    ) -> bool:
+        changed = patch_frontmatter(path, key, value, add_missing, preserve_mtime)
+        if changed and self.cache is not None:
+            # With `preserve_mtime` the cache can't tell the file changed
+            self.cache.discard(path)
+        return changed
+
+    def ping(self) -> str:
+        return parser_version()
+
+    def stop(self) -> bool:
+        # shutdown() waits for serve_forever, which is waiting on this request
+        threading.Thread(target=self.shutdown, daemon=True).start()
+        return True
+
+
+class DaemonClient:
+    """
+    Client for a ParserDaemon; keeps one connection open between requests.
+
+    Usage:
+        with DaemonClient() as client:
+            result = client.request("parse_file", path=path)
+            responses = client.batch([("frontmatter", {"path": p}) for p in paths])
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: float = 30.0):
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+        self._socket: Optional[socket.socket] = None
+        self._stream: Optional[BinaryIO] = None
+        self._next_id = 0
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._socket.close()
+        self._socket = self._stream = None
+
+    def _connection(self) -> BinaryIO:
+        if self._stream is None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(self.timeout)
+            self._socket.connect(self.socket_path)
+            self._stream = self._socket.makefile("rwb")
+        return self._stream
+
+    def _exchange(self, message: Any) -> Any:
+        stream = self._connection()
+        try:
+            write_frame(stream, message)
+            response = read_frame(stream)
+        except BaseException:
+            # The connection is out of step with the daemon now
+            self.close()
+            raise
+        if response is None:
+            self.close()
+            raise ValueError("\nThe daemon closed the connection\n\n")
+        return response
+
+    def _request(self, op: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        self._next_id += 1
+        return {"id": self._next_id, "op": op, "args": args}
+
+    def request(self, op: str, **args: Any) -> Any:
+        """
+        Send one request.
+
+        Returns:
+            The result of the operation.
+
+        Raises:
+            ValueError: If the daemon reports an error.
+        """
+        response = self._exchange(self._request(op, args))
+        if not response["ok"]:
+            raise ValueError(f"\n{op} failed: {response['error']}\n\n")
+        return response["result"]
+
+    def batch(
+        self, requests: Iterable[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Send many (op, args) requests in one round trip.
+
+        Returns:
+            The responses in request order, each with `ok` and either `result`
+            or `error`; a failing request does not affect the others.
+        """
+        message = [self._request(op, args) for op, args in requests]
+        if not message:
+            return []
+        return self._exchange(message)
+
+
+# Main -------------------------------------------------
+def cli(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Serve parse requests on a Unix socket"
+    )
+    parser.add_argument(
+        "--socket", help="Defaults to $PARSER_SOCKET or a per-user path"
+    )
+    parser.add_argument(
+        "--cache-dir", help="Parse cache directory (defaults to CACHE_DIR)"
+    )
+    parser.add_argument("--use-scanner", action="store_true")
+    args = parser.parse_args(argv)
+
+    daemon = ParserDaemon(
+        args.socket,
+        cache_dir=args.cache_dir or config.CACHE_DIR,
+        use_scanner=args.use_scanner,
+    )
+    # SIGTERM exits through the `finally`, which removes the socket
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        print(f"Listening on {daemon.socket_path}", flush=True)
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.server_close()
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,208 @@
+# Imports -----------------------------------------
+import os
+import re
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+# Library Imports ----------------------------------
+from python_parser.src.models import FrontMatter
+from python_parser.src.models.parsers import parse_frontmatter
+from python_parser.src.source import decode_text
+
+# Constants ---------------------------------------------
+DELIMITER_LINES = (b"---\n", b"---\r\n")
+
+
+# Functions ---------------------------------------------
+def _read_header(file: BinaryIO) -> Optional[Tuple[bytes, List[bytes], bytes, int]]:
+    """
+    Read the frontmatter lines of a binary file, leaving it positioned at the
+    start of the content.
+
+    Returns:
+        (opening, lines, closing, offset): the delimiter lines, the YAML lines
+        between them (all with their line endings) and the byte offset of the
+        content, or None.
+    """
+    opening = file.readline()
+    if opening not in DELIMITER_LINES:
+        return None
+
+    offset = len(opening)
+    lines = []
+    for line in file:
+        offset += len(line)
+        # The first line after the opening delimiter is always content
+        if lines and line.startswith(b"---"):
+            if line not in DELIMITER_LINES:
+                return None
+            return opening, lines, line, offset
+        lines.append(line)
+    return None
+
+
+def read_frontmatter(file_path: str) -> Tuple[Optional[FrontMatter], int]:
+    """
+    Read and parse only the frontmatter of a markdown file.
+
+    Lines are read one at a time and reading stops at the closing delimiter,
+    so the markdown content is never read. The delimiter rules are those of the
+    `front_matter` parser.
+
+    Args:
+        file_path: Path to the markdown file
+
+    Returns:
+        (frontmatter, offset): the parsed FrontMatter and the byte offset at
+        which the content begins, or (None, 0) if the file has no frontmatter.
+    """
+    with open(file_path, "rb") as file:
+        header = _read_header(file)
+    if header is None:
+        return None, 0
+    _, lines, _, offset = header
+    # Drop the newline that precedes the closing delimiter
+    yaml_text = decode_text(b"".join(lines))[:-1]
+    return parse_frontmatter(frontmatter_content=yaml_text), offset
+
+
+def render_entry(key: str, value: Any, newline: bytes = b"\n") -> bytes:
+    """YAML text for a single top-level `key: value` entry"""
+    from python_parser.src.models import yaml_writer
+
+    return yaml_writer.render_entry(key, value).encode("utf-8").replace(b"\n", newline)
+
+
+def patch_lines(
+    lines: List[bytes], key: str, value: Any, add_missing: bool = False
+) -> Optional[List[bytes]]:
+    """
+    Set a top-level key in frontmatter lines, leaving every other line as is.
+
+    The key's entry spans its own line plus any indented or `- ` continuation
+    lines (block mappings, sequences and folded strings).
+
+    Returns:
+        The patched lines, or None if nothing changes.
+    """
+    newline = b"\r\n" if lines and lines[0].endswith(b"\r\n") else b"\n"
+    entry = render_entry(key, value, newline)
+    key_line = re.compile(
+        re.escape(key.encode("utf-8")) + rb"[ \t]*:(?:[ \t]|\r?\n|$)"
+    )
+
+    for start, line in enumerate(lines):
+        if key_line.match(line):
+            end = start + 1
+            while end < len(lines) and (
+                lines[end].startswith((b" ", b"\t", b"- ")) or not lines[end].strip()
+            ):
+                end += 1
+            # Blank lines belong to the entry only inside a multi-line value
+            while end > start + 1 and not lines[end - 1].strip():
+                end -= 1
+            if b"".join(lines[start:end]) == entry:
+                return None
+            return lines[:start] + [entry] + lines[end:]
+
+    if not add_missing:
+        return None
+    if lines and not lines[-1].endswith(b"\n"):
+        return lines[:-1] + [lines[-1] + newline, entry]
+    return lines + [entry]
+
+
+def patch_frontmatter(
+    file_path: str,
+    key: str,
+    value: Any,
+    add_missing: bool = False,
+    preserve_mtime: bool = False,
+) -> bool:
+    """
+    Update one frontmatter key of a markdown file in place.
+
+    Only the key's lines in the header are rewritten: the rest of the YAML keeps
+    its formatting and the content is copied across byte for byte. The new file
+    is written to a temporary file and renamed over the original, so readers
+    never see a partial write. A symlink is followed and its target replaced,
+    so the link itself is kept.
+
+    Args:
+        file_path: Path to the markdown file
+        key: Top-level frontmatter key
+        value: New value, rendered as YAML
+        add_missing: Add the key (and a frontmatter block if needed) when absent
+        preserve_mtime: Keep the file's modification time
+
+    Returns:
+        True if the file was changed.
+    """
+    file_path = os.path.realpath(file_path)
+    with open(file_path, "rb") as file:
+        header = _read_header(file)
+        if header is None:
+            if not add_missing:
+                return False
+            file.seek(0)
+            new_header = b"---\n" + render_entry(key, value) + b"---\n"
+        else:
+            opening, lines, closing, _ = header
+            patched = patch_lines(lines, key, value, add_missing)
+            if patched is None:
+                return False
+            new_header = opening + b"".join(patched) + closing
+
+        stat = os.fstat(file.fileno())
+        directory = os.path.dirname(file_path)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as temp:
+                temp.write(new_header)
+                shutil.copyfileobj(file, temp)
+            shutil.copymode(file_path, temp_path)
+            if preserve_mtime:
+                os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            os.replace(temp_path, file_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    return True
+
+
+def patch_frontmatter_batch(
+    file_paths: Iterable[str],
+    key: str,
+    value: Any,
+    workers: int = 8,
+    add_missing: bool = False,
+    preserve_mtime: bool = False,
+) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Apply one frontmatter change to many files concurrently.
+
+    Returns:
+        (changed, errors): the paths that were modified, and an error message
+        for each file that could not be patched. One failing file does not stop
+        the batch.
+    """
+
+    def patch(file_path: str) -> Tuple[str, bool, Optional[str]]:
+        try:
+            changed = patch_frontmatter(
+                file_path, key, value, add_missing, preserve_mtime
+            )
+            return file_path, changed, None
+        except Exception as e:
+            return file_path, False, f"{type(e).__name__}: {e}"
+
+    changed, errors = [], {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for file_path, was_changed, error in executor.map(patch, file_paths):
+            if error is not None:
+                errors[file_path] = error
+            elif was_changed:
+                changed.append(file_path)
+    return changed, errors
@@ -0,0 +1,275 @@
+# Imports -----------------------------------------
+import os
+import re
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import msgpack
+
+# Library Imports ----------------------------------
+from python_parser.src.models import (
+    ImageLink,
+    Tag,
+    WikiLink,
+    extract_references,
+    front_matter,
+)
+from python_parser.src.models.parsers import scan_code_block
+from python_parser.src.vault import list_vault_files
+
+
+# Constants ---------------------------------------------
+INDEX_FORMAT = 1
+KINDS = ("links", "tags", "images")
+# File ids are stored in sorted unsigned int arrays
+ID_TYPECODE = "I"
+
+_FENCE_START = re.compile(r"^```", re.MULTILINE)
+_FRONTMATTER_TAG_SEPARATOR = re.compile(r"[,\s]+")
+
+
+# Functions ---------------------------------------------
+def link_key(target: str) -> str:
+    """
+    Note name a wiki link target or note path resolves to: `Folder/Note#Heading`,
+    `Note.md` and `Note` all give `Note`.
+    """
+    name = target.split("#", 1)[0].strip()
+    if name.endswith(".md"):
+        name = name[:-3]
+    return sys.intern(name.rsplit("/", 1)[-1])
+
+
+def tag_key(name: str) -> str:
+    """Tags are matched case-insensitively and without the leading `#`"""
+    return sys.intern(name.lstrip("#").lower())
+
+
+def _prose_spans(text: str, start: int) -> Iterator[Tuple[int, int]]:
+    """Spans of `text` outside fenced code blocks, which hold no references"""
+    index = search_from = start
+    while (fence := _FENCE_START.search(text, search_from)) is not None:
+        block = scan_code_block(text, fence.start())
+        if block is None:
+            # An unclosed fence is parsed as a paragraph
+            search_from = fence.end()
+            continue
+        yield index, fence.start()
+        index = search_from = block[2]
+    yield index, len(text)
+
+
+def _frontmatter_tags(value: Any) -> List[str]:
+    if isinstance(value, str):
+        value = _FRONTMATTER_TAG_SEPARATOR.split(value)
+    if not isinstance(value, list):
+        return []
+    return [str(tag) for tag in value if tag]
+
+
+def scan_references(text: str) -> Dict[str, Tuple[str, ...]]:
+    """
+    Collect the link, tag and image keys of one note.
+
+    Returns:
+        A mapping of each kind in KINDS to its distinct keys, in order of first
+        appearance. Frontmatter `tags` count as tags; fenced code is skipped.
+    """
+    found = {kind: {} for kind in KINDS}
+    start = 0
+    front = front_matter(text, 0)
+    if front.status:
+        start = front.index
+        for name in _frontmatter_tags(front.value.content.get("tags")):
+            found["tags"][tag_key(name)] = None
+
+    for begin, end in _prose_spans(text, start):
+        for reference in extract_references(text[begin:end]):
+            if isinstance(reference, WikiLink):
+                found["links"][link_key(reference.target)] = None
+            elif isinstance(reference, Tag):
+                found["tags"][tag_key(reference.name)] = None
+            elif isinstance(reference, ImageLink):
+                found["images"][sys.intern(reference.path)] = None
+    return {kind: tuple(keys) for kind, keys in found.items()}
+
+
+# Classes -----------------------------------------------
+class VaultIndex:
+    """
+    Forward and reverse reference maps for a vault.
+
+    Files are numbered with integer ids; every link target, tag and image path
+    is an interned string, and each one maps to a sorted array of the ids of
+    the files that reference it. Lookups are a single dict access.
+
+    Usage:
+        index = VaultIndex.build(vault_dir)
+        index.backlinks("Note")
+        index.files_with_tag("#project")
+        index.update_file(path)
+    """
+
+    def __init__(self):
+        self.paths: List[Optional[str]] = []  # Indexed by file id; None once removed
+        self.errors: Dict[str, str] = {}
+        self._ids: Dict[str, int] = {}
+        self._forward: Dict[str, Dict[int, Tuple[str, ...]]] = {
+            kind: {} for kind in KINDS
+        }
+        self._reverse: Dict[str, Dict[str, array]] = {kind: {} for kind in KINDS}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._ids
+
+    @classmethod
+    def build(cls, directory: str, recursive: bool = True) -> "VaultIndex":
+        """Index every markdown file in a vault; unreadable files go to `errors`"""
+        index = cls()
+        for path in list_vault_files(directory, recursive=recursive):
+            try:
+                index.add_file(path)
+            except Exception as e:
+                index.errors[path] = f"{type(e).__name__}: {e}"
+        return index
+
+    # --- Updates ---
+    def add_file(self, path: str, text: Optional[str] = None) -> None:
+        """Index a file, reading it from disk unless its text is given"""
+        if text is None:
+            with open(path, "r") as file:
+                text = file.read()
+        references = scan_references(text)
+
+        file_id = self._ids.get(path)
+        if file_id is None:
+            file_id = len(self.paths)
+            self.paths.append(sys.intern(path))
+            self._ids[path] = file_id
+        else:
+            # Re-indexing keeps the file's id
+            self._clear(file_id)
+        for kind, keys in references.items():
+            if not keys:
+                continue
+            self._forward[kind][file_id] = keys
+            reverse = self._reverse[kind]
+            for key in keys:
+                ids = reverse.get(key)
+                if ids is None:
+                    reverse[key] = array(ID_TYPECODE, [file_id])
+                else:
+                    insort(ids, file_id)
+
+    def _clear(self, file_id: int) -> None:
+        for kind in KINDS:
+            reverse = self._reverse[kind]
+            for key in self._forward[kind].pop(file_id, ()):
+                ids = reverse[key]
+                del ids[bisect_left(ids, file_id)]
+                if not ids:
+                    del reverse[key]
+
+    def remove_file(self, path: str) -> None:
+        file_id = self._ids.pop(path, None)
+        if file_id is not None:
+            self._clear(file_id)
+            self.paths[file_id] = None
+
+    def update_file(self, path: str, text: Optional[str] = None) -> None:
+        """Re-index a changed file, or drop it if it no longer exists"""
+        if text is None and not os.path.exists(path):
+            self.remove_file(path)
+        else:
+            self.add_file(path, text)
+
+    # --- Queries ---
+    def _files(self, kind: str, key: str) -> List[str]:
+        ids = self._reverse[kind].get(key, ())
+        return [self.paths[file_id] for file_id in ids]
+
+    def _keys(self, kind: str, path: str) -> Tuple[str, ...]:
+        file_id = self._ids.get(path)
+        if file_id is None:
+            return ()
+        return self._forward[kind].get(file_id, ())
+
+    def backlinks(self, note: str) -> List[str]:
+        """Files linking to a note, given by name, link target or path"""
+        return self._files("links", link_key(note))
+
+    def files_with_tag(self, tag: str) -> List[str]:
+        return self._files("tags", tag_key(tag))
+
+    def files_with_image(self, image_path: str) -> List[str]:
+        return self._files("images", image_path)
+
+    def links_from(self, path: str) -> Tuple[str, ...]:
+        return self._keys("links", path)
+
+    def tags_of(self, path: str) -> Tuple[str, ...]:
+        return self._keys("tags", path)
+
+    def images_of(self, path: str) -> Tuple[str, ...]:
+        return self._keys("images", path)
+
+    def tags(self) -> List[str]:
+        return sorted(self._reverse["tags"])
+
+    # --- Serialization ---
+    def save(self, file_path: str) -> None:
+        data = {
+            "format": INDEX_FORMAT,
+            "byteorder": sys.byteorder,
+            "paths": self.paths,
+            "forward": self._forward,
+            "reverse": {
+                kind: {key: ids.tobytes() for key, ids in reverse.items()}
+                for kind, reverse in self._reverse.items()
+            },
+        }
+        # Write then rename; each save has its own temporary file, so
+        # concurrent saves never write into each other
+        directory = os.path.dirname(os.path.abspath(file_path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(msgpack.packb(data))
+            os.replace(temp_path, file_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @classmethod
+    def load(cls, file_path: str) -> "VaultIndex":
+        with open(file_path, "rb") as file:
+            data = msgpack.unpackb(file.read(), strict_map_key=False)
+        if data.get("format") != INDEX_FORMAT:
+            raise ValueError(f"\nUnsupported vault index format in: {file_path}\n\n")
+
+        index = cls()
+        index.paths = [
+            None if path is None else sys.intern(path) for path in data["paths"]
+        ]
+        index._ids = {
+            path: file_id for file_id, path in enumerate(index.paths) if path
+        }
+        for kind in KINDS:
+            index._forward[kind] = {
+                file_id: tuple(sys.intern(key) for key in keys)
+                for file_id, keys in data["forward"][kind].items()
+            }
+            reverse = index._reverse[kind]
+            for key, raw_ids in data["reverse"][kind].items():
+                ids = array(ID_TYPECODE)
+                ids.frombytes(raw_ids)
+                if data["byteorder"] != sys.byteorder:
+                    ids.byteswap()
+                reverse[sys.intern(key)] = ids
+        return index
@@ -1,5 +1,7 @@
 # Imports ------------------------------
+import argparse
 import os
+from typing import List, Optional
 
 # Library Imports -----------------------
 
@@ -11,11 +13,13 @@ from python_parser.src.base import (
     FileParserBase,
     ObsidianParserBase,
 )
-from python_parser.src.config import TEST_DIR, MD_MODEL_DIR
+from python_parser.src import config
 from python_parser.src.models import (
     document,
     basic_markdown_parser,
 )
+from python_parser.src.vault import list_vault_files, parse_vault
+from python_parser.src.frontmatter import patch_frontmatter
 
 # Constants ---------------------------------------------
 
@@ -39,21 +43,14 @@ def create_pydantic_model(processed_results):
 ## Post Processors --------------------------------------
 def update_frontmatter_value(file_path: str, key: str, value: str):
     """
-    Updates the status of the file to 'processed'
-    """
-    print(f"\nUpdating status of {file_path} to 'processed'\n")
-
-    with open(file_path, "r") as file:
-        file_contents = file.read()
-    markdown_base = basic_markdown_parser.parse(file_contents)
-    # print(f"\nInitial Frontmatter: \n {markdown_base.frontmatter}")
-    markdown_base.frontmatter.update(key=key, value=value)
+    Sets the frontmatter `key` of the file to `value`.
 
-    # print(f"\nUpdated Frontmatter: \n {markdown_base.frontmatter}")
-    markdown_base.write(file_path)
-    # print(f"\nWrote file to disk\n")
+    Returns True if the file was written, False if it has no such key.
+    """
+    print(f"\nUpdating {key} of {file_path} to {value!r}\n")
 
-    return True
+    # Rewrites only the key's lines in the header; the rest of the file is kept
+    return patch_frontmatter(file_path, key, value)
 
 
 def update_status(file_path: str, file_contents: str):
@@ -73,22 +70,50 @@ full_doc_parser = ObsidianParserBase(content_parser=document)
 
 
 # Main -------------------------------------------------
-def main():
-    test_dir = TEST_DIR  # MD_MODEL_DIR
+def main(test_dir: Optional[str] = None, profile: bool = False):
+    test_dir = test_dir or config.TEST_DIR  # MD_MODEL_DIR
     files = os.listdir(test_dir)
     print(f"Found {len(files)} files in {test_dir}:\n\nParsing results:\n")
 
-    for file in files:
-        filepath = os.path.join(test_dir, file)
-        if filepath.endswith("md"):
-            print(
-                f"\n\n\n-------------------------------- Processing {file} --------------------------------"
-            )
-            prelim_parsed_file = full_doc_parser(filepath)
-            print(f"\nFrontmatter:")
-            for key, value in prelim_parsed_file.frontmatter.content.items():
-                print(f"  {key}: {value}")
-            print(f"\nContent:")
-            for item in prelim_parsed_file.content.nodes:
-                print(f"  {item}")
+    parser_profile = None
+    if profile:
+        # Profiled parses run in this process and skip the cache
+        from python_parser.src.profiling import profile_files
+
+        results, parser_profile = profile_files(
+            list_vault_files(test_dir, recursive=False)
+        )
+    else:
+        results = parse_vault(test_dir, recursive=False, cache_dir=config.CACHE_DIR)
+
+    for result in results:
+        file = os.path.basename(result.path)
+        print(
+            f"\n\n\n-------------------------------- Processing {file} --------------------------------"
+        )
+        if result.error is not None:
+            print(f"\nError: {result.error}")
+            continue
+        prelim_parsed_file = result.to_obsidian_file()
+        print(f"\nFrontmatter:")
+        for key, value in (result.frontmatter or {}).items():
+            print(f"  {key}: {value}")
+        print(f"\nContent:")
+        for item in prelim_parsed_file.content.nodes:
+            print(f"  {item}")
+    if parser_profile is not None:
+        print(f"\n\nParser profile:\n")
+        print(parser_profile.format())
     print("\n\nDone.")
+
+
+def cli(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Parse the notes of a directory")
+    parser.add_argument("directory", nargs="?", help="Defaults to TEST_DIR")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Count and time every call of the exported parsers",
+    )
+    args = parser.parse_args(argv)
+    main(args.directory, profile=args.profile)
@@ -1,63 +1,93 @@
-from python_parser.src.models.datatypes import (
-    Text,
-    # Bold,
-    # Italic,
-    ListItem,
-    InlineCode,
-    WikiLink,
-    ExternalLink,
-    Tag,
-    FrontMatter,
-    Header,
-    ObsidianFileBase,
-    ImageLink,
-    CodeBlock,
-    Callout,
-    Paragraph,
-    ObsidianMarkdownContent,
-    ParsyBase,
-    ObsidianFile,
-    MarkdownNode,
-    DataType,
-    DB_Node,
-    # DB_Nodes,
-    DB_Node_Tag,
-    PythonFileBase,
-    PythonFile,
-    PythonFrontMatter,
-    Section,
-    Section_Node,
-)
-from python_parser.src.models.parsers import (
-    list_item,
-    markdown_parser,
-    basic_markdown_parser,
-    paragraph,
-    # bold,
-    # italic,
-    inline_code,
-    wiki_link,
-    external_link,
-    image_link,
-    image_wiki_link,
-    image_external_link,
-    tag,
-    header,
-    front_matter,
-    callout,
-    code_block,
-    document,
-    reference,
-    reference_parser,
-    parse_references,
-    db_node,
-    db_nodes,
-    db_node_tag,
-    # inline_content,
-    python_frontmatter,
-    basic_python_parser,
-    section,
-)
+# Names are imported from their module on first access (PEP 562), so importing
+# the package is cheap and `from python_parser.src.models import header` loads
+# only what that name needs.
+
+# Imports -----------------------------------------
+from importlib import import_module
+
+# Exported names by the module that defines them
+_lazy_exports = {
+    "datatypes": (
+        "Text",
+        # "Bold",
+        # "Italic",
+        "ListItem",
+        "InlineCode",
+        "WikiLink",
+        "ExternalLink",
+        "Tag",
+        "FrontMatter",
+        "Header",
+        "ObsidianFileBase",
+        "ImageLink",
+        "CodeBlock",
+        "Callout",
+        "Paragraph",
+        "ObsidianMarkdownContent",
+        "ParsyBase",
+        "ObsidianFile",
+        "MarkdownNode",
+        "DataType",
+        "DB_Node",
+        # "DB_Nodes",
+        "DB_Node_Tag",
+        "PythonFileBase",
+        "PythonFile",
+        "PythonFrontMatter",
+        "Section",
+        "Section_Node",
+    ),
+    "parsers": (
+        "list_item",
+        "markdown_parser",
+        "basic_markdown_parser",
+        "paragraph",
+        # "bold",
+        # "italic",
+        "inline_code",
+        "wiki_link",
+        "external_link",
+        "image_link",
+        "image_wiki_link",
+        "image_external_link",
+        "tag",
+        "header",
+        "front_matter",
+        "callout",
+        "code_block",
+        "fast_code_block",
+        "document",
+        "spanned_document",
+        "with_span",
+        "patch_text",
+        "reference",
+        "reference_parser",
+        "parse_references",
+        "extract_references",
+        "db_node",
+        "db_nodes",
+        "db_node_tag",
+        # "inline_content",
+        "python_frontmatter",
+        "basic_python_parser",
+        "section",
+    ),
+    "scanner": (
+        "fast_document",
+        "compact_document",
+        "iter_blocks",
+    ),
+    "nodes": ("NodeContent",),
+    "columnar": (
+        "ColumnarContent",
+        "ColumnarVault",
+    ),
+    "incremental": ("reparse",),
+    "sections": ("section_index", "SectionTree"),
+}
+_modules = {
+    name: module for module, names in _lazy_exports.items() for name in names
+}
 
 __all__ = [
     "ListItem",
@@ -105,15 +135,43 @@ __all__ = [
     "front_matter",
     "callout",
     "code_block",
+    "fast_code_block",
     "reference",
     "reference_parser",
     "parse_references",
+    "extract_references",
     "document",
+    "spanned_document",
+    "with_span",
+    "patch_text",
     "db_node",
     "db_nodes",
     "db_node_tag",
     "python_frontmatter",
     "basic_python_parser",
     "section",
+    "fast_document",
+    "compact_document",
+    "NodeContent",
+    "ColumnarContent",
+    "ColumnarVault",
+    "iter_blocks",
+    "reparse",
+    "section_index",
+    "SectionTree",
     # "inline_content",
 ]
+
+
+def __getattr__(name: str):
+    module = _modules.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    # Later lookups find the name directly and skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,231 @@
+# Imports -----------------------------------------
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Library Imports ----------------------------------
+from python_parser.src.models.datatypes import (
+    DataType,
+    FrontMatter,
+    ListItem,
+    Tag,
+    ImageLink,
+    Header,
+    CodeBlock,
+    Callout,
+    Paragraph,
+    ObsidianMarkdownContent,
+)
+from python_parser.src.models.parsers import front_matter, document
+from python_parser.src.models.scanner import (
+    match_block,
+    skip_blank_lines,
+    skip_trailing_whitespace,
+)
+
+# --- Columnar Storage ---
+#
+# Struct-of-arrays layout for parsed content: one byte per node for its kind,
+# one short for its level, and the start/end offsets of the block in the source
+# text. Nothing per node is kept as an object; a node's text is sliced from the
+# source, and its DataType model rebuilt by re-matching the block, only when
+# asked for. Queries over kinds and levels run over the arrays directly.
+
+KIND_CODES: Dict[type, int] = {
+    Header: 1,
+    CodeBlock: 2,
+    Callout: 3,
+    ListItem: 4,
+    ImageLink: 5,
+    Tag: 6,
+    Paragraph: 7,
+}
+KINDS_BY_CODE: Dict[int, type] = {code: kind for kind, code in KIND_CODES.items()}
+MAX_LEVEL = 0xFFFF
+
+
+class Columns:
+    """Typed node arrays shared by ColumnarContent and ColumnarVault"""
+
+    def __init__(self):
+        self.kinds = bytearray()
+        self.levels = array("H")
+        self.starts = array("q")
+        self.ends = array("q")
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def scan(self, text: str, base: int = 0) -> int:
+        """
+        Append the blocks of a document; offsets are stored relative to `base`
+        added to positions in `text`.
+
+        Returns:
+            The end of the frontmatter in `text` (0 without one).
+
+        Raises:
+            ParseError: If the text cannot be parsed, exactly as `document` would.
+        """
+        front = front_matter(text, 0)
+        front_end = front.index if front.status else 0
+        index = skip_blank_lines(text, front_end)
+        kinds, levels, starts, ends = self.kinds, self.levels, self.starts, self.ends
+        count = len(kinds)
+        while (match := match_block(text, index)) is not None:
+            kind, fields, end = match
+            kinds.append(KIND_CODES[kind])
+            levels.append(min(fields.get("level", 0), MAX_LEVEL))
+            starts.append(base + index)
+            ends.append(base + end)
+            index = skip_blank_lines(text, end)
+        if skip_trailing_whitespace(text, index) != len(text):
+            del kinds[count:], levels[count:], starts[count:], ends[count:]
+            # Let the combinator parser report the failure
+            document.parse(text)
+        return front_end
+
+    def positions(
+        self, kind: type, level: Optional[int] = None, lo: int = 0, hi: int = None
+    ) -> Iterator[int]:
+        """Indices of nodes of `kind` (and `level`) in [lo, hi), in order"""
+        hi = len(self.kinds) if hi is None else hi
+        code = bytes((KIND_CODES[kind],))
+        levels = self.levels
+        index = self.kinds.find(code, lo, hi)
+        while index != -1:
+            if level is None or levels[index] == level:
+                yield index
+            index = self.kinds.find(code, index + 1, hi)
+
+    def count(self, kind: type, lo: int = 0, hi: int = None) -> int:
+        hi = len(self.kinds) if hi is None else hi
+        return self.kinds.count(bytes((KIND_CODES[kind],)), lo, hi)
+
+
+# Classes -----------------------------------------------
+class ColumnarContent(Columns):
+    """
+    Columnar alternative to ObsidianMarkdownContent for one document.
+
+    Usage:
+        content = ColumnarContent(text)
+        [content.text(i) for i in content.select(Header, level=2)]
+        content.count(ListItem)
+    """
+
+    def __init__(self, source: str):
+        super().__init__()
+        self.source = source
+        self._front_end = self.scan(source)
+
+    @property
+    def frontmatter(self) -> Optional[FrontMatter]:
+        if not self._front_end:
+            return None
+        return front_matter.parse_partial(self.source)[0]
+
+    def select(self, kind: type, level: Optional[int] = None) -> List[int]:
+        return list(self.positions(kind, level))
+
+    def kind(self, index: int) -> type:
+        return KINDS_BY_CODE[self.kinds[index]]
+
+    def text(self, index: int) -> str:
+        """Source text of a node"""
+        return self.source[self.starts[index] : self.ends[index]]
+
+    def node(self, index: int) -> DataType:
+        """Rebuild the DataType model of a node from its source"""
+        kind, fields, _ = match_block(self.source, self.starts[index])
+        return kind(**fields)
+
+    def to_content(self) -> ObsidianMarkdownContent:
+        return ObsidianMarkdownContent(
+            nodes=[self.node(index) for index in range(len(self))]
+        )
+
+
+class ColumnarVault(Columns):
+    """
+    Columnar node storage for many documents in one set of arrays.
+
+    Node offsets index into the concatenation of the file sources, so file
+    boundaries are a single sorted array and per-file queries are slices of
+    the shared columns.
+
+    Usage:
+        vault = ColumnarVault.build(vault_dir)
+        vault.count_per_file(ListItem)
+        vault.select(Header, level=2)
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.paths: List[str] = []
+        self.sources: List[str] = []
+        self.errors: Dict[str, str] = {}
+        # First node index and source offset of each file, then the totals
+        self.file_nodes = array("q", [0])
+        self.file_offsets = array("q", [0])
+
+    @classmethod
+    def build(cls, directory: str, recursive: bool = True) -> "ColumnarVault":
+        """Load every markdown file in a vault; failing files go to `errors`"""
+        # Imported here: vault.py depends on the parser base, which imports models
+        from python_parser.src.vault import list_vault_files
+
+        vault = cls()
+        for path in list_vault_files(directory, recursive=recursive):
+            try:
+                vault.add(path)
+            except Exception as e:
+                vault.errors[path] = f"{type(e).__name__}: {e}"
+        return vault
+
+    def add(self, path: str, text: Optional[str] = None) -> None:
+        if text is None:
+            with open(path, "r") as file:
+                text = file.read()
+        self.scan(text, base=self.file_offsets[-1])
+        self.paths.append(path)
+        self.sources.append(text)
+        self.file_nodes.append(len(self))
+        self.file_offsets.append(self.file_offsets[-1] + len(text))
+
+    def file_of(self, index: int) -> int:
+        """Index of the file holding node `index`"""
+        return bisect_right(self.file_nodes, index) - 1
+
+    def count_per_file(self, kind: type) -> Dict[str, int]:
+        nodes = self.file_nodes
+        return {
+            path: self.count(kind, nodes[i], nodes[i + 1])
+            for i, path in enumerate(self.paths)
+        }
+
+    def select(
+        self, kind: type, level: Optional[int] = None, path: Optional[str] = None
+    ) -> List[int]:
+        """Node indices of `kind` (and `level`), across the vault or in one file"""
+        if path is None:
+            return list(self.positions(kind, level))
+        file = self.paths.index(path)
+        nodes = self.file_nodes
+        return list(self.positions(kind, level, nodes[file], nodes[file + 1]))
+
+    def locate(self, index: int) -> Tuple[str, int]:
+        """(path, offset in that file) of a node"""
+        file = self.file_of(index)
+        return self.paths[file], self.starts[index] - self.file_offsets[file]
+
+    def text(self, index: int) -> str:
+        file = self.file_of(index)
+        base = self.file_offsets[file]
+        return self.sources[file][self.starts[index] - base : self.ends[index] - base]
+
+    def node(self, index: int) -> DataType:
+        file = self.file_of(index)
+        start = self.starts[index] - self.file_offsets[file]
+        kind, fields, _ = match_block(self.sources[file], start)
+        return kind(**fields)
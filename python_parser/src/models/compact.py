@@ -0,0 +1,56 @@
+# Imports -----------------------------------------
+from typing import Any, Dict, Tuple
+
+# Library Imports ----------------------------------
+from python_parser.src.models.datatypes import (
+    DataType,
+    Text,
+    ListItem,
+    InlineCode,
+    CodeBlock,
+    WikiLink,
+    ImageLink,
+    ExternalLink,
+    Tag,
+    Header,
+    Callout,
+    FrontMatter,
+    Paragraph,
+)
+
+# --- Compact Node Records ---
+#
+# Plain tuples of (type name, *field values) in model field order. They pickle
+# and serialize far smaller than the pydantic models they stand for, and are
+# expanded back into identical models on demand.
+
+CompactNode = Tuple[Any, ...]
+
+NODE_TYPES: Dict[str, type] = {
+    node_type.__name__: node_type
+    for node_type in (
+        Text,
+        ListItem,
+        InlineCode,
+        CodeBlock,
+        WikiLink,
+        ImageLink,
+        ExternalLink,
+        Tag,
+        Header,
+        Callout,
+        FrontMatter,
+        Paragraph,
+    )
+}
+
+
+def compact_node(node: DataType) -> CompactNode:
+    """Convert a markdown node into a (type name, *field values) tuple"""
+    return (type(node).__name__, *(getattr(node, name) for name in node.model_fields))
+
+
+def expand_node(record: CompactNode) -> DataType:
+    """Rebuild the markdown node a compact record was made from"""
+    node_type = NODE_TYPES[record[0]]
+    return node_type(**dict(zip(node_type.model_fields, record[1:])))
@@ -1,9 +1,8 @@
-from typing import List, Dict, Union, Optional, Any
+from typing import List, Dict, Union, Optional, Any, Tuple
 from abc import ABC, abstractmethod
 from datetime import datetime, date
 import parsy
 from pathlib import Path
-import shortuuid
 from dataclasses import dataclass
 
 from pydantic import BaseModel, Field
@@ -37,6 +36,27 @@ class DataType(BaseModel, ABC):
         # Allow extra fields when deserializing
         extra = "allow"
 
+    # Source spans live in the private-state slot, filled only when a span is
+    # set. Declaring a PrivateAttr instead would add a post-init hook to every
+    # node construction, spans or not.
+    @property
+    def span(self) -> Optional[Tuple[int, int]]:
+        """(start, end) offsets in the parsed text, set by `with_span` parsers"""
+        private = self.__pydantic_private__
+        return private.get("span") if private else None
+
+    def set_span(self, start: int, end: int) -> None:
+        if self.__pydantic_private__ is None:
+            object.__setattr__(self, "__pydantic_private__", {})
+        self.__pydantic_private__["span"] = (start, end)
+
+    def source_text(self, source: str) -> str:
+        """Slice this node's text out of the source it was parsed from"""
+        if self.span is None:
+            raise ValueError(f"\nNode has no source span: {self!r}\n\n")
+        start, end = self.span
+        return source[start:end]
+
     def dict(self, *args, **kwargs):
         """Override dict method to ensure all nested objects are serializable"""
 
@@ -192,6 +212,8 @@ class DB_Node(DataType):
 
     def generate_tag(self, node_type: str):
         # Generate a tag for the DB object
+        import shortuuid
+
         id = shortuuid.uuid()
         git_version = "0.0.0"
         self.node_tag = DB_Node_Tag(
@@ -375,12 +397,39 @@ class FrontMatter(DataType):
 
     content: Dict[str, Any]
 
+    def set_source(self, source: str, original: Dict[str, Any]) -> None:
+        """
+        Keep the YAML text this frontmatter was loaded from, so `to_string`
+        writes unchanged keys back exactly as they were.
+
+        Args:
+            source: The YAML between the delimiters
+            original: A separate copy of what `source` loaded as
+        """
+        if self.__pydantic_private__ is None:
+            object.__setattr__(self, "__pydantic_private__", {})
+        self.__pydantic_private__["source"] = (source, original)
+
+    def source(self) -> Optional[str]:
+        """The YAML text given to `set_source`, if any"""
+        private = self.__pydantic_private__ or {}
+        return private.get("source", (None, None))[0]
+
+    def __eq__(self, other: Any) -> bool:
+        # Every parsed frontmatter keeps its YAML source for round-trip writes
+        # (see `set_source`); two frontmatters with the same keys are equal
+        # whatever text they were read from
+        if isinstance(other, FrontMatter):
+            return type(self) is type(other) and self.content == other.content
+        return super().__eq__(other)
+
     def to_string(self) -> str:
-        return (
-            "---\n"
-            + "\n".join([f"{key}: {value}" for key, value in self.content.items()])
-            + "\n---"
-        )
+        # Imported on first write, so PyYAML stays out of the import of models
+        from python_parser.src.models.yaml_writer import dump_frontmatter
+
+        private = self.__pydantic_private__ or {}
+        source, original = private.get("source", (None, None))
+        return "---\n" + dump_frontmatter(self.content, source, original) + "\n---"
 
     def add(self, key: str, value: Any) -> None:
         self.content[key] = value
@@ -425,16 +474,21 @@ class ObsidianFile(DataType):
     """
 
     frontmatter: Optional[FrontMatter] = Field(default=None)
-    content: Optional[str] = Field(default=None)
+    content: Optional[Union[str, "ObsidianMarkdownContent"]] = Field(default=None)
 
     def to_string(self) -> str:
-        return f"{self.frontmatter.to_string()}\n{self.content}"
+        content = self.content
+        if isinstance(content, DataType):
+            content = content.to_string()
+        return f"{self.frontmatter.to_string()}\n{content}"
 
     def write(self, file_path: str) -> None:
         with open(file_path, "w") as file:
             file.write(self.to_string())
 
     def init_frontmatter(self, vault_path: str) -> None:
+        import shortuuid
+
         id = shortuuid.uuid()
         frontmatter_content = {
             "id": id,
@@ -559,6 +613,9 @@ class ObsidianMarkdownContent(DataType):
         return "\n".join([node.to_string() for node in self.nodes])
 
 
+ObsidianFile.model_rebuild()
+
+
 # class ObsidianFile(DataType):
 #    """
 #    Represents an Obsidian Markdown file.
@@ -55,6 +55,13 @@ from python_parser.src.models import (
     python_frontmatter,
     section,
 )
+from python_parser.src.models.lines import LineTable
+from python_parser.src.models.sections import (
+    preamble_end,
+    section_index,
+    section_text,
+    trimmed_end,
+)
 
 # from python_parser.logs.logger import get_logger
 
@@ -224,37 +231,47 @@ class FrontMatterParser(Parser[FrontMatter]):
     data_type: Type[FrontMatter] = Field(default=FrontMatter)
 
 
-database_parsers = [
-    ObsidianFileParser(),
-    PythonFileParser(),
-    HeaderParser(),
-    FrontMatterParser(),
-    SectionParser(),
+database_parser_types = [
+    ObsidianFileParser,
+    PythonFileParser,
+    HeaderParser,
+    FrontMatterParser,
+    SectionParser,
 ]
 
 
+def __getattr__(name: str):
+    # The parser registry is instantiated on first use, not on import
+    if name == "database_parsers":
+        parsers = [parser_type() for parser_type in database_parser_types]
+        globals()[name] = parsers
+        return parsers
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Main
 def split_content(content: str):
     """
-    Split the content at each header:
+    Split the content into the text before the first header, then the text of
+    each section (see `section_index`), without trailing line endings. Only
+    headers outside the frontmatter and code blocks start a section.
     """
-    content_sections = content.split("\n#")
-    parsed_sections = []
-    for i, sec in enumerate(content_sections):
-        if i == 0:
-            parsed_sections.append(sec)
-        else:
-            parsed_sections.append(f"#{sec.strip('\n')}")
-
-    return parsed_sections
+    index = section_index(content)
+    preamble = content[: trimmed_end(content, 0, preamble_end(content, index))]
+    return [preamble] + [section_text(content, entry) for entry in index]
 
 
 def split_sections(content: str):
     """
-    Split the content at each section:
+    Split the content at blank lines: each part is a run of non-blank lines,
+    without line endings around it. Lines of only spaces and tabs count as
+    blank, and several blank lines in a row don't give empty parts.
     """
-    return_content = content.split("\n\n")
-    return return_content
+    table = LineTable(content)
+    return [
+        content[table.start(first) : table.end(end - 1)]
+        for first, end in table.blocks()
+    ]
 
 
 def test_datatypes():
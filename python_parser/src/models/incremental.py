@@ -0,0 +1,163 @@
+# Imports -----------------------------------------
+from typing import List, Tuple, Union
+
+# Library Imports ----------------------------------
+from python_parser.src.models.datatypes import (
+    CodeBlock,
+    FrontMatter,
+    MarkdownNode,
+    ObsidianMarkdownContent,
+)
+from python_parser.src.models.parsers import front_matter, document
+from python_parser.src.models.scanner import (
+    fast_document,
+    match_block,
+    skip_blank_lines,
+    skip_trailing_whitespace,
+)
+
+# --- Incremental Re-parse ---
+#
+# `document` parses block by block, and each block match depends only on the
+# text from its start index onwards. So after an edit:
+#
+# - Leading blocks whose match (plus the lookahead that found the next block
+#   start) read only text before the edit come out of a new parse unchanged.
+# - Once the re-parse of the edited region reaches a block start that lines up
+#   with a block start of the old text inside the unchanged tail, every block
+#   from there on is unchanged as well.
+#
+# Only the blocks in between are matched and built again.
+
+DocumentResult = Union[
+    ObsidianMarkdownContent, Tuple[FrontMatter, ObsidianMarkdownContent]
+]
+
+
+def _common_prefix(old: str, new: str) -> int:
+    limit = min(len(old), len(new))
+    if old[:limit] == new[:limit]:
+        return limit
+    # Binary search on slice equality keeps the comparison in C
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[:middle] == new[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix(old: str, new: str, limit: int) -> int:
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[len(old) - middle :] == new[len(new) - middle :]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _read_limit(text: str, kind: type, start: int, next_start: int) -> int:
+    """
+    Exclusive bound on the characters read to match the block at `start` and
+    skip to `next_start`: the builders look no further than the line holding
+    the next block start, except for an unclosed fence, whose search for the
+    closing line runs to the end of the text.
+    """
+    if kind is not CodeBlock and text.startswith("```", start):
+        return len(text) + 1
+    line_end = text.find("\n", next_start)
+    return len(text) + 1 if line_end == -1 else line_end + 1
+
+
+def _next_block(text: str, index: int) -> Tuple[type, int]:
+    kind, _, end = match_block(text, index)
+    return kind, skip_blank_lines(text, end)
+
+
+def reparse(
+    previous_result: DocumentResult, old_text: str, new_text: str
+) -> DocumentResult:
+    """
+    Re-parse an edited document, reusing the nodes of unchanged blocks.
+
+    Args:
+        previous_result: The result of `document` on `old_text`
+        old_text: Text the previous result was parsed from
+        new_text: The edited text
+
+    Returns:
+        The same result `document.parse(new_text)` would produce. Unchanged
+        nodes are shared with `previous_result`.
+
+    Raises:
+        ParseError: If `new_text` cannot be parsed, exactly as `document` would.
+    """
+    if old_text == new_text:
+        return previous_result
+    if isinstance(previous_result, tuple):
+        front, content = previous_result
+    else:
+        front, content = None, previous_result
+    old_nodes = content.nodes
+
+    prefix = _common_prefix(old_text, new_text)
+    suffix_limit = min(len(old_text), len(new_text)) - prefix
+    suffix = _common_suffix(old_text, new_text, suffix_limit)
+    edit_end = len(new_text) - suffix
+    shift = len(new_text) - len(old_text)
+
+    # Frontmatter, and the blank lines before the first block
+    if front is not None:
+        start = front_matter(old_text, 0).index
+    elif old_text.startswith("-"):
+        # A failed frontmatter attempt may have read anywhere
+        return fast_document.parse(new_text)
+    else:
+        start = 0
+    start = skip_blank_lines(old_text, start)
+    line_end = old_text.find("\n", start)
+    if line_end == -1 or line_end >= prefix:
+        return fast_document.parse(new_text)
+
+    # Leading blocks untouched by the edit
+    reused = 0
+    while reused < len(old_nodes):
+        kind, next_start = _next_block(old_text, start)
+        if _read_limit(old_text, kind, start, next_start) > prefix:
+            break
+        reused += 1
+        start = next_start
+    nodes: List[MarkdownNode] = old_nodes[:reused]
+
+    # Re-parse until a block start lines up with one in the unchanged tail
+    index = old_index = start
+    old_position = reused
+    while True:
+        if index >= edit_end:
+            target = index - shift
+            while old_position < len(old_nodes) and old_index < target:
+                old_index = _next_block(old_text, old_index)[1]
+                old_position += 1
+            if old_index == target:
+                nodes.extend(old_nodes[old_position:])
+                break
+        match = match_block(new_text, index)
+        if match is None:
+            if skip_trailing_whitespace(new_text, index) != len(new_text):
+                # Let the combinator parser report the failure
+                return document.parse(new_text)
+            break
+        kind, fields, end = match
+        nodes.append(kind(**fields))
+        index = skip_blank_lines(new_text, end)
+
+    # Every node is already validated; re-validating the union list would cost
+    # more than the re-parse itself
+    blocks = ObsidianMarkdownContent.model_construct(nodes=nodes)
+    if front is not None:
+        return front, blocks
+    return blocks
@@ -0,0 +1,133 @@
+# Imports -----------------------------------------
+import re
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from operator import itemgetter, methodcaller
+from typing import Iterator, List, Optional, Tuple
+
+# --- Line Table ---
+#
+# Line offsets and a one-character class for every line of a text, computed
+# up front for the whole buffer (split, map and accumulate each run over all
+# lines in C) instead of probing the text character by character as blocks
+# are parsed. The classes form a string with one character per line, so runs
+# of lines (blank lines, a block, every header line) are found with a single
+# regex match over it.
+#
+# Lines end at "\n"; a "\r" before it belongs to the line ending. A line is
+# classified by what follows its indentation (spaces and tabs):
+
+BLANK = "b"  # Nothing (or only the line ending)
+TEXT = "t"  # Anything not below
+HASH = "#"  # `#`: a header or a tag
+FENCE = "`"  # "```": a code fence
+QUOTE = ">"  # `>`: a callout line
+LIST = "-"  # "- ": a list item
+BANG = "!"  # `!`: an image link
+
+# Constants ---------------------------------------------
+_strip_indent = methodcaller("lstrip", " \t")
+_first_char = itemgetter(slice(0, 1))
+# Class by the first character after the indentation. Lines starting with
+# "-" or "`" are LIST or FENCE only with the whole prefix.
+_FIRST_CLASSES = {"": BLANK, "#": HASH, ">": QUOTE, "!": BANG}
+_PREFIXES = (("-", "- ", LIST), ("`", "```", FENCE))
+_BLANK_RUN = re.compile(f"{BLANK}*")
+_NON_BLANK_RUN = re.compile(f"[^{BLANK}]+")
+
+
+# Functions ---------------------------------------------
+def _lines_starting(firsts: List[str], char: str) -> Iterator[int]:
+    line = -1
+    try:
+        while True:
+            line = firsts.index(char, line + 1)
+            yield line
+    except ValueError:
+        return
+
+
+# Classes -----------------------------------------------
+class LineTable:
+    """
+    Line offsets and classes of a text.
+
+    Attributes:
+        text: The text
+        starts: Offset of the first character of each line
+        kinds: One class character per line (BLANK, TEXT, HASH, ...)
+
+    A text ending in a newline has no empty line after it.
+    """
+
+    __slots__ = ("text", "starts", "kinds")
+
+    def __init__(self, text: str):
+        self.text = text
+        lines = text.split("\n")
+        if len(lines) > 1 and not lines[-1]:
+            lines.pop()
+        # Each line starts one past the end of the one before it
+        self.starts = list(accumulate(map((1).__add__, map(len, lines)), initial=0))
+        self.starts.pop()
+
+        rests = list(map(_strip_indent, lines))
+        firsts = list(map(_first_char, rests))
+        kinds = [_FIRST_CLASSES.get(first, TEXT) for first in firsts]
+        for char, prefix, kind in _PREFIXES:
+            for line in _lines_starting(firsts, char):
+                if rests[line].startswith(prefix):
+                    kinds[line] = kind
+        # Blank before a "\r\n" line ending
+        for line in _lines_starting(firsts, "\r"):
+            if rests[line] == "\r":
+                kinds[line] = BLANK
+        self.kinds = "".join(kinds)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def start(self, line: int) -> int:
+        """Offset of `line`, or the end of the text past the last line"""
+        return self.starts[line] if line < len(self.starts) else len(self.text)
+
+    def end(self, line: int) -> int:
+        """Offset of the line ending of `line`, or the end of the text"""
+        if line + 1 < len(self.starts):
+            end = self.starts[line + 1] - 1
+        elif self.text.endswith("\n"):
+            end = len(self.text) - 1
+        else:
+            return len(self.text)
+        if end > self.starts[line] and self.text[end - 1] == "\r":
+            end -= 1
+        return end
+
+    def line_text(self, line: int) -> str:
+        """`line` without its line ending"""
+        return self.text[self.starts[line] : self.end(line)]
+
+    def line_at(self, index: int) -> Optional[int]:
+        """The line starting at `index`, or None if `index` is not a line start"""
+        line = bisect_left(self.starts, index)
+        if line < len(self.starts) and self.starts[line] == index:
+            return line
+        return None
+
+    def line_of(self, index: int) -> int:
+        """The line containing offset `index`"""
+        return max(bisect_right(self.starts, index) - 1, 0)
+
+    def skip_blank(self, line: int) -> int:
+        """The first non-blank line from `line` on (or the line count)"""
+        return _BLANK_RUN.match(self.kinds, line).end()
+
+    def lines_of(self, kinds: str) -> List[int]:
+        """Lines whose class is one of `kinds`"""
+        pattern = f"[{re.escape(kinds)}]"
+        return [match.start() for match in re.finditer(pattern, self.kinds)]
+
+    def blocks(self) -> Iterator[Tuple[int, int]]:
+        """(first line, end line) of each run of non-blank lines"""
+        for match in _NON_BLANK_RUN.finditer(self.kinds):
+            yield match.start(), match.end()
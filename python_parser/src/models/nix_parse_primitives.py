@@ -52,33 +52,53 @@ space = regex(r"[ \t]")
 spaces = space.many()
 newline = string("\n")
 comment = regex(r"#[^\n]*")
-whitespace_or_comment = (spaces | newline | comment).many()
+# `space` rather than `spaces` inside `.many()`: a repeated parser that can
+# match nothing never stops repeating
+whitespace_or_comment = (space | newline | comment).many()
+
+# Punctuation shared by the structure parsers, built once at import rather
+# than on every call of the generators below
+equals = spaces >> string("=") >> spaces
+statement_end = string(";").optional() >> whitespace_or_comment
+block_open = string("{") >> whitespace_or_comment
+block_close = string("}") >> statement_end
+list_open = string("[") >> whitespace_or_comment
+list_close = string("]") >> statement_end
+
+
+def assignment(name: str) -> Parser:
+    """`name = ` at the start of an attribute"""
+    return string(name) >> equals
+
 
 # --- Value Parsers ---
 string_content = regex(r'[^"]*')
 quoted_string = string('"') >> string_content << string('"')
 single_quoted_string = string("''") >> regex(r"[^']*") << string("''")
 string_value = quoted_string | single_quoted_string
+boolean = string_from("true", "false").map(lambda x: x == "true")
 
 identifier = regex(r"[A-Za-z_][A-Za-z0-9_]*")
 package_ref = seq(
     base=identifier, dot=string(".").optional(), path=identifier.optional()
 ).combine(lambda base, dot, path: f"{base}{dot or ''}{path or ''}")
+package_prefix = string("pkgs.")
+script_exec = spaces >> string(".exec") >> equals
 
 
 # --- Structure Parsers ---
 @generate
 def env_var():
     name = yield identifier
-    yield spaces >> string("=") >> spaces
+    yield equals
     value = yield string_value | identifier
-    yield string(";").optional() >> whitespace_or_comment
+    yield statement_end
     return EnvVar(name, value)
 
 
 @generate
 def package():
-    pkg = yield string("pkgs.") >> identifier
+    pkg = yield package_prefix >> identifier
     yield whitespace_or_comment
     return Package(pkg)
 
@@ -86,130 +106,136 @@ def package():
 @generate
 def language_setting():
     name = yield identifier
-    yield spaces >> string("=") >> spaces
-    value = yield string_from("true", "false").map(lambda x: x == "true")
-    yield string(";").optional() >> whitespace_or_comment
+    yield equals
+    value = yield boolean
+    yield statement_end
     return (name, value)
 
 
+language_settings = language_setting.many()
+
+
 @generate
 def language():
     name = yield identifier
-    yield spaces >> string("=") >> spaces >> string("{") >> whitespace_or_comment
-    settings = yield language_setting.many()
-    yield string("}") >> string(";").optional() >> whitespace_or_comment
+    yield equals >> block_open
+    settings = yield language_settings
+    yield block_close
     return Language(name, dict(settings))
 
 
 @generate
 def script():
     name = yield identifier
-    yield spaces >> string(".exec") >> spaces >> string("=") >> spaces
+    yield script_exec
     content = yield single_quoted_string
-    yield string(";").optional() >> whitespace_or_comment
+    yield statement_end
     return Script(name, content)
 
 
 # --- Main Section Parsers ---
+env_open = assignment("env") >> block_open
+env_vars = env_var.many()
+
+
 @generate
 def env_section():
-    yield (
-        string("env")
-        >> spaces
-        >> string("=")
-        >> spaces
-        >> string("{")
-        >> whitespace_or_comment
-    )
-    vars = yield env_var.many()
-    yield string("}") >> string(";").optional() >> whitespace_or_comment
+    yield env_open
+    vars = yield env_vars
+    yield block_close
     return {var.name: var.value for var in vars}
 
 
+packages_open = assignment("packages") >> list_open
+package_list = package.many()
+
+
 @generate
 def packages_section():
-    yield (
-        string("packages")
-        >> spaces
-        >> string("=")
-        >> spaces
-        >> string("[")
-        >> whitespace_or_comment
-    )
-    pkgs = yield package.many()
-    yield string("]") >> string(";").optional() >> whitespace_or_comment
+    yield packages_open
+    pkgs = yield package_list
+    yield list_close
     return [pkg.name for pkg in pkgs]
 
 
+languages_open = assignment("languages") >> block_open
+language_list = language.many()
+
+
 @generate
 def languages_section():
-    yield (
-        string("languages")
-        >> spaces
-        >> string("=")
-        >> spaces
-        >> string("{")
-        >> whitespace_or_comment
-    )
-    langs = yield language.many()
-    yield string("}") >> string(";").optional() >> whitespace_or_comment
+    yield languages_open
+    langs = yield language_list
+    yield block_close
     return {lang.name: lang for lang in langs}
 
 
+scripts_open = assignment("scripts") >> block_open
+script_list = script.many()
+
+
 @generate
 def scripts_section():
-    yield (
-        string("scripts")
-        >> spaces
-        >> string("=")
-        >> spaces
-        >> string("{")
-        >> whitespace_or_comment
-    )
-    scripts_list = yield script.many()
-    yield string("}") >> string(";").optional() >> whitespace_or_comment
+    yield scripts_open
+    scripts_list = yield script_list
+    yield block_close
     return {script.name: script for script in scripts_list}
 
 
+enter_shell_open = assignment("enterShell")
+
+
 @generate
 def enter_shell_section():
-    yield string("enterShell") >> spaces >> string("=") >> spaces
+    yield enter_shell_open
     content = yield single_quoted_string
-    yield string(";").optional() >> whitespace_or_comment
+    yield statement_end
     return content
 
 
+enter_test_open = assignment("enterTest")
+
+
 @generate
 def enter_test_section():
-    yield string("enterTest") >> spaces >> string("=") >> spaces
+    yield enter_test_open
     content = yield single_quoted_string
-    yield string(";").optional() >> whitespace_or_comment
+    yield statement_end
     return content
 
 
 # --- Complete File Parser ---
+file_header = (
+    block_open
+    >> string("pkgs, lib, config, inputs, ...")
+    >> string("}")
+    >> string(":")
+    >> whitespace_or_comment
+    >> block_open
+)
+file_close = string("}").optional()
+nix_section = (
+    env_section.map(lambda x: ("env", x))
+    | packages_section.map(lambda x: ("packages", x))
+    | languages_section.map(lambda x: ("languages", x))
+    | scripts_section.map(lambda x: ("scripts", x))
+    | enter_shell_section.map(lambda x: ("enter_shell", x))
+    | enter_test_section.map(lambda x: ("enter_test", x))
+    | (comment >> whitespace_or_comment).result(None)
+)
+
+
 @generate
 def nix_file():
-    yield string("{") >> whitespace_or_comment
-    yield string("pkgs, lib, config, inputs, ...")
-    yield string("}") >> string(":") >> whitespace_or_comment
-    yield string("{") >> whitespace_or_comment
+    yield file_header
 
     sections = {}
     while True:
         try:
-            if (yield string("}").optional()):
+            if (yield file_close):
                 break
 
-            section = yield (
-                env_section.map(lambda x: ("env", x))
-                | packages_section.map(lambda x: ("packages", x))
-                | languages_section.map(lambda x: ("languages", x))
-                | scripts_section.map(lambda x: ("scripts", x))
-                | enter_shell_section.map(lambda x: ("enter_shell", x))
-                | enter_test_section.map(lambda x: ("enter_test", x))
-                | (comment >> whitespace_or_comment).result(None)
-            )
+            section = yield nix_section
 
             if section is not None:
                 name, value = section
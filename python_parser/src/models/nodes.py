@@ -0,0 +1,137 @@
+# Imports -----------------------------------------
+from dataclasses import dataclass
+from typing import ClassVar, Dict, List, Optional, Union
+
+# Library Imports ----------------------------------
+from python_parser.src.models.datatypes import (
+    DataType,
+    ListItem,
+    Tag,
+    ImageLink,
+    Header,
+    CodeBlock,
+    Callout,
+    Paragraph,
+    ObsidianMarkdownContent,
+)
+
+# --- Slotted Nodes ---
+#
+# Plain slotted counterparts of the block-level DataType models. They carry no
+# `__dict__` and skip validation, so they are several times smaller and faster
+# to build than the models; the scanner produces them directly from already
+# validated matches. `to_model()` converts to the pydantic model, with full
+# validation, for callers that need one.
+
+
+@dataclass(slots=True)
+class Node:
+    """Base for slotted nodes; `model` is the DataType the node stands for"""
+
+    model: ClassVar[type]
+
+    def to_model(self) -> DataType:
+        return self.model(**{name: getattr(self, name) for name in self.__slots__})
+
+    def to_string(self) -> str:
+        # The model methods only read fields, so they work on the slotted node
+        return self.model.to_string(self)
+
+
+@dataclass(slots=True)
+class HeaderNode(Node):
+    model: ClassVar[type] = Header
+
+    level: int
+    content: str
+
+
+@dataclass(slots=True)
+class CodeBlockNode(Node):
+    model: ClassVar[type] = CodeBlock
+
+    content: str
+    language: Optional[str]
+
+
+@dataclass(slots=True)
+class CalloutNode(Node):
+    model: ClassVar[type] = Callout
+
+    type: Optional[str]
+    content: List[str]
+
+
+@dataclass(slots=True)
+class ListItemNode(Node):
+    model: ClassVar[type] = ListItem
+
+    level: int
+    content: str
+
+
+@dataclass(slots=True)
+class ImageLinkNode(Node):
+    model: ClassVar[type] = ImageLink
+
+    path: str
+    is_external: bool
+    alt_text: Optional[str] = None
+
+
+@dataclass(slots=True)
+class TagNode(Node):
+    model: ClassVar[type] = Tag
+
+    name: str
+
+
+@dataclass(slots=True)
+class ParagraphNode(Node):
+    model: ClassVar[type] = Paragraph
+
+    content: str
+
+
+BlockNode = Union[
+    HeaderNode,
+    CodeBlockNode,
+    CalloutNode,
+    ListItemNode,
+    ImageLinkNode,
+    TagNode,
+    ParagraphNode,
+]
+
+# Slotted node class for each block model the scanner matches
+NODE_CLASSES: Dict[type, type] = {
+    node_class.model: node_class
+    for node_class in (
+        HeaderNode,
+        CodeBlockNode,
+        CalloutNode,
+        ListItemNode,
+        ImageLinkNode,
+        TagNode,
+        ParagraphNode,
+    )
+}
+
+
+@dataclass(slots=True)
+class NodeContent:
+    """Slotted counterpart of ObsidianMarkdownContent"""
+
+    nodes: List[BlockNode]
+
+    def to_model(self) -> ObsidianMarkdownContent:
+        return ObsidianMarkdownContent(nodes=[node.to_model() for node in self.nodes])
+
+    def to_string(self) -> str:
+        return "\n".join([node.to_string() for node in self.nodes])
+
+
+def from_model(node: DataType) -> BlockNode:
+    """Slotted node for a block-level DataType model"""
+    node_class = NODE_CLASSES[type(node)]
+    return node_class(**{name: getattr(node, name) for name in node_class.__slots__})
@@ -10,7 +10,6 @@ from parsy import (
     eof,
     Parser,
 )
-import yaml
 
 # Library Imports ----------------------------------
 
@@ -13,8 +13,8 @@ from parsy import (
     line_info,
     peek,
 )
-import yaml
-from typing import List, Union
+import re
+from typing import List, Optional, Tuple, Union
 
 # Library Imports -----------------------------------------
 from python_parser.src.models.parse_primitives import (
@@ -45,6 +45,7 @@ from python_parser.src.models.parse_primitives import (
 )
 
 from python_parser.src.models.datatypes import (
+    DataType,
     ListItem,
     InlineCode,
     WikiLink,
@@ -65,6 +66,15 @@ from python_parser.src.models.datatypes import (
     PythonFileBase,
     Section_Node,
 )
+from python_parser.src.models.lines import (
+    BANG,
+    FENCE,
+    HASH,
+    LIST,
+    QUOTE,
+    TEXT,
+    LineTable,
+)
 
 # from python_parser.logs.logger import get_logger
 
@@ -84,25 +94,40 @@ def calc_indent_level(spaces: str, n: int) -> int:
 # match-case db_node parser based on db_node_tag parse type?
 non_tag = hidden_tag | any_char  # regex(r"[^\%%]+") | eof
 
+# Sub-parsers used inside the generator bodies below. They are built once here
+# rather than on every call of the generator (every list item, link, db tag).
+db_text = regex(r"(?:[^\%]|%(?!%))+").map(str)  # Text up to a `%%`
+db_field = regex(r"(?:[^\|%]|%(?!%))+").map(str) << pipe  # `|`-terminated field
+line_text = regex(r"[^\n]+").map(str)
+line_end = newline | eof
+list_marker = string("- ")
+inline_code_text = regex(r"[^`]+").map(str)
+image_marker = string("!")
+wiki_link_open = string("[[")
+wiki_link_close = string("]]")
+link_target = regex(r"[^\|\]]+").map(str) << pipe.optional()
+link_text = regex(r"[^\]]+").map(str)
+optional_db_text = db_text.optional()
+link_alias = link_text.optional()
+url_text = url.map(str)
+
 
 # DB Node parser:
 @generate
 def db_node_tag():
     """Parser for DB node tags"""
     # logger.info(f"  Parsing DB Node Tag...")
-    initial_text = yield regex(r"(?:[^\%]|%(?!%))+").map(str).optional()
+    initial_text = yield optional_db_text
     # logger.info(f"    Initial Text: {initial_text}")
     yield hidden_tag
-    node_id = yield regex(r"(?:[^\|%]|%(?!%))+").map(str) << pipe  # .optional()
+    node_id = yield db_field  # .optional()
     # node_id = node_id.strip()
     # logger.info(f"    Node ID: {node_id}")
-    git_version = (
-        yield regex(r"(?:[^\|%]|%(?!%))+").map(str) << pipe  # .optional()
-    )
+    git_version = yield db_field  # .optional()
     # if git_version:
     #    git_version = git_version.strip()
     # logger.info(f"    Git Version: {git_version}")
-    node_type = yield regex(r"(?:[^\%]|%(?!%))+").map(str)  # .optional()
+    node_type = yield db_text  # .optional()
     # if node_type:
     #    node_type = node_type.strip()
     # logger.info(f"    Node Type: {node_type}")
@@ -116,17 +141,20 @@ def db_node():
     # logger.info(f"Parsing DB Node...")
     node_tag = yield db_node_tag
     # logger.info(f"  Node Tag: {node_tag}")
-    content = yield regex(r"(?:[^\%]|%(?!%))+").map(str).optional()  # .until(eof)
+    content = yield optional_db_text  # .until(eof)
     # logger.info(f"  Content: {content}")
     file_node = DB_Node(node_tag=node_tag, content=content)
     return file_node  # content
 
 
+db_node_list = db_node.many() << eof
+
+
 # Parser for many db_nodes
 @generate
 def db_nodes():
     """Parser for multiple DB nodes"""
-    nodes = yield db_node.many() << eof
+    nodes = yield db_node_list
 
     return nodes
 
@@ -143,12 +171,12 @@ def list_item():
     indent_level = calc_indent_level(indent, 2)
 
     # Match the list item marker
-    yield string("- ")
+    yield list_marker
 
     # Get the content after the marker
-    content = yield regex(r"[^\n]+").map(str)
+    content = yield line_text
     # Consume the newline
-    yield (newline | eof)
+    yield line_end
 
     return ListItem(level=indent_level, content=content)
 
@@ -157,7 +185,7 @@ def list_item():
 @generate
 def inline_code():
     yield backtick
-    content = yield regex(r"[^`]+").map(str)
+    content = yield inline_code_text
     yield backtick
     return InlineCode(content=content)
 
@@ -165,10 +193,10 @@ def inline_code():
 # Wiki links
 @generate
 def wiki_link():
-    yield string("[[")
-    target = yield regex(r"[^\|\]]+").map(str) << pipe.optional()
-    alias = yield regex(r"[^\]]+").map(str).optional()
-    yield string("]]")
+    yield wiki_link_open
+    target = yield link_target
+    alias = yield link_alias
+    yield wiki_link_close
     return WikiLink(target=target, alias=alias)
 
 
@@ -176,10 +204,10 @@ def wiki_link():
 @generate
 def external_link():
     yield bracket_open
-    text = yield regex(r"[^\]]+").map(str)
+    text = yield link_text
     yield bracket_close
     yield paren_open
-    link_url = yield url.map(str)
+    link_url = yield url_text
     yield paren_close
     return ExternalLink(url=link_url, text=text)
 
@@ -188,24 +216,24 @@ def external_link():
 @generate
 def image_wiki_link():
     """Parser for Obsidian local image links: ![[image.png]] or ![[image.png|alt text]]"""
-    yield string("!")
-    yield string("[[")
-    target = yield regex(r"[^\|\]]+").map(str) << pipe.optional()
-    alias = yield regex(r"[^\]]+").map(str).optional()
-    yield string("]]")
+    yield image_marker
+    yield wiki_link_open
+    target = yield link_target
+    alias = yield link_alias
+    yield wiki_link_close
     return ImageLink(path=target, is_external=False, alt_text=alias)
 
 
 @generate
 def image_external_link():
     """Parser for markdown image links: ![alt text](url)"""
-    yield string("!")
-    yield string("[")
-    alt_text = yield regex(r"[^\]]+").map(str).optional()
-    yield string("]")
-    yield string("(")
-    link_url = yield url.map(str)
-    yield string(")")
+    yield image_marker
+    yield bracket_open
+    alt_text = yield link_alias
+    yield bracket_close
+    yield paren_open
+    link_url = yield url_text
+    yield paren_close
     return ImageLink(path=link_url, is_external=True, alt_text=alt_text)
 
 
@@ -230,31 +258,69 @@ reference = tag | link | inline_code
 # --- Block Level Parsers ---
 
 
-@generate
-def reference_parser():
-    """Parser that collects all references (links and tags) from text."""
-    refs = []
-    while True:
-        # Try to find a reference
-        try:
-            # Skip non-reference text
-            discarded = yield (non_link | newline | space).many().optional()
-            if discarded:
-                print(f"  Discarded: '{discarded}'")
-
-            # Get the reference
-            ref = yield reference
-            if ref:
-                print(f"Ref: {ref}")
-            refs.append(ref)
-        except:
-            # break
-            continue
+# One pass over the text with a single alternation of possessive patterns, in
+# the order of `reference`. Link texts and targets stop at brackets and line
+# ends, and URLs at parentheses too, so no attempt runs past the next link
+# opener, no position is rescanned by more than a bounded number of attempts
+# and extraction is linear in the length of the text. Tags follow Obsidian and
+# only start at the beginning of a line or after whitespace.
+reference_pattern = re.compile(
+    r"(?P<tag>(?<!\S)#(?P<tag_name>[A-Za-z0-9_-]++))"
+    r"|(?P<wiki_link>\[\[(?P<wiki_target>[^\|\[\]\n]++)\|?+(?P<wiki_alias>[^\[\]\n]++)?+\]\])"
+    r"|(?P<external_link>\[(?P<link_text>[^\[\]\n]++)\]\((?P<link_url>[^()\[\]\s]++)\))"
+    r"|(?P<image_wiki_link>!\[\[(?P<image_path>[^\|\[\]\n]++)\|?+(?P<image_alias>[^\[\]\n]++)?+\]\])"
+    r"|(?P<image_external_link>!\[(?P<image_alt>[^\[\]\n]++)?+\]\((?P<image_url>[^()\[\]\s]++)\))"
+    r"|(?P<inline_code>`(?P<code>[^`]++)`)"
+)
 
-    return refs
+reference_builders = {
+    "tag": lambda match: Tag(name=match["tag_name"]),
+    "wiki_link": lambda match: WikiLink(
+        target=match["wiki_target"], alias=match["wiki_alias"]
+    ),
+    "external_link": lambda match: ExternalLink(
+        url=match["link_url"], text=match["link_text"]
+    ),
+    "image_wiki_link": lambda match: ImageLink(
+        path=match["image_path"], is_external=False, alt_text=match["image_alias"]
+    ),
+    "image_external_link": lambda match: ImageLink(
+        path=match["image_url"], is_external=True, alt_text=match["image_alt"]
+    ),
+    "inline_code": lambda match: InlineCode(content=match["code"]),
+}
+
+
+def extract_references(
+    text: str, start: int = 0
+) -> List[Union[Tag, WikiLink, ExternalLink, ImageLink, InlineCode]]:
+    """
+    Extract all references from text in a single linear-time pass.
 
+    Args:
+        text: String to scan
+        start: Index to start scanning from
 
-def parse_references(text: str) -> List[Union[Tag, WikiLink, ExternalLink]]:
+    Returns:
+        Tags, wiki links, external links, image links and inline code in the
+        order they appear.
+    """
+    return [
+        # The outer group of the matched alternative is the last one closed
+        reference_builders[match.lastgroup](match)
+        for match in reference_pattern.finditer(text, start)
+    ]
+
+
+@Parser
+def reference_parser(stream: str, index: int) -> Result:
+    """Parser that collects all references (links and tags) from text."""
+    return Result.success(len(stream), extract_references(stream, index))
+
+
+def parse_references(
+    text: str,
+) -> List[Union[Tag, WikiLink, ExternalLink, ImageLink, InlineCode]]:
     """
     Parse text and return all references found.
 
@@ -262,13 +328,9 @@ def parse_references(text: str) -> List[Union[Tag, WikiLink, ExternalLink]]:
         text: String to parse
 
     Returns:
-        List of found references (tags and links)
+        List of found references (tags, links and inline code)
     """
-    try:
-        return reference_parser.parse(text)
-    except Exception as e:
-        print(f"Parse error: {e}")
-        return []
+    return extract_references(text)
 
 
 # Front Matter
@@ -282,19 +344,30 @@ def parse_references(text: str) -> List[Union[Tag, WikiLink, ExternalLink]]:
 
 def parse_frontmatter(frontmatter_content: str) -> FrontMatter:
     """Parse frontmatter content"""
+    # PyYAML is imported on first use, not with the parsers
+    import yaml
+    from python_parser.src.models.yaml_loader import load_yaml
+
     try:
-        parsed_yaml = yaml.safe_load(frontmatter_content)
+        parsed_yaml = load_yaml(frontmatter_content)
         if not parsed_yaml:
             parsed_yaml = {}
     except yaml.YAMLError:
         parsed_yaml = {}
-    return FrontMatter(content=parsed_yaml)
+    frontmatter = FrontMatter(content=parsed_yaml)
+    # A memo hit, so the untouched copy for round-trip writes is cheap
+    original = load_yaml(frontmatter_content) if parsed_yaml else {}
+    frontmatter.set_source(frontmatter_content, original)
+    return frontmatter
 
 
 def parse_python_frontmatter(frontmatter_content: str) -> PythonFrontMatter:
     """Parse frontmatter content"""
+    import yaml
+    from python_parser.src.models.yaml_loader import load_yaml
+
     try:
-        parsed_yaml = yaml.safe_load(frontmatter_content)
+        parsed_yaml = load_yaml(frontmatter_content)
         if not parsed_yaml:
             parsed_yaml = {}
     except yaml.YAMLError:
@@ -302,6 +375,10 @@ def parse_python_frontmatter(frontmatter_content: str) -> PythonFrontMatter:
     return PythonFrontMatter(content=parsed_yaml)
 
 
+front_matter_body = front_matter_content << newline
+frontmatter_close = frontmatter_delimiter << newline
+
+
 @generate
 def front_matter():
     # print(f">> Starting front_matter...")
@@ -309,20 +386,23 @@ def front_matter():
     # print(f"fm delim")
     yield newline
     # print(f"fm content?")
-    frontmatter = yield front_matter_content << newline
+    frontmatter = yield front_matter_body
     # print(f"     Frontmatter: \n`{frontmatter}`")
-    yield frontmatter_delimiter << newline
+    yield frontmatter_close
 
     parsed_frontmatter = parse_frontmatter(frontmatter_content=frontmatter)
     return parsed_frontmatter
 
 
+python_frontmatter_body = python_frontmatter_content << newline
+
+
 # Frontmatter for python files (i.e. - Docstring comment)
 @generate
 def python_frontmatter():
     yield python_frontmatter_delimiter
     yield newline
-    frontmatter = yield python_frontmatter_content << newline
+    frontmatter = yield python_frontmatter_body
     yield python_frontmatter_delimiter
     parsed_frontmatter = parse_python_frontmatter(frontmatter_content=frontmatter)
     return parsed_frontmatter
@@ -334,22 +414,27 @@ def python_frontmatter():
 # )
 
 
+optional_front_matter = front_matter.optional()
+optional_python_frontmatter = python_frontmatter.optional()
+file_content_parser = content.desc("Content")
+
+
 # Generated basic markdown parser:
 @generate
 def basic_markdown_parser():
     # print(f">> Starting basic_markdown_parser...")
 
-    parsed_frontmatter = yield front_matter.optional()
+    parsed_frontmatter = yield optional_front_matter
     # yield frontmatter_delimiter.skip(newline)
-    file_content = yield content.desc("Content")
+    file_content = yield file_content_parser
 
     return ObsidianFile(frontmatter=parsed_frontmatter, content=file_content)
 
 
 @generate
 def basic_python_parser():
-    parsed_frontmatter = yield python_frontmatter.optional()
-    file_content = yield content.desc("Content")
+    parsed_frontmatter = yield optional_python_frontmatter
+    file_content = yield file_content_parser
     return PythonFileBase(frontmatter=parsed_frontmatter, content=file_content)
 
 
@@ -360,18 +445,23 @@ def basic_python_parser():
 # ).combine_dict(Header)
 
 
+header_level = optional_spaces >> regex(r"#{1,6}").map(len)
+line_content_text = line_content.map(str)
+optional_newline = newline.optional()
+
+
 @generate
 def header():
     # print(f">> Starting header parse...")
     yield whitespace_chars
-    level = yield optional_spaces >> regex(r"#{1,6}").map(len)  # << space
+    level = yield header_level  # << space
     # print(f"   Level: {level}")
     yield space
     # index = yield line_info
     # print(f"   Space: {space_char}")
-    content = yield line_content.map(str)  # << newline.optional()
+    content = yield line_content_text  # << newline.optional()
     # print(f"   Content: {content}")
-    yield newline.optional()
+    yield optional_newline
     # if not space_char:
     #    print(f"   No space")
     #    return Result.failure(index, "No space after header level")
@@ -381,11 +471,16 @@ def header():
 # header = header | Exception("Header parse error")
 
 
+peek_header = peek(header).optional()
+optional_db_node_tag = db_node_tag.optional()
+optional_content = content.optional()
+
+
 @generate
 def section():
     """Parser for file sections"""
     # try:
-    parsed_header = yield peek(header).optional()
+    parsed_header = yield peek_header
     if parsed_header:
         parsed_header = yield header
         try:
@@ -409,8 +504,8 @@ def section():
     #    parsed_header = None
     # print(f"  Parsed Header: {parsed_header}")
 
-    node_tag = yield db_node_tag.optional()
-    rest_of_section = yield content.optional()  # .many() << eof  # .optional()
+    node_tag = yield optional_db_node_tag
+    rest_of_section = yield optional_content  # .many() << eof  # .optional()
     if parsed_header:
         section_node = Section_Node(
             level=parsed_header.level,
@@ -427,18 +522,22 @@ def section():
     return section_node
 
 
+code_language = regex(r"[^\n\r]*").map(lambda x: x.strip() if x.strip() else None)
+code_line = regex(r"[^\n\r]*")
+
+
 # Code blocks
 @generate
 def code_block():
     # print(f">> Starting code_block...")
     yield triple_backtick
-    language = yield regex(r"[^\n\r]*").map(lambda x: x.strip() if x.strip() else None)
+    language = yield code_language
     # print(f">> Language: {language}")
     yield newline
 
     content_lines = []
     while True:
-        line = yield regex(r"[^\n\r]*")
+        line = yield code_line
         if line.strip() == "```":
             break
         content_lines.append(line)
@@ -465,7 +564,7 @@ def code_block():
     #        yield eof  # This will fail if we're not at EOF
     #        raise Exception("Code block must be closed with ```")
 
-    yield newline.optional()
+    yield optional_newline
 
     content = "\n".join(content_lines)
     if content:
@@ -475,14 +574,76 @@ def code_block():
     return CodeBlock(content=content, language=language)
 
 
+# Fast-path code blocks: jump straight to the closing fence
+code_block_open = re.compile(r"```([^\n\r]*+)\r?\n")
+# A closing fence is a whole line that strips to ```. Anchoring on the
+# preceding newline (rather than ^ with MULTILINE) lets the regex engine skip
+# ahead with a literal search.
+code_block_close = re.compile(r"\n[^\S\r\n]*+```[^\S\r\n]*+(?=[\r\n]|\Z)")
+lone_carriage_return = re.compile(r"\r(?!\n)")
+
+
+def scan_code_block(text: str, index: int) -> Optional[Tuple[Optional[str], str, int]]:
+    """
+    Match a code block at `index` without walking it line by line.
+
+    Returns (language, content, end index), or None where `code_block` would
+    fail. The body is sliced in one piece between the opening line and the
+    first closing fence.
+    """
+    opening = code_block_open.match(text, index)
+    if opening is None:
+        return None
+    language = opening.group(1).strip() or None
+
+    body_start = opening.end()
+    # Start on the opening line's newline so an empty body still matches
+    closing = code_block_close.search(text, body_start - 1)
+    if closing is None:
+        return None
+    body_end = closing.start() + 1
+
+    content = text[body_start:body_end]
+    if "\r" in content:
+        # `code_block` cannot get past a bare carriage return
+        if lone_carriage_return.search(content):
+            return None
+        content = content.replace("\r\n", "\n")
+    # A single empty line joins to an empty string
+    if content == "\n":
+        content = ""
+
+    end = closing.end()
+    if text.startswith("\n", end):
+        end += 1
+    elif text.startswith("\r\n", end):
+        end += 2
+    return language, content, end
+
+
+@Parser
+def fast_code_block(stream, index):
+    """Drop-in replacement for `code_block` that slices the body in one piece"""
+    match = scan_code_block(stream, index)
+    if match is None:
+        # Let the line-by-line parser report the failure
+        return code_block(stream, index)
+    language, content, end = match
+    return Result.success(end, CodeBlock(content=content, language=language))
+
+
+optional_callout_start = callout_start.optional()
+callout_lines = callout_line.many()
+
+
 @generate
 def callout():
     # print(f">> Starting callout parse...")
-    callout_type = yield callout_start.optional()
+    callout_type = yield optional_callout_start
     if not callout_type:
         callout_type = None
     first_line = yield callout_line
-    other_lines = yield callout_line.many()
+    other_lines = yield callout_lines
 
     content_lines = [first_line] + other_lines
     return Callout(type=callout_type, content=content_lines)
@@ -495,12 +656,15 @@ paragraph_line = (
 )
 
 
+paragraph_lines = paragraph_line.many()
+
+
 @generate
 def paragraph():
     # print(f">> Starting paragraph parse...")
     first_line = yield paragraph_line
     # print(f">> First line: {first_line}")
-    other_lines = yield paragraph_line.many()
+    other_lines = yield paragraph_lines
     # print(f">> Other lines: {other_lines}")
     content_lines = [first_line] + other_lines
     # print(f">> Content lines: \n````\n{content_lines}\n````\n")
@@ -510,31 +674,138 @@ def paragraph():
 # Block level parser (order matters for alternatives)
 block = header | code_block | callout | list_item | image_link | tag | paragraph
 
+# The alternatives of `block` that can match at the start of a line of each
+# class, in the same order; every other alternative fails there. Only
+# header, list_item and paragraph skip indentation.
+line_blocks = {
+    HASH: header | tag,
+    FENCE: code_block | paragraph,
+    QUOTE: callout,
+    LIST: list_item | paragraph,
+    BANG: image_link,
+    TEXT: paragraph,
+}
+indented_line_blocks = {
+    HASH: header,
+    FENCE: paragraph,
+    LIST: list_item | paragraph,
+    TEXT: paragraph,
+}
+
+
+def line_classified(block_parser: Parser) -> Parser:
+    """
+    Wrap `block` so that at a line start only the alternatives the line's
+    class allows are tried, from a LineTable of the whole text built once
+    per text. Anywhere else, and wherever those fail, `block_parser` runs
+    as is, so results and errors are the same as `block_parser`'s.
+    """
+    # The table of the last text parsed; a race between threads only
+    # rebuilds it
+    last_table: List[Optional[LineTable]] = [None]
+
+    @Parser
+    def classified(stream, index):
+        table = last_table[0]
+        if table is None or table.text is not stream:
+            if not isinstance(stream, str) or lone_carriage_return.search(stream):
+                # A bare "\r" is a line break to `header` but not to the table
+                return block_parser(stream, index)
+            table = last_table[0] = LineTable(stream)
+        line = table.line_at(index)
+        if line is not None:
+            if stream.startswith((" ", "\t"), index):
+                alternatives = indented_line_blocks.get(table.kinds[line])
+            else:
+                alternatives = line_blocks.get(table.kinds[line])
+            if alternatives is not None:
+                result = alternatives(stream, index)
+                if result.status:
+                    return result
+        return block_parser(stream, index)
+
+    return classified
+
+
+line_block = line_classified(block)
+
+
+# --- Source Spans ---
+def with_span(parser: Parser) -> Parser:
+    """
+    Wrap a parser so the DataType it returns records the (start, end) offsets
+    of the text it was parsed from, available as `node.span`.
+    """
+
+    @Parser
+    def spanned(stream, index):
+        result = parser(stream, index)
+        if result.status and isinstance(result.value, DataType):
+            result.value.set_span(index, result.index)
+        return result
+
+    return spanned
+
+
+def patch_text(source: str, patches: List[Tuple[Tuple[int, int], str]]) -> str:
+    """
+    Apply (span, replacement) patches to a source text.
+
+    Spans are offsets into `source` (e.g. `node.span`) and must not overlap.
+    Only the patched ranges change; the rest of the text is copied as is.
+    """
+    pieces = []
+    position = 0
+    for (start, end), replacement in sorted(patches, key=lambda patch: patch[0]):
+        if start < position:
+            raise ValueError(f"\nOverlapping patch at offsets {start}-{end}\n\n")
+        pieces.append(source[position:start])
+        pieces.append(replacement)
+        position = end
+    pieces.append(source[position:])
+    return "".join(pieces)
+
 
 # --- Document Level Parser ---
-@generate
-def document():
-    """Parser for complete Obsidian markdown documents"""
-    # print(f">> Starting document parse...")
-    # Optional front matter
-    front = yield front_matter.optional()
-    # print(f">> Front matter: \n````\n{front}\n````\n")
-    # Optional whitespace/blank lines
-    # yield whitespace_chars.optional()
-    yield blank_line.many().optional()
-    # Content blocks
-    blocks = (
-        yield (block << (blank_line.many() | eof | (whitespace + eof))).many()
-        # (whitespace_chars.optional() | (optional_spaces + eof))).many()
-    )
-    blocks = ObsidianMarkdownContent(nodes=blocks)
-    # print(f">> Blocks: \n````\n{blocks}\n````\n")
-    yield whitespace_chars.optional()
-    yield eof
-
-    if front is not None:
-        return front, blocks
-    return blocks
+leading_blank_lines = blank_line.many().optional()
+block_separator = blank_line.many() | eof | (whitespace + eof)
+trailing_whitespace = whitespace_chars.optional()
+
+
+def document_parser(front_matter_parser: Parser, block_parser: Parser) -> Parser:
+    """Build a document parser from frontmatter and block parsers"""
+
+    optional_front = front_matter_parser.optional()
+    blocks_parser = (block_parser << block_separator).many()
+    # (whitespace_chars.optional() | (optional_spaces + eof))).many()
+
+    @generate
+    def document():
+        """Parser for complete Obsidian markdown documents"""
+        # print(f">> Starting document parse...")
+        # Optional front matter
+        front = yield optional_front
+        # print(f">> Front matter: \n````\n{front}\n````\n")
+        # Optional whitespace/blank lines
+        # yield whitespace_chars.optional()
+        yield leading_blank_lines
+        # Content blocks
+        blocks = yield blocks_parser
+        blocks = ObsidianMarkdownContent(nodes=blocks)
+        # print(f">> Blocks: \n````\n{blocks}\n````\n")
+        yield trailing_whitespace
+        yield eof
+
+        if front is not None:
+            return front, blocks
+        return blocks
+
+    return document
+
+
+document = document_parser(front_matter, line_block)
+# Same as `document`, with `span` set on the frontmatter and every block
+spanned_document = document_parser(with_span(front_matter), with_span(line_block))
 
 
 @generate
@@ -0,0 +1,331 @@
+# Imports -----------------------------------------
+import os
+import re
+from typing import Callable, Dict, Iterator, Optional, TextIO, Tuple, Union
+
+from parsy import Parser, Result, ParseError
+
+# Library Imports ----------------------------------
+from python_parser.src.models.datatypes import (
+    MarkdownNode,
+    ListItem,
+    Tag,
+    ImageLink,
+    Header,
+    CodeBlock,
+    Callout,
+    Paragraph,
+    ObsidianMarkdownContent,
+)
+from python_parser.src.models.nodes import NODE_CLASSES, NodeContent
+from python_parser.src.models.parsers import (
+    front_matter,
+    scan_code_block,
+    code_block_open,
+    block,
+    document,
+)
+
+# --- Line Scanner ---
+#
+# Alternative engine for `document`. Instead of offering every block to the
+# `block` alternation (and backtracking through up to seven generator parsers
+# before `paragraph` wins), each block start is classified once by its leading
+# characters and only the builders that can possibly match there are tried, in
+# the same order as the alternation. Every builder is a possessive regex that
+# mirrors its parsy counterpart exactly, so the output is identical to
+# `document`.
+
+# A block match: (node class, constructor fields, end index)
+BlockMatch = Tuple[type, dict, int]
+
+_BLANK_LINES = re.compile(r"(?:[ \t]*+[\r\n])*+")
+_INDENT = re.compile(r"[ \t]*+")
+_TRAILING = re.compile(r"[ \t\r\n]*+")
+
+_HEADER = re.compile(r"[ \t\r\n]*+(#{1,6}+) ([^\n\r]++)(?:\r?\n)?+")
+_LIST_ITEM = re.compile(r"([ \t]*+)- ([^\n]++)(?:\r?\n|\Z)")
+_PARAGRAPH_LINE = re.compile(r"[ \t]*+((?![#>!])[^\n\r]++)(?:\r?\n|\Z)")
+_TAG = re.compile(r"#([A-Za-z0-9_-]++)")
+_IMAGE_WIKI_LINK = re.compile(r"!\[\[([^\|\]]++)\|?+([^\]]++)?+\]\]")
+_IMAGE_EXTERNAL_LINK = re.compile(r"!\[([^\]]++)?+\]\(([^\)\s]++)\)")
+_CALLOUT_START = re.compile(r">(?: )?+\[!([A-Za-z]++)\]\r?\n")
+_CALLOUT_LINE = re.compile(r">[ \t]*+([^\n\r]++)?+\r?\n")
+
+
+def skip_blank_lines(text: str, index: int) -> int:
+    """Equivalent of `blank_line.many()`: returns the index after any blank lines"""
+    return _BLANK_LINES.match(text, index).end()
+
+
+def skip_trailing_whitespace(text: str, index: int) -> int:
+    """Index after any whitespace `document` accepts once its last block ends"""
+    return _TRAILING.match(text, index).end()
+
+
+# --- Block Builders ---
+def _match_header(text: str, index: int) -> Optional[BlockMatch]:
+    match = _HEADER.match(text, index)
+    if match is None:
+        return None
+    level, content = match.groups()
+    return Header, {"level": len(level), "content": content}, match.end()
+
+
+def _match_code_block(text: str, index: int) -> Optional[BlockMatch]:
+    match = scan_code_block(text, index)
+    if match is None:
+        return None
+    language, content, end = match
+    return CodeBlock, {"content": content, "language": language}, end
+
+
+def _match_callout(text: str, index: int) -> Optional[BlockMatch]:
+    callout_type = None
+    start = _CALLOUT_START.match(text, index)
+    if start is not None:
+        callout_type = start.group(1)
+        index = start.end()
+
+    content_lines = []
+    while (line := _CALLOUT_LINE.match(text, index)) is not None:
+        content_lines.append(line.group(1))
+        index = line.end()
+    if not content_lines:
+        return None
+    return Callout, {"type": callout_type, "content": content_lines}, index
+
+
+def _match_list_item(text: str, index: int) -> Optional[BlockMatch]:
+    match = _LIST_ITEM.match(text, index)
+    if match is None:
+        return None
+    indent, content = match.groups()
+    return ListItem, {"level": len(indent) // 2, "content": content}, match.end()
+
+
+def _match_image_link(text: str, index: int) -> Optional[BlockMatch]:
+    match = _IMAGE_WIKI_LINK.match(text, index)
+    if match is not None:
+        path, alt_text = match.groups()
+        fields = {"path": path, "is_external": False, "alt_text": alt_text}
+        return ImageLink, fields, match.end()
+    match = _IMAGE_EXTERNAL_LINK.match(text, index)
+    if match is not None:
+        alt_text, path = match.groups()
+        fields = {"path": path, "is_external": True, "alt_text": alt_text}
+        return ImageLink, fields, match.end()
+    return None
+
+
+def _match_tag(text: str, index: int) -> Optional[BlockMatch]:
+    match = _TAG.match(text, index)
+    if match is None:
+        return None
+    return Tag, {"name": match.group(1)}, match.end()
+
+
+def _match_paragraph(text: str, index: int) -> Optional[BlockMatch]:
+    content_lines = []
+    while (line := _PARAGRAPH_LINE.match(text, index)) is not None:
+        content_lines.append(line.group(1))
+        index = line.end()
+    if not content_lines:
+        return None
+    return Paragraph, {"content": "\n".join(content_lines)}, index
+
+
+# --- Dispatch Tables ---
+# Keyed by the first non-indent character of the block. Candidates keep the
+# relative order of `block = header | code_block | callout | list_item |
+# image_link | tag | paragraph`; `paragraph` never starts on `#`, `>` or `!`.
+Matcher = Callable[[str, int], Optional[BlockMatch]]
+
+_DEFAULT_BLOCKS: Tuple[Matcher, ...] = (_match_paragraph,)
+
+_BLOCKS: Dict[str, Tuple[Matcher, ...]] = {
+    "#": (_match_header, _match_tag),
+    "`": (_match_code_block, _match_paragraph),
+    ">": (_match_callout,),
+    "-": (_match_list_item, _match_paragraph),
+    "!": (_match_image_link,),
+}
+
+# Only `header`, `list_item` and `paragraph` accept leading indentation.
+_INDENTED_BLOCKS: Dict[str, Tuple[Matcher, ...]] = {
+    "#": (_match_header,),
+    ">": (),
+    "-": (_match_list_item, _match_paragraph),
+    "!": (),
+}
+
+
+def match_block(text: str, index: int) -> Optional[BlockMatch]:
+    """
+    Match a single block at `index`.
+
+    Returns the node class, its constructor fields and the end index, or None
+    when no block starts at `index`.
+    """
+    first = _INDENT.match(text, index).end()
+    if first == len(text):
+        return None
+    table = _INDENTED_BLOCKS if first > index else _BLOCKS
+    for matcher in table.get(text[first], _DEFAULT_BLOCKS):
+        match = matcher(text, index)
+        if match is not None:
+            return match
+    return None
+
+
+# --- Document Level Parsers ---
+def _scan_document(stream: str, index: int, build: Callable) -> Result:
+    start = index
+    front = front_matter(stream, index)
+    if front.status:
+        index = front.index
+    index = skip_blank_lines(stream, index)
+
+    nodes = []
+    while (match := match_block(stream, index)) is not None:
+        kind, fields, end = match
+        nodes.append(build(kind, fields))
+        index = skip_blank_lines(stream, end)
+
+    index = skip_trailing_whitespace(stream, index)
+    if index != len(stream):
+        # Let the combinator parser report the failure so errors are identical.
+        return document(stream, start)
+    return Result.success(index, (front.value if front.status else None, nodes))
+
+
+@Parser
+def fast_document(stream: str, index: int) -> Result:
+    """
+    Drop-in replacement for `document` driven by the line dispatch tables.
+    """
+    result = _scan_document(stream, index, lambda kind, fields: kind(**fields))
+    if not result.status:
+        return result
+    front, nodes = result.value
+    blocks = ObsidianMarkdownContent(nodes=nodes)
+    if front is not None:
+        return Result.success(result.index, (front, blocks))
+    return Result.success(result.index, blocks)
+
+
+@Parser
+def compact_document(stream: str, index: int) -> Result:
+    """
+    Like `fast_document`, but builds slotted nodes (see `nodes.py`) in a
+    NodeContent instead of DataType models. Frontmatter stays a FrontMatter.
+    """
+    result = _scan_document(
+        stream, index, lambda kind, fields: NODE_CLASSES[kind](**fields)
+    )
+    if not result.status:
+        return result
+    front, nodes = result.value
+    blocks = NodeContent(nodes=nodes)
+    if front is not None:
+        return Result.success(result.index, (front, blocks))
+    return Result.success(result.index, blocks)
+
+
+# --- Streaming Parser ---
+#
+# A block matched against a prefix of the file is final once the line after
+# it (past any blank lines) is complete in the buffer: apart from code blocks,
+# no builder looks beyond that line, so reading more cannot change the match.
+# An opened fence is only settled by its closing line (or the end of input).
+# Anything short of that is retried after the next read.
+
+_FRONT_MATTER_OPEN = re.compile(r"---\r?\n")
+
+
+def _front_matter_settled(buffer: str) -> bool:
+    """Whether reading more input could change `front_matter` on `buffer`"""
+    opening = _FRONT_MATTER_OPEN.match(buffer)
+    if opening is None:
+        return not ("---\r\n".startswith(buffer) or "---\n".startswith(buffer))
+    # The closing delimiter needs its trailing newline in the buffer too
+    closing = buffer.find("\n---", opening.end())
+    return closing != -1 and len(buffer) >= closing + 6
+
+
+def iter_blocks(
+    source: Union[str, os.PathLike, TextIO], chunk_size: int = 64 * 1024
+) -> Iterator[MarkdownNode]:
+    """
+    Yield the nodes of a markdown document as they are recognized.
+
+    Args:
+        source: Path to a markdown file, or an open text stream
+        chunk_size: Number of characters to read at a time
+
+    Yields:
+        The FrontMatter (if any), then each block node in document order.
+        Nodes are identical to those produced by `document`; only the current
+        block and one chunk of lookahead are held in memory.
+
+    Raises:
+        ParseError: If the document cannot be parsed. Parsing stops at the
+            first failure, after all preceding blocks have been yielded.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "r") as stream:
+            yield from _iter_stream_blocks(stream, chunk_size)
+    else:
+        yield from _iter_stream_blocks(source, chunk_size)
+
+
+def _iter_stream_blocks(stream: TextIO, chunk_size: int) -> Iterator[MarkdownNode]:
+    buffer = ""
+    at_eof = False
+    read_size = chunk_size
+
+    def read_more() -> None:
+        # Double the read size while a single block keeps spanning reads, so
+        # re-matching a huge block stays linear overall.
+        nonlocal buffer, at_eof, read_size
+        chunk = stream.read(read_size)
+        if chunk:
+            buffer += chunk
+            read_size *= 2
+        else:
+            at_eof = True
+
+    while not at_eof and not _front_matter_settled(buffer):
+        read_more()
+    front = front_matter(buffer, 0)
+    index = 0
+    if front.status:
+        yield front.value
+        index = front.index
+
+    while True:
+        index = skip_blank_lines(buffer, index)
+        match = match_block(buffer, index)
+        if match is not None:
+            kind, fields, end = match
+            next_index = skip_blank_lines(buffer, end)
+            settled = buffer.find("\n", next_index) != -1 and (
+                kind is CodeBlock or code_block_open.match(buffer, index) is None
+            )
+            if at_eof or settled:
+                yield kind(**fields)
+                # Drop consumed text once it outweighs a chunk
+                if next_index > chunk_size:
+                    buffer = buffer[next_index:]
+                    next_index = 0
+                index = next_index
+                read_size = chunk_size
+                continue
+        if at_eof:
+            break
+        read_more()
+
+    trailing = skip_trailing_whitespace(buffer, index)
+    if trailing != len(buffer):
+        result = block(buffer, index)
+        raise ParseError(result.expected, buffer, result.furthest)
@@ -0,0 +1,309 @@
+# Imports -----------------------------------------
+import re
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Library Imports ----------------------------------
+from python_parser.src.models.datatypes import DB_Node, DB_Node_Tag, Section_Node
+
+# --- Section Index ---
+#
+# Where each section of a note starts and ends, found in one regex scan over
+# the note for header and fence lines. Nothing is copied: section text is
+# sliced from the note when it is asked for.
+#
+# A section runs from its header line to the next header line (of any level)
+# or the end of the text; the text before the first header is the preamble.
+# Header lines are those `header` matches at the start of a line. Lines in
+# the frontmatter and inside code blocks are not headers, nor is `#tag`. As
+# with `code_block`, a fence opens at a line starting with "```" and closes
+# at the next line that strips to "```"; a fence that is never closed is not
+# a code block, so the headers after it still count. Unlike `document`, a
+# fence right after a paragraph line opens a code block too, as in markdown.
+
+# Constants ---------------------------------------------
+SectionEntry = Tuple[int, int, int, str]  # (start, end, level, title)
+
+# Header and fence lines; a bare fence line (only "```" and whitespace) can
+# close a code block. Past the first line, matching from the newline before a
+# line lets the regex engine skip ahead with a literal search.
+_LINE = (
+    r"(?P<line>[ \t]*+(?P<hashes>#{1,6}+) (?P<title>[^\n\r]++)"
+    r"|(?P<indent>[ \t]*+)```(?P<bare>[^\S\n]*+$)?+)"
+)
+_FIRST_LINE = re.compile(_LINE, re.M)
+_NEXT_LINE = re.compile(f"\n{_LINE}", re.M)
+# A DB node tag in a header, as `db_node_tag` reads it
+_DB_TAG = re.compile(
+    r"%%(?P<node_id>(?:[^|%]|%(?!%))+)\|(?P<git_version>(?:[^|%]|%(?!%))+)\|"
+    r"(?P<node_type>(?:[^%]|%(?!%))+)%%"
+)
+_FRONT_MATTER_OPEN = re.compile(r"---\r?\n")
+_NEWLINE = re.compile(r"\r?\n")
+_LINE_ENDINGS = "\r\n"
+
+
+# Functions ---------------------------------------------
+def front_matter_end(content: str) -> int:
+    """Offset just past the frontmatter block `front_matter` reads, or 0"""
+    opening = _FRONT_MATTER_OPEN.match(content)
+    if opening is None:
+        return 0
+    closing = content.find("\n---", opening.end())
+    if closing == -1:
+        return 0
+    newline = _NEWLINE.match(content, closing + 4)
+    return newline.end() if newline is not None else 0
+
+
+def _header_lines(content: str) -> Iterator[re.Match]:
+    """The header line matches of `content`, skipping code blocks"""
+    start = front_matter_end(content)
+    first = _FIRST_LINE.match(content, start)
+    lines = [first] if first is not None else []
+    lines.extend(_NEXT_LINE.finditer(content, start))
+    closing_fences = [
+        position for position, line in enumerate(lines) if line["bare"] is not None
+    ]
+    fence_end = -1
+    for position, line in enumerate(lines):
+        if position <= fence_end:
+            continue  # Inside a code block, or its closing fence
+        if line["hashes"] is not None:
+            yield line
+        elif not line["indent"]:
+            # `code_block` needs the fence at the line start
+            close = bisect_right(closing_fences, position)
+            if close < len(closing_fences):
+                fence_end = closing_fences[close]
+
+
+def section_index(content: str) -> List[SectionEntry]:
+    """
+    Index the sections of a note.
+
+    Returns:
+        (start, end, level, title) for each header, in order: the offsets of
+        its header line and of the next header line (or the end of the text),
+        the header level and its text without surrounding whitespace.
+    """
+    headers = [
+        (line.start("line"), len(line["hashes"]), line["title"].strip())
+        for line in _header_lines(content)
+    ]
+    ends = [start for start, _, _ in headers[1:]] + [len(content)]
+    return [
+        (start, end, level, title) for (start, level, title), end in zip(headers, ends)
+    ]
+
+
+def preamble_end(content: str, index: List[SectionEntry]) -> int:
+    """End of the text before the first section"""
+    return index[0][0] if index else len(content)
+
+
+def trimmed_end(content: str, start: int, end: int) -> int:
+    """`end` moved back over the line endings before it, but not past `start`"""
+    while end > start and content[end - 1] in _LINE_ENDINGS:
+        end -= 1
+    return end
+
+
+def _next_line(content: str, start: int, end: int) -> int:
+    """Start of the line after the one at `start`, or `end` if it is sooner"""
+    newline = content.find("\n", start, end)
+    return end if newline == -1 else newline + 1
+
+
+def body_start(content: str, entry: SectionEntry) -> int:
+    """Offset of the line after the header line of a section"""
+    return _next_line(content, entry[0], entry[1])
+
+
+def section_text(content: str, entry: SectionEntry) -> str:
+    """A section from its header line on, without trailing line endings"""
+    start, end, _, _ = entry
+    return content[start : trimmed_end(content, start, end)]
+
+
+def section_body(content: str, entry: SectionEntry) -> str:
+    """A section after its header line, without trailing line endings"""
+    start = body_start(content, entry)
+    return content[start : trimmed_end(content, start, entry[1])]
+
+
+def _split_title(header: str) -> Tuple[str, Optional[re.Match]]:
+    """Header text without its DB node tag, and the tag match (if any)"""
+    tag = _DB_TAG.search(header)
+    if tag is None:
+        return header, None
+    return (header[: tag.start()] + header[tag.end() :]).strip(), tag
+
+
+# Classes -----------------------------------------------
+class SectionTree:
+    """
+    Outline of a note: its sections nested by header level.
+
+    Sections are numbered in document order, so the descendants of a section
+    are the sections after it up to `descendants_end[i]`. Parent, first child
+    and next sibling are kept in arrays (-1 for none) and bodies as offsets
+    into `content`; section text and Section_Node models are built only when
+    asked for. Titles have their DB node tag removed.
+
+    Usage:
+        tree = SectionTree(text)
+        outline = tree.find("Goals > Outline")
+        [tree.titles[child] for child in tree.children(outline)]
+        tree.node(tree.find_id(node_id))
+    """
+
+    def __init__(self, content: str, index: Optional[List[SectionEntry]] = None):
+        """
+        Args:
+            content: The note text
+            index: The `section_index` of `content`, if already built
+        """
+        if index is None:
+            index = section_index(content)
+        count = len(index)
+        self.content = content
+        self.levels = array("B", [level for _, _, level, _ in index])
+        self.starts = array("q", [start for start, _, _, _ in index])
+        # The own body runs to the next header, the whole section to the next
+        # header of the same or a higher level
+        self.body_ends = array("q", [end for _, end, _, _ in index])
+        self.ends = array("q", [len(content)]) * count
+        self.descendants_end = array("q", [count]) * count
+        self.parents = array("q", [-1]) * count
+        self.first_children = array("q", [-1]) * count
+        self.next_siblings = array("q", [-1]) * count
+        self.titles: List[str] = []
+        self.tags: List[Optional[Tuple[str, str, str]]] = []
+        self._paths: List[Tuple[str, ...]] = []
+        self._by_path: Dict[Tuple[str, ...], int] = {}
+        self._by_id: Dict[str, int] = {}
+
+        # One pass with the stack of open sections; slot 0 of `last_children`
+        # is the top level
+        open_sections: List[int] = []
+        last_children = array("q", [-1]) * (count + 1)
+        for section, (start, _, level, header) in enumerate(index):
+            while open_sections and self.levels[open_sections[-1]] >= level:
+                closed = open_sections.pop()
+                self.ends[closed] = start
+                self.descendants_end[closed] = section
+            parent = open_sections[-1] if open_sections else -1
+            self.parents[section] = parent
+            previous = last_children[parent + 1]
+            if previous != -1:
+                self.next_siblings[previous] = section
+            elif parent != -1:
+                self.first_children[parent] = section
+            last_children[parent + 1] = section
+            open_sections.append(section)
+
+            title, tag = _split_title(header)
+            self.titles.append(title)
+            self.tags.append(
+                tag.group("node_id", "git_version", "node_type") if tag else None
+            )
+            if tag is not None:
+                self._by_id.setdefault(tag["node_id"], section)
+            path = (self._paths[parent] if parent != -1 else ()) + (title,)
+            self._paths.append(path)
+            self._by_path.setdefault(path, section)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    # --- Navigation ---
+    def roots(self) -> Iterator[int]:
+        """The top-level sections"""
+        section = 0 if len(self) else -1
+        while section != -1:
+            yield section
+            section = self.next_siblings[section]
+
+    def children(self, section: int) -> Iterator[int]:
+        child = self.first_children[section]
+        while child != -1:
+            yield child
+            child = self.next_siblings[child]
+
+    def ancestors(self, section: int) -> Iterator[int]:
+        """The parent of a section, its parent, and so on"""
+        parent = self.parents[section]
+        while parent != -1:
+            yield parent
+            parent = self.parents[parent]
+
+    def path(self, section: int) -> str:
+        """Titles from the top level down to a section, as "Goals > Outline\""""
+        return " > ".join(self._paths[section])
+
+    # --- Lookup ---
+    def find(self, path: Union[str, Sequence[str]]) -> Optional[int]:
+        """
+        The first section at a path of titles.
+
+        Args:
+            path: "Goals > Outline", or the titles as a sequence (for titles
+                containing ">")
+
+        Returns:
+            The section, or None if no section has that path.
+        """
+        if isinstance(path, str):
+            path = [title.strip() for title in path.split(">")]
+        return self._by_path.get(tuple(path))
+
+    def find_id(self, node_id: str) -> Optional[int]:
+        """The first section whose header has the DB node tag `node_id`"""
+        return self._by_id.get(node_id)
+
+    def at(self, offset: int) -> Optional[int]:
+        """The innermost section containing an offset, None in the preamble"""
+        section = bisect_right(self.starts, offset) - 1
+        return section if section >= 0 else None
+
+    # --- Content ---
+    def body(self, section: int) -> str:
+        """
+        A section's own text: after its header line, up to its first
+        subsection, without trailing line endings.
+        """
+        end = self.body_ends[section]
+        start = _next_line(self.content, self.starts[section], end)
+        return self.content[start : trimmed_end(self.content, start, end)]
+
+    def text(self, section: int) -> str:
+        """A section with its header line and subsections"""
+        start, end = self.starts[section], self.ends[section]
+        return self.content[start : trimmed_end(self.content, start, end)]
+
+    def node(self, section: int) -> Section_Node:
+        """
+        A Section_Node for a section, with its own body as content. As in
+        `section`, an untagged header gets a new Section_Node tag; it is kept,
+        so later calls return the same id.
+        """
+        tag = self.tags[section]
+        if tag is None:
+            header_node = DB_Node(node_tag=None, content=self.titles[section])
+            header_node.generate_tag("Section_Node")
+            generated = header_node.node_tag
+            tag = (generated.node_id, generated.git_version, generated.node_type)
+            self.tags[section] = tag
+            self._by_id.setdefault(generated.node_id, section)
+        node_id, git_version, node_type = tag
+        node_tag = DB_Node_Tag(
+            node_id=node_id, git_version=git_version, node_type=node_type
+        )
+        return Section_Node(
+            level=self.levels[section],
+            node_tag=node_tag,
+            label=self.titles[section],
+            content=self.body(section),
+        )
@@ -0,0 +1,145 @@
+# Imports -----------------------------------------
+import copy
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import yaml
+from yaml.constructor import SafeConstructor
+from yaml.nodes import ScalarNode
+from yaml.resolver import Resolver
+
+# --- YAML Loading ---
+#
+# Frontmatter is loaded with the libyaml-backed CSafeLoader when PyYAML was
+# built with it (the Python loader still takes text with tabs, which libyaml
+# is more lenient about). Most notes only hold flat `key: scalar` and `key: [a, b]`
+# lines; those are split with regexes and each scalar is resolved and
+# constructed with PyYAML's own safe resolver and constructors, so the result
+# is the one `yaml.safe_load` gives. Anything else goes to the full loader.
+# Templates produce many identical headers, so results are memoized on the
+# raw text and every caller gets its own copy.
+
+# Constants ---------------------------------------------
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+MEMO_SIZE = 4096
+
+STR_TAG = "tag:yaml.org,2002:str"
+_resolver = Resolver()
+_constructor = SafeConstructor()
+_constructors = SafeConstructor.yaml_constructors
+
+# `key: value` with a plain key and nothing but spaces around the separator
+_FLAT_LINE = re.compile(r"([A-Za-z_][\w. -]*?) *:(?: +(.*?))? *")
+# First characters that start something other than a plain scalar
+_INDICATORS = frozenset("[]{}#&*!|>'\"%@`,?:")
+_DOUBLE_QUOTED = re.compile(r'"([^"\\]*)"')
+_SINGLE_QUOTED = re.compile(r"'([^']*)'")
+_IMMUTABLE = (str, int, float, bool, type(None), date, datetime)
+
+
+class _NotFlat(Exception):
+    """The text needs the full YAML loader"""
+
+
+# Functions ---------------------------------------------
+def _plain_scalar(text: str, in_flow: bool) -> Any:
+    """Resolve and construct a plain scalar the way the safe loader does"""
+    if (
+        text[:1] in _INDICATORS
+        or (text[:1] == "-" and text[1:2] in ("", " "))
+        or ": " in text
+        or " #" in text
+        or text.endswith(":")
+        or (in_flow and any(char in text for char in "[]{},"))
+    ):
+        raise _NotFlat
+    tag = _resolver.resolve(ScalarNode, text, (True, False))
+    constructor = _constructors.get(tag)
+    if constructor is None:
+        raise _NotFlat
+    return constructor(_constructor, ScalarNode(tag, text))
+
+
+def _scalar(text: str, in_flow: bool = False) -> Any:
+    quoted = _DOUBLE_QUOTED.fullmatch(text) or _SINGLE_QUOTED.fullmatch(text)
+    if quoted:
+        return quoted.group(1)
+    return _plain_scalar(text, in_flow)
+
+
+def _value(text: Optional[str]) -> Any:
+    if not text:
+        return None
+    if text[0] == "[":
+        if text[-1] != "]":
+            raise _NotFlat
+        inner = text[1:-1].strip()
+        if not inner:
+            return []
+        items = [item.strip() for item in inner.split(",")]
+        if not all(items):
+            raise _NotFlat
+        return [_scalar(item, in_flow=True) for item in items]
+    return _scalar(text)
+
+
+def load_flat(text: str) -> Dict[str, Any]:
+    """
+    Load YAML made only of flat `key: scalar` / `key: [scalars]` lines.
+
+    Raises:
+        _NotFlat: If the text uses any other YAML construct.
+    """
+    result = {}
+    for line in text.split("\n"):
+        if line.endswith("\r"):
+            line = line[:-1]
+        # Before skipping blank lines, since YAML rejects a line of only tabs
+        if "\t" in line or not line.isprintable():
+            raise _NotFlat
+        if not line.strip() or line.startswith("#"):
+            continue
+        match = _FLAT_LINE.fullmatch(line)
+        if match is None:
+            raise _NotFlat
+        key = match.group(1)
+        if _resolver.resolve(ScalarNode, key, (True, False)) != STR_TAG:
+            raise _NotFlat
+        result[key] = _value(match.group(2))
+    # Like the loaders, an empty document (or only comments) loads as None
+    return result or None
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _load_memoized(text: str) -> Any:
+    try:
+        return load_flat(text)
+    except _NotFlat:
+        # libyaml accepts some tabs the Python loader rejects; keep its errors
+        loader = yaml.SafeLoader if "\t" in text else SafeLoader
+        return yaml.load(text, Loader=loader)
+
+
+def _copy(value: Any) -> Any:
+    if type(value) is dict:
+        return {key: _copy(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy(item) for item in value]
+    if isinstance(value, _IMMUTABLE):
+        return value
+    return copy.deepcopy(value)
+
+
+def load_yaml(text: str) -> Any:
+    """
+    Drop-in for `yaml.safe_load` on frontmatter text.
+
+    Returns:
+        The loaded value, a fresh copy that the caller may modify.
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML.
+    """
+    return _copy(_load_memoized(text))
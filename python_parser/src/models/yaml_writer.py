@@ -0,0 +1,227 @@
+# Imports -----------------------------------------
+import re
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+# Library Imports ----------------------------------
+from python_parser.src.models.yaml_loader import _NotFlat, _plain_scalar, load_yaml
+
+# --- YAML Writing ---
+#
+# Frontmatter is written back entry by entry. A top-level key whose value is
+# unchanged since parsing keeps its original text, comments and blank lines
+# stay where they were, and only changed or new keys are rendered, so a write
+# is the smallest diff of the header. Scalars and flat lists that read back
+# as themselves are emitted directly; anything else goes through
+# `yaml.safe_dump`.
+
+# Constants ---------------------------------------------
+DUMP_OPTIONS = {"sort_keys": False, "allow_unicode": True, "width": float("inf")}
+
+# Lines that continue the entry above: indented, `- ` sequence items or blank
+_CONTINUATION = re.compile(r"[ \t]|-(?:[ \t]|$)|\s*$")
+_COMMENT = re.compile(r"\s*#")
+# A `|` or `>` block scalar header, whose value depends on what follows it
+_BLOCK_SCALAR = re.compile(r"[|>][-+0-9]*[ \t]*(?:#.*)?$", re.MULTILINE)
+
+
+# Functions ---------------------------------------------
+def _emit_scalar(value: Any, in_flow: bool = False) -> Optional[str]:
+    """Plain YAML text that loads back as `value`, or None"""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if type(value) is int:
+        return str(value)
+    if type(value) is date:
+        text = value.isoformat()
+    elif type(value) is datetime:
+        text = value.isoformat(" ")
+    elif type(value) is str:
+        text = value
+    else:
+        return None
+    if not text or text != text.strip() or "\n" in text or "\t" in text:
+        return None
+    try:
+        loaded = _plain_scalar(text, in_flow)
+    except _NotFlat:
+        return None
+    return text if type(loaded) is type(value) and loaded == value else None
+
+
+def _emit_flat(value: Any) -> Optional[str]:
+    if isinstance(value, list):
+        items = [_emit_scalar(item, in_flow=True) for item in value]
+        if None in items:
+            return None
+        return "[" + ", ".join(items) + "]"
+    return _emit_scalar(value)
+
+
+def render_entry(key: Any, value: Any) -> str:
+    """YAML text, ending in a newline, for one top-level `key: value` entry"""
+    value_text = _emit_flat(value)
+    if value_text is not None:
+        key_text = _emit_scalar(key)
+        if key_text is None or ":" in key_text:
+            key_text = yaml.safe_dump([key], default_flow_style=True, **DUMP_OPTIONS)
+            key_text = key_text[1:-2]
+        return f"{key_text}: {value_text}\n"
+
+    nested = isinstance(value, dict) or (
+        isinstance(value, list)
+        and any(isinstance(item, (dict, list)) for item in value)
+    )
+    if nested:
+        return yaml.safe_dump({key: value}, default_flow_style=False, **DUMP_OPTIONS)
+    # Scalars and flat lists stay on the key's line, e.g. `tags: [a, b]`
+    text = yaml.safe_dump({key: value}, default_flow_style=True, **DUMP_OPTIONS)
+    return text[1:-2] + "\n"
+
+
+def split_entries(text: str) -> Optional[List[Tuple[bool, Any, str]]]:
+    """
+    Split a YAML mapping into its top-level entries.
+
+    Returns:
+        A list of (is_entry, key, text) parts covering the whole text, where
+        the comment and blank lines between entries are parts with is_entry
+        False, or None if the text is not a block mapping whose entries each
+        load on their own.
+    """
+    parts: List[Tuple[bool, List[str]]] = []
+    for line in text.splitlines(keepends=True):
+        if _COMMENT.match(line) or not line.strip():
+            # Indented comments and blank lines may still be inside an entry
+            if parts and parts[-1][0] and _CONTINUATION.match(line):
+                parts[-1][1].append(line)
+            else:
+                parts.append((False, [line]))
+        elif _CONTINUATION.match(line):
+            if not parts or not parts[-1][0]:
+                return None
+            parts[-1][1].append(line)
+        else:
+            parts.append((True, [line]))
+
+    entries = []
+    for is_entry, lines in parts:
+        if not is_entry:
+            entries.append((False, None, "".join(lines)))
+            continue
+        # Trailing blank and comment lines go between entries
+        end = len(lines)
+        while end > 1 and (
+            not lines[end - 1].strip() or _COMMENT.match(lines[end - 1])
+        ):
+            end -= 1
+        entry_text = "".join(lines[:end])
+        try:
+            loaded = load_yaml(entry_text)
+        except yaml.YAMLError:
+            return None
+        if not isinstance(loaded, dict) or len(loaded) != 1:
+            return None
+        entries.append((True, next(iter(loaded)), entry_text))
+        if end < len(lines):
+            entries.append((False, None, "".join(lines[end:])))
+    return entries
+
+
+def _same(left: Any, right: Any) -> bool:
+    # `1 == True` and `1 == 1.0`, but they are written differently
+    if type(left) is not type(right):
+        return False
+    if isinstance(left, dict):
+        return list(left) == list(right) and all(
+            _same(left[key], right[key]) for key in left
+        )
+    if isinstance(left, list):
+        return len(left) == len(right) and all(map(_same, left, right))
+    return left == right
+
+
+def _join_entries(
+    entries: List[Tuple[bool, Any, str]],
+    content: Dict[Any, Any],
+    original: Dict[Any, Any],
+    final_newline: bool,
+    keep_blocks: bool,
+) -> Optional[str]:
+    parts = []
+    kept_block = False
+    for is_entry, key, text in entries:
+        if is_entry and key not in content:
+            continue
+        if is_entry and not _same(content[key], original[key]):
+            text = render_entry(key, content[key])
+        elif is_entry and _BLOCK_SCALAR.search(text):
+            if not keep_blocks:
+                text = render_entry(key, content[key])
+            kept_block = keep_blocks
+        parts.append(text if text.endswith("\n") else text + "\n")
+    parts.extend(
+        render_entry(key, value)
+        for key, value in content.items()
+        if key not in original
+    )
+    text = "".join(parts)
+    text = text if final_newline else text[:-1]
+    if kept_block:
+        loaded = load_yaml(text) or {}
+        if loaded.keys() != content.keys() or not all(
+            _same(loaded[key], value) for key, value in content.items()
+        ):
+            return None
+    return text
+
+
+def _patch_entries(
+    content: Dict[Any, Any], source: str, original: Dict[Any, Any]
+) -> Optional[str]:
+    entries = split_entries(source)
+    if entries is None:
+        return None
+    keys = [key for is_entry, key, _ in entries if is_entry]
+    if len(set(keys)) != len(keys) or set(keys) != set(original):
+        return None
+
+    final_newline = source.endswith("\n")
+    text = _join_entries(entries, content, original, final_newline, keep_blocks=True)
+    if text is None:
+        # A kept block scalar reads differently once it is (or stops being)
+        # last, so render those entries afresh too
+        text = _join_entries(
+            entries, content, original, final_newline, keep_blocks=False
+        )
+    return text
+
+
+def dump_frontmatter(
+    content: Dict[Any, Any],
+    source: Optional[str] = None,
+    original: Optional[Dict[Any, Any]] = None,
+) -> str:
+    """
+    YAML text for frontmatter content.
+
+    Args:
+        content: The frontmatter mapping to write
+        source: The YAML text the content was parsed from, if any
+        original: The mapping `source` loaded as
+
+    Returns:
+        The YAML text, without a trailing newline unless `source` had one.
+        Entries whose value still equals the original keep their source text.
+    """
+    if source is not None and original is not None:
+        if _same(content, original):
+            return source
+        text = _patch_entries(content, source, original)
+        if text is not None:
+            return text
+    return "".join(render_entry(key, value) for key, value in content.items())[:-1]
@@ -0,0 +1,236 @@
+# Imports -----------------------------------------
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from parsy import Parser
+
+# Library Imports ----------------------------------
+from python_parser.src.models import parsers as parsers_module
+from python_parser.src.vault import VaultParseResult, parse_vault_file
+
+# --- Parser Profiling ---
+#
+# Parsy parsers are objects whose `wrapped_fn` does the work, and combinators
+# (`|`, `.many()`, `yield` in `@generate`) hold on to the parser objects. So a
+# profile swaps the `wrapped_fn` of each module-level parser in `parsers` for a
+# counting, timing wrapper, and every use of that parser anywhere in the
+# grammar goes through it. Disabling puts the original functions back, so a
+# parser that is not being profiled runs exactly the code it always did.
+#
+# The wrappers are process wide: profile one parse at a time, in the process
+# doing the parsing (not in `parse_vault`'s worker processes).
+
+# Constants ---------------------------------------------
+PROFILED_PARSERS = (
+    "document",
+    "front_matter",
+    "header",
+    "code_block",
+    "fast_code_block",
+    "callout",
+    "list_item",
+    "paragraph",
+    "image_link",
+    "image_wiki_link",
+    "image_external_link",
+    "tag",
+    "wiki_link",
+    "external_link",
+    "inline_code",
+    "db_node_tag",
+    "db_node",
+    "db_nodes",
+    "section",
+)
+
+
+# Classes -----------------------------------------------
+@dataclass
+class ParserStats:
+    """
+    Counters for one parser.
+
+    Attributes:
+        calls: Times the parser was tried
+        successes: Calls that matched
+        backtracks: Calls that failed, after which the caller tried something
+            else from the same position (an alternative, `optional`, `many`)
+        seconds: Time spent in the parser, including the parsers it calls.
+            Recursive calls are only timed once, at the outermost call.
+    """
+
+    calls: int = 0
+    successes: int = 0
+    backtracks: int = 0
+    seconds: float = 0.0
+
+    def record(self, success: bool, seconds: float) -> None:
+        self.calls += 1
+        if success:
+            self.successes += 1
+        else:
+            self.backtracks += 1
+        self.seconds += seconds
+
+    @property
+    def mean_us(self) -> float:
+        return self.seconds / self.calls * 1_000_000 if self.calls else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "successes": self.successes,
+            "backtracks": self.backtracks,
+            "seconds": self.seconds,
+        }
+
+
+class ParserProfile:
+    """
+    Opt-in instrumentation of the exported parsers.
+
+    Usage:
+        with ParserProfile() as profile:
+            for path in paths:
+                with profile.file(path):
+                    document.parse(read(path))
+        print(profile.format())
+        profile.report()  # {"parsers": {...}, "files": {path: {...}}}
+    """
+
+    def __init__(self, names: Iterable[str] = PROFILED_PARSERS):
+        """
+        Args:
+            names: Names of the module-level parsers in `parsers` to profile
+        """
+        self.names = list(names)
+        for name in self.names:
+            if not isinstance(getattr(parsers_module, name, None), Parser):
+                raise ValueError(f"\nNot a parser in the parsers module: {name}\n\n")
+        self.parsers: Dict[str, ParserStats] = {
+            name: ParserStats() for name in self.names
+        }
+        self.files: Dict[str, Dict[str, ParserStats]] = {}
+        self._file: Optional[Dict[str, ParserStats]] = None
+        self._originals: Dict[str, Callable] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._originals)
+
+    def enable(self) -> None:
+        if self.enabled:
+            raise ValueError("\nParser profile is already enabled\n\n")
+        for name in self.names:
+            parser = getattr(parsers_module, name)
+            self._originals[name] = parser.wrapped_fn
+            parser.wrapped_fn = self._wrap(name, parser.wrapped_fn)
+
+    def disable(self) -> None:
+        for name, wrapped_fn in self._originals.items():
+            getattr(parsers_module, name).wrapped_fn = wrapped_fn
+        self._originals = {}
+
+    def __enter__(self) -> "ParserProfile":
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.disable()
+
+    def _wrap(self, name: str, wrapped_fn: Callable) -> Callable:
+        stats = self.parsers[name]
+        depth = 0
+
+        def profiled(stream, index):
+            nonlocal depth
+            depth += 1
+            start = perf_counter()
+            try:
+                result = wrapped_fn(stream, index)
+            finally:
+                depth -= 1
+            seconds = perf_counter() - start if depth == 0 else 0.0
+            stats.record(result.status, seconds)
+            if self._file is not None:
+                file_stats = self._file.get(name)
+                if file_stats is None:
+                    file_stats = self._file[name] = ParserStats()
+                file_stats.record(result.status, seconds)
+            return result
+
+        return profiled
+
+    @contextmanager
+    def file(self, path: str) -> Iterator[None]:
+        """Also count the parser calls made inside the block against `path`"""
+        previous = self._file
+        self._file = self.files.setdefault(path, {})
+        try:
+            yield
+        finally:
+            self._file = previous
+
+    def file_seconds(self, path: str) -> float:
+        # The outermost parser's time covers all the others
+        return max((stats.seconds for stats in self.files[path].values()), default=0.0)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Returns:
+            {"parsers": {name: counters}, "files": {path: {name: counters}}},
+            with the counters of `ParserStats.as_dict` and only the parsers
+            that were called.
+        """
+        return {
+            "parsers": {
+                name: stats.as_dict()
+                for name, stats in self.parsers.items()
+                if stats.calls
+            },
+            "files": {
+                path: {name: stats.as_dict() for name, stats in file_stats.items()}
+                for path, file_stats in self.files.items()
+            },
+        }
+
+    def format(self, top_files: int = 10) -> str:
+        """A table of the called parsers, slowest first, and the slowest files"""
+        lines = [
+            f"  {'parser':<22}{'calls':>10}{'matched':>10}{'backtracks':>12}"
+            f"{'total ms':>11}{'mean us':>10}"
+        ]
+        called = [(name, stats) for name, stats in self.parsers.items() if stats.calls]
+        for name, stats in sorted(called, key=lambda item: -item[1].seconds):
+            lines.append(
+                f"  {name:<22}{stats.calls:10,d}{stats.successes:10,d}"
+                f"{stats.backtracks:12,d}{stats.seconds * 1000:11.2f}"
+                f"{stats.mean_us:10.1f}"
+            )
+        if self.files and top_files:
+            lines.append("")
+            lines.append("  Slowest files:")
+            slowest = sorted(self.files, key=self.file_seconds, reverse=True)
+            for path in slowest[:top_files]:
+                lines.append(f"  {self.file_seconds(path) * 1000:10.2f} ms  {path}")
+        return "\n".join(lines)
+
+
+# Functions ---------------------------------------------
+def profile_files(
+    file_paths: Iterable[str], use_scanner: bool = False
+) -> Tuple[List[VaultParseResult], ParserProfile]:
+    """
+    Parse files in this process with every exported parser profiled.
+
+    Returns:
+        The result for each file, as `parse_vault` gives them, and the profile.
+    """
+    results = []
+    with ParserProfile() as profile:
+        for file_path in file_paths:
+            with profile.file(file_path):
+                results.append(parse_vault_file(file_path, use_scanner=use_scanner))
+    return results, profile
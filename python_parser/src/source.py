@@ -0,0 +1,154 @@
+# Imports -----------------------------------------
+import mmap
+import re
+from typing import Iterator, List, Optional, Tuple
+
+
+# Constants ---------------------------------------------
+FRONTMATTER_OPEN = re.compile(rb"---\r?\n")
+# `#` + word like the `tag` parser, at the start of a line or after whitespace
+TAG_PATTERN = re.compile(rb"(?<!\S)#([A-Za-z0-9_-]+)")
+# Fences as `code_block` reads them: an opening line starting with "```" and
+# a closing line that strips to "```"
+FENCE_OPEN = re.compile(rb"^```[^\n\r]*+\r?\n", re.MULTILINE)
+FENCE_CLOSE = re.compile(rb"\n[^\S\r\n]*+```[^\S\r\n]*+(?=[\r\n]|\Z)")
+
+
+# Functions ---------------------------------------------
+def decode_text(data) -> str:
+    """
+    Decode UTF-8 bytes the way `open(path, "r").read()` would, including the
+    universal newline translation.
+    """
+    text = str(data, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def frontmatter_span(data, start: int = 0) -> Optional[Tuple[int, int, int]]:
+    """
+    Locate the frontmatter block in a bytes-like buffer.
+
+    Follows the `front_matter` parser: an opening `---` line, then everything up
+    to the first line starting with `---`, which must be exactly `---`.
+
+    Returns:
+        (content_start, content_end, end) byte offsets of the YAML text and of
+        the first byte after the closing delimiter line, or None.
+    """
+    opening = FRONTMATTER_OPEN.match(data, start)
+    if opening is None:
+        return None
+    content_start = opening.end()
+    closing = data.find(b"\n---", content_start)
+    if closing == -1:
+        return None
+    delimiter = FRONTMATTER_OPEN.match(data, closing + 1)
+    if delimiter is None:
+        return None
+    content_end = closing
+    if content_end > content_start and data[content_end - 1 : content_end] == b"\r":
+        content_end -= 1
+    return content_start, content_end, delimiter.end()
+
+
+# Classes -----------------------------------------------
+class MappedFile:
+    """
+    Read-only memory map of a file.
+
+    The bytes are only paged in and decoded for the regions that are actually
+    consumed, so frontmatter or tag scans over a large vault touch a fraction
+    of each file and never hold a second full copy of it in memory.
+
+    Usage:
+        with MappedFile(path) as source:
+            header = source.frontmatter()
+            tags = source.tags()
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._file = open(file_path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._map = b""
+        except BaseException:
+            self._file.close()
+            raise
+        self.view = memoryview(self._map)
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __enter__(self) -> "MappedFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.view.release()
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def find(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        """Byte offset of the first occurrence of `sub`, or -1"""
+        end = len(self) if end is None else end
+        return self._map.find(sub, start, end)
+
+    def finditer(
+        self, pattern: re.Pattern, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[re.Match]:
+        """Run a compiled bytes pattern over the mapped bytes without decoding them"""
+        end = len(self) if end is None else end
+        return pattern.finditer(self._map, start, end)
+
+    def decode(self, start: int = 0, end: Optional[int] = None) -> str:
+        """Decode the bytes in [start, end) to text"""
+        end = len(self) if end is None else end
+        return decode_text(self.view[start:end])
+
+    def frontmatter(self) -> Optional[Tuple[str, int]]:
+        """
+        Decode only the frontmatter YAML text.
+
+        Returns:
+            (yaml_text, content_offset), where content_offset is the byte offset
+            at which the markdown content begins, or None without frontmatter.
+        """
+        span = frontmatter_span(self._map)
+        if span is None:
+            return None
+        content_start, content_end, end = span
+        return self.decode(content_start, content_end), end
+
+    def prose_spans(self, start: int = 0) -> Iterator[Tuple[int, int]]:
+        """Byte spans from `start` on that are outside fenced code blocks"""
+        index = start
+        while (fence := FENCE_OPEN.search(self._map, index)) is not None:
+            # Start on the opening line's newline so an empty body still matches
+            closing = FENCE_CLOSE.search(self._map, fence.end() - 1)
+            if closing is None:
+                # An unclosed fence is a paragraph, and nothing later closes
+                break
+            yield index, fence.start()
+            index = closing.end()
+        yield index, len(self)
+
+    def tags(self) -> List[str]:
+        """
+        Names of the `#tags` in the markdown content, decoding only the matched
+        names. The frontmatter and fenced code are skipped.
+        """
+        span = frontmatter_span(self._map)
+        start = span[2] if span is not None else 0
+        return [
+            decode_text(match.group(1))
+            for begin, end in self.prose_spans(start)
+            for match in self.finditer(TAG_PATTERN, begin, end)
+        ]
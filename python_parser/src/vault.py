@@ -0,0 +1,140 @@
+# Imports -----------------------------------------
+import concurrent.futures
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+# Library Imports ----------------------------------
+from python_parser.src.base import ObsidianParserBase
+from python_parser.src.cache import ParseCache
+from python_parser.src.models import (
+    FrontMatter,
+    ObsidianFile,
+    ObsidianMarkdownContent,
+    document,
+)
+from python_parser.src.models.compact import CompactNode, compact_node, expand_node
+
+
+# Classes -----------------------------------------------
+@dataclass
+class VaultParseResult:
+    """
+    Picklable outcome of parsing one vault file.
+
+    Nodes are kept as compact records so results cross process boundaries
+    cheaply; `to_obsidian_file` rebuilds the full models.
+    """
+
+    path: str
+    frontmatter: Optional[Dict[str, Any]] = None
+    nodes: List[CompactNode] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def to_obsidian_file(self) -> ObsidianFile:
+        frontmatter = None
+        if self.frontmatter is not None:
+            frontmatter = FrontMatter(content=self.frontmatter)
+        content = ObsidianMarkdownContent(
+            nodes=[expand_node(record) for record in self.nodes]
+        )
+        return ObsidianFile(frontmatter=frontmatter, content=content)
+
+
+# Worker ------------------------------------------------
+# One parser per worker process and configuration, built on first use
+_parsers: Dict[tuple, ObsidianParserBase] = {}
+
+
+def _worker_parser(use_scanner: bool, cache_dir: Optional[str]) -> ObsidianParserBase:
+    parser = _parsers.get((use_scanner, cache_dir))
+    if parser is None:
+        parser = ObsidianParserBase(
+            content_parser=document,
+            use_scanner=use_scanner,
+            cache=ParseCache(cache_dir) if cache_dir else None,
+        )
+        _parsers[(use_scanner, cache_dir)] = parser
+    return parser
+
+
+def _vault_result(file_path: str, parse: Callable[[], ObsidianFile]) -> VaultParseResult:
+    try:
+        parsed = parse()
+        if parsed is None:
+            return VaultParseResult(path=file_path, error="Parser returned no result")
+        frontmatter = parsed.frontmatter.content if parsed.frontmatter else None
+        nodes = [compact_node(node) for node in parsed.content.nodes]
+        return VaultParseResult(path=file_path, frontmatter=frontmatter, nodes=nodes)
+    except Exception as e:
+        return VaultParseResult(path=file_path, error=f"{type(e).__name__}: {e}")
+
+
+def parse_vault_file(
+    file_path: str, use_scanner: bool = False, cache_dir: Optional[str] = None
+) -> VaultParseResult:
+    """Parse a single file, capturing any error in the result instead of raising"""
+    parser = _worker_parser(use_scanner, cache_dir)
+    return _vault_result(file_path, lambda: parser(file_path))
+
+
+def parse_vault_text(
+    file_path: str, text: str, use_scanner: bool = False
+) -> VaultParseResult:
+    """Like `parse_vault_file`, for file contents that have already been read"""
+    parser = _worker_parser(use_scanner, None)
+    return _vault_result(file_path, lambda: parser.parse_text(text, file_path))
+
+
+def _parse_vault_file(args: tuple) -> VaultParseResult:
+    return parse_vault_file(*args)
+
+
+# Functions ---------------------------------------------
+def list_vault_files(directory: str, recursive: bool = True) -> List[str]:
+    """Sorted paths of all markdown files in a vault directory"""
+    if not recursive:
+        return sorted(
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.endswith(".md")
+        )
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [name for name in dirs if not name.startswith(".")]
+        paths.extend(os.path.join(root, name) for name in files if name.endswith(".md"))
+    return sorted(paths)
+
+
+def parse_vault(
+    directory: str,
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+    recursive: bool = True,
+    use_scanner: bool = False,
+    cache_dir: Optional[str] = None,
+) -> List[VaultParseResult]:
+    """
+    Parse every markdown file in a vault across a pool of worker processes.
+
+    Args:
+        directory: Vault root directory
+        workers: Number of worker processes (defaults to the CPU count); 1 parses
+            in the calling process
+        chunksize: Number of files handed to a worker per submission
+        recursive: Include subdirectories (hidden directories are skipped)
+        use_scanner: Parse content with `fast_document`
+        cache_dir: Directory of a ParseCache shared by the workers
+
+    Returns:
+        One VaultParseResult per file, in path order. Files that fail to parse
+        carry an `error` message; they never abort the batch.
+    """
+    paths = list_vault_files(directory, recursive=recursive)
+    tasks = [(path, use_scanner, cache_dir) for path in paths]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) <= 1:
+        return [_parse_vault_file(task) for task in tasks]
+    # Looked up here: concurrent.futures imports multiprocessing on first use
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_parse_vault_file, tasks, chunksize=chunksize))
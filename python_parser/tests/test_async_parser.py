@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+from python_parser.src.async_parser import AsyncObsidianParser
+from python_parser.src.vault import parse_vault_file
+
+NOTES = {
+    f"note_{i}.md": f"---\ntitle: Note {i}\nstatus: new\n---\n# Note {i}\n- item\n"
+    for i in range(12)
+}
+NOTES["bad.md"] = "---\ntitle: Bad\n---\n  > indented\n"
+
+
+def write_vault(directory):
+    paths = []
+    for name, text in NOTES.items():
+        (directory / name).write_text(text)
+        paths.append(str(directory / name))
+    return paths
+
+
+async def collect(parser, paths, concurrency):
+    return [result async for result in parser.parse_many(paths, concurrency)]
+
+
+@pytest.mark.parametrize("parse_workers", [0, 2])
+def test_parse_many_matches_parse_vault_file(tmp_path, parse_workers):
+    paths = write_vault(tmp_path)
+    paths.append(str(tmp_path / "missing.md"))
+
+    async def run():
+        async with AsyncObsidianParser(parse_workers=parse_workers) as parser:
+            return await collect(parser, paths, concurrency=4)
+
+    results = {result.path: result for result in asyncio.run(run())}
+    assert sorted(results) == sorted(paths)
+    for path in paths[:-1]:
+        assert results[path] == parse_vault_file(path)
+    assert results[str(tmp_path / "bad.md")].error.startswith("ParseError")
+    assert results[str(tmp_path / "missing.md")].error.startswith("FileNotFoundError")
+
+
+def test_parse_many_frontmatter_only(tmp_path):
+    paths = write_vault(tmp_path)
+
+    async def run():
+        async with AsyncObsidianParser(frontmatter_only=True) as parser:
+            return await collect(parser, paths, concurrency=3)
+
+    results = {result.path: result for result in asyncio.run(run())}
+    assert results[paths[0]].frontmatter == {"title": "Note 0", "status": "new"}
+    assert results[paths[0]].nodes == []
+    assert results[str(tmp_path / "bad.md")].error is None
+
+
+def test_parse_many_applies_backpressure(tmp_path):
+    paths = write_vault(tmp_path)
+    consumed = []
+
+    def lazy_paths():
+        for path in paths:
+            consumed.append(path)
+            yield path
+
+    async def run():
+        async with AsyncObsidianParser(parse_workers=0) as parser:
+            results = parser.parse_many(lazy_paths(), concurrency=2)
+            first = await results.__anext__()
+            started = len(consumed)
+            await results.aclose()
+            return first, started
+
+    first, started = asyncio.run(run())
+    assert first.error is None
+    # Only the in-flight window plus one refill has been pulled from the paths
+    assert started <= 3
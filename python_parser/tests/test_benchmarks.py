@@ -0,0 +1,70 @@
+import pytest
+from python_parser.benchmarks.suite import (
+    CaseResult,
+    check_regressions,
+    load_baseline,
+    save_baseline,
+)
+from python_parser.benchmarks.timing import Stats, measure
+from python_parser.benchmarks.vault_gen import (
+    VaultSpec,
+    generate_db_nodes,
+    generate_note,
+    generate_vault,
+)
+from python_parser.src.models import db_nodes, document
+
+
+def result(name, seconds, size=1_000_000):
+    stats = Stats(seconds, seconds, seconds, seconds, 0.0, 1)
+    return CaseResult(name, size, stats, peak_bytes=2048)
+
+
+def test_vault_generator_is_deterministic():
+    spec = VaultSpec(notes=5, mean_kb=1, seed=7)
+    assert generate_vault(spec) == generate_vault(spec)
+    # A note does not depend on how many notes are generated
+    assert generate_note(VaultSpec(notes=50, mean_kb=1, seed=7), 3) == generate_note(
+        spec, 3
+    )
+    assert generate_vault(spec) != generate_vault(VaultSpec(notes=5, mean_kb=1, seed=8))
+
+
+def test_generated_notes_parse():
+    spec = VaultSpec(notes=8, mean_kb=1, weights={"code": 5, "paragraph": 0})
+    for text in generate_vault(spec).values():
+        front, content = document.parse(text)
+        assert front.content["status"] in ("new", "processed", "draft")
+        assert content.nodes
+    assert len(db_nodes.parse(generate_db_nodes(10))) == 10
+
+
+def test_measure_runs_at_least_rounds():
+    calls = []
+    stats = measure(calls.append, 1, rounds=4, warmup=2)
+    assert stats.rounds == 4 and len(calls) == 6
+    assert stats.min <= stats.median <= stats.max
+
+
+def test_baseline_round_trip_and_regressions(tmp_path):
+    path = str(tmp_path / "baselines.json")
+    spec = VaultSpec(notes=3)
+    save_baseline(path, spec, [result("document", 1.0), result("main", 2.0)])
+    baseline = load_baseline(path)
+    assert baseline["spec"]["notes"] == 3
+    assert baseline["results"]["document"]["mb_per_s"] == 1.0
+
+    assert check_regressions([result("document", 1.2)], baseline, 0.25) == []
+    failures = check_regressions(
+        [result("document", 1.5), result("main", 2.5), result("new", 9.0)],
+        baseline,
+        0.25,
+    )
+    assert len(failures) == 1 and failures[0].startswith("document:")
+
+
+def test_load_baseline_rejects_other_formats(tmp_path):
+    path = tmp_path / "baselines.json"
+    path.write_text('{"format": 0}')
+    with pytest.raises(ValueError):
+        load_baseline(str(path))
@@ -0,0 +1,147 @@
+import os
+
+from python_parser.src.base import ObsidianParserBase
+from python_parser.src.cache import ParseCache, parser_version
+from python_parser.src.models import document
+
+NOTE = """---
+title: Cached
+created: 2024-01-02
+updated: 2024-01-02 10:30:00
+tags: ['a', 'b']
+---
+# Header
+Some text
+```python
+print('hi')
+```
+> [!note] Callout
+> body
+- item
+"""
+
+
+class CountingParser(ObsidianParserBase):
+    calls: int = 0
+
+    def parse(self, file_path):
+        self.calls += 1
+        return super().parse(file_path)
+
+
+def make_parser(cache):
+    return CountingParser(content_parser=document, cache=cache)
+
+
+def write_note(tmp_path, text=NOTE, name="note.md"):
+    note = tmp_path / name
+    note.write_text(text)
+    return str(note)
+
+
+def test_cache_hit_returns_identical_result(tmp_path):
+    note = write_note(tmp_path)
+    parser = make_parser(ParseCache(str(tmp_path / "cache")))
+
+    first = parser(note)
+    second = parser(note)
+    assert parser.calls == 1
+    assert second == first == ObsidianParserBase(content_parser=document)(note)
+
+
+def test_cache_hit_keeps_frontmatter_round_trip(tmp_path):
+    note = write_note(tmp_path, "---\ntitle:   'Quoted'   # keep\nn: 1\n---\nText\n")
+    parser = make_parser(ParseCache(str(tmp_path / "cache")))
+
+    first = parser(note)
+    second = parser(note)
+    assert parser.calls == 1
+    assert "title:   'Quoted'   # keep" in first.frontmatter.to_string()
+    assert second.frontmatter.to_string() == first.frontmatter.to_string()
+
+
+def test_cache_shared_across_instances(tmp_path):
+    note = write_note(tmp_path)
+    make_parser(ParseCache(str(tmp_path / "cache")))(note)
+    parser = make_parser(ParseCache(str(tmp_path / "cache")))
+    parser(note)
+    assert parser.calls == 0
+
+
+def test_cache_invalidated_by_edit(tmp_path):
+    note = write_note(tmp_path)
+    parser = make_parser(ParseCache(str(tmp_path / "cache")))
+    parser(note)
+
+    write_note(tmp_path, NOTE.replace("Some text", "Other text, longer"))
+    result = parser(note)
+    assert parser.calls == 2
+    assert result.content.nodes[1].content.startswith("Other text, longer")
+
+
+def test_cache_invalidated_by_replace_keeping_mtime(tmp_path):
+    note = write_note(tmp_path)
+    parser = make_parser(ParseCache(str(tmp_path / "cache")))
+    parser(note)
+
+    # Same size and mtime, written through a rename as patch_frontmatter does
+    stat = os.stat(note)
+    replacement = write_note(tmp_path, NOTE.replace("Some text", "Some TEXT"), "new.md")
+    os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(replacement, note)
+    result = parser(note)
+    assert parser.calls == 2
+    assert result.content.nodes[1].content.startswith("Some TEXT")
+
+
+def test_cache_hash_fallback_on_touch(tmp_path):
+    note = write_note(tmp_path)
+    parser = make_parser(ParseCache(str(tmp_path / "cache"), use_hash=True))
+    parser(note)
+
+    stat = os.stat(note)
+    os.utime(note, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    parser(note)
+    assert parser.calls == 1
+
+    # Same size, different content
+    write_note(tmp_path, NOTE.replace("Some text", "Some TEXT"))
+    os.utime(note, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    parser(note)
+    assert parser.calls == 2
+
+
+def test_cache_invalidated_by_version(tmp_path):
+    note = write_note(tmp_path)
+    make_parser(ParseCache(str(tmp_path / "cache"), version="0.0.1"))(note)
+    parser = make_parser(ParseCache(str(tmp_path / "cache"), version="0.0.2"))
+    parser(note)
+    assert parser.calls == 1
+    assert ParseCache(str(tmp_path / "cache")).version == parser_version()
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ParseCache(str(tmp_path / "cache"))
+    parser = make_parser(cache)
+    notes = [write_note(tmp_path, name=f"note_{i}.md") for i in range(4)]
+    for i, note in enumerate(notes):
+        parser(note)
+        os.utime(cache.entry_path(note), ns=(i, i))
+    entry_size = os.path.getsize(cache.entry_path(notes[0]))
+
+    # Touch the oldest entry through a cache hit, then shrink the budget
+    parser(notes[0])
+    cache.max_bytes = entry_size * 3
+    cache.evict()
+    remaining = [os.path.exists(cache.entry_path(note)) for note in notes]
+    assert remaining == [True, False, False, True]
+    assert cache.size() <= cache.max_bytes
+
+
+def test_cache_size_counts_overwritten_entries_once(tmp_path):
+    cache = ParseCache(str(tmp_path / "cache"))
+    note = write_note(tmp_path)
+    result = ObsidianParserBase(content_parser=document)(note)
+    for _ in range(3):
+        cache.put(note, result)
+    assert cache._size == cache.size()
@@ -0,0 +1,82 @@
+import pytest
+from parsy import ParseError
+from python_parser.src.models import (
+    ColumnarContent,
+    ColumnarVault,
+    Header,
+    ListItem,
+    Paragraph,
+    Tag,
+    document,
+)
+
+sample = """---
+title: Columns
+---
+
+# Title
+Intro paragraph
+
+## First
+- one
+- two
+  - nested
+
+## Second
+```python
+x = 1
+```
+#tag
+"""
+
+
+def test_columnar_content_matches_document():
+    front, expected = document.parse(sample)
+    content = ColumnarContent(sample)
+
+    assert content.frontmatter == front
+    assert len(content) == len(expected.nodes)
+    assert content.to_content() == expected
+    for index, node in enumerate(expected.nodes):
+        assert content.kind(index) is type(node)
+        assert content.node(index) == node
+
+
+def test_columnar_queries():
+    content = ColumnarContent(sample)
+
+    second_level = content.select(Header, level=2)
+    assert [content.text(index) for index in second_level] == [
+        "## First\n",
+        "## Second\n",
+    ]
+    assert content.count(ListItem) == 3
+    assert content.select(ListItem, level=1) == [5]
+    assert content.text(content.select(Tag)[0]) == "#tag"
+    assert ColumnarContent("plain text\n").frontmatter is None
+
+
+def test_columnar_content_parse_error():
+    with pytest.raises(ParseError):
+        ColumnarContent("# Header\n  > indented\n")
+
+
+def test_columnar_vault(tmp_path):
+    (tmp_path / "a.md").write_text(sample)
+    (tmp_path / "b.md").write_text("- item\n\nSome text\n## Heading\n")
+    (tmp_path / "bad.md").write_text("  > indented\n")
+    vault = ColumnarVault.build(str(tmp_path))
+    a, b = str(tmp_path / "a.md"), str(tmp_path / "b.md")
+
+    assert vault.paths == [a, b]
+    assert list(vault.errors) == [str(tmp_path / "bad.md")]
+    assert vault.count_per_file(ListItem) == {a: 3, b: 1}
+    assert vault.count_per_file(Paragraph) == {a: 1, b: 1}
+
+    headers = vault.select(Header, level=2)
+    assert [vault.locate(index)[0] for index in headers] == [a, a, b]
+    assert vault.text(headers[-1]) == "## Heading\n"
+    assert vault.node(headers[-1]) == Header(level=2, content="Heading")
+    assert vault.select(Header, level=2, path=b) == [headers[-1]]
+    expected = document.parse(sample)[1].nodes + document.parse(vault.sources[1]).nodes
+    assert [vault.node(index) for index in range(len(vault))] == expected
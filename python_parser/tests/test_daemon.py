@@ -0,0 +1,138 @@
+import io
+import socket
+import threading
+from datetime import date
+
+import pytest
+
+from python_parser.src.daemon import (
+    DaemonClient,
+    ParserDaemon,
+    read_frame,
+    write_frame,
+)
+
+NOTE = """---
+title: Served
+created: 2024-01-02
+status: new
+---
+# Header
+Text with a [[Link]] and #tag
+"""
+
+
+def serve(socket_path, **options):
+    server = ParserDaemon(socket_path, warm_up=False, **options)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    yield from serve(str(tmp_path / "parser.sock"))
+
+
+@pytest.fixture
+def cached_daemon(tmp_path):
+    yield from serve(str(tmp_path / "parser.sock"), cache_dir=str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def note(tmp_path):
+    path = tmp_path / "note.md"
+    path.write_text(NOTE)
+    return str(path)
+
+
+def test_frame_round_trip():
+    stream = io.BytesIO()
+    message = {"id": 1, "result": {"created": date(2024, 1, 2), 3: [1, 2]}}
+    write_frame(stream, message)
+    write_frame(stream, [message])
+    stream.seek(0)
+    assert read_frame(stream) == message
+    assert read_frame(stream) == [message]
+    assert read_frame(stream) is None
+
+
+def test_truncated_frame():
+    stream = io.BytesIO()
+    write_frame(stream, "message")
+    stream = io.BytesIO(stream.getvalue()[:-1])
+    with pytest.raises(ValueError):
+        read_frame(stream)
+
+
+def test_parse_requests(daemon, note):
+    with DaemonClient(daemon.socket_path) as client:
+        result = client.request("parse_file", path=note)
+        assert result["error"] is None
+        assert result["frontmatter"]["created"] == date(2024, 1, 2)
+        assert result["nodes"][0][0] == "Header"
+
+        assert client.request("parse_text", text=NOTE) == result | {"path": ""}
+        frontmatter = client.request("frontmatter", path=note)["frontmatter"]
+        assert frontmatter["status"] == "new"
+        references = client.request("references", text=NOTE)
+        assert [record[0] for record in references] == ["WikiLink", "Tag"]
+        assert client.request("tags", path=note) == ["tag"]
+
+
+def test_batch_keeps_going_after_an_error(daemon, note, tmp_path):
+    with DaemonClient(daemon.socket_path) as client:
+        update = {"path": note, "key": "status", "value": "done"}
+        responses = client.batch(
+            [
+                ("update_frontmatter", update),
+                ("frontmatter", {"path": str(tmp_path / "missing.md")}),
+                ("no_such_op", {}),
+                ("frontmatter", {"path": note}),
+            ]
+        )
+    assert [response["ok"] for response in responses] == [True, False, False, True]
+    assert responses[1]["error"].startswith("FileNotFoundError")
+    assert responses[3]["result"]["frontmatter"]["status"] == "done"
+    assert len({response["id"] for response in responses}) == 4
+
+
+def test_update_drops_cached_parse(cached_daemon, note):
+    with DaemonClient(cached_daemon.socket_path) as client:
+        assert client.request("parse_file", path=note)["frontmatter"]["status"] == "new"
+        # Same length and mtime: only the content tells the parses apart
+        update = {"key": "status", "value": "old", "preserve_mtime": True}
+        assert client.request("update_frontmatter", path=note, **update)
+        assert client.request("parse_file", path=note)["frontmatter"]["status"] == "old"
+
+
+def test_request_error_raises(daemon):
+    with DaemonClient(daemon.socket_path) as client:
+        with pytest.raises(ValueError, match="Unknown operation"):
+            client.request("no_such_op")
+        # The connection is still usable
+        assert client.request("ping")
+
+
+def test_socket_in_use_and_stale_socket(daemon, tmp_path):
+    with pytest.raises(ValueError, match="already listening"):
+        ParserDaemon(daemon.socket_path, warm_up=False)
+
+    # A socket bound by a process that is gone: nothing accepts on it
+    stale = tmp_path / "stale.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as orphan:
+        orphan.bind(str(stale))
+    server = ParserDaemon(str(stale), warm_up=False)
+    server.server_close()
+    assert not stale.exists()
+
+
+def test_refuses_to_replace_other_files(tmp_path):
+    note = tmp_path / "notes.md"
+    note.write_text("# Keep me\n")
+    with pytest.raises(ValueError, match="not a socket"):
+        ParserDaemon(str(note), warm_up=False)
+    assert note.read_text() == "# Keep me\n"
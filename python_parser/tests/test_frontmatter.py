@@ -0,0 +1,142 @@
+import os
+
+import pytest
+from python_parser.src.frontmatter import (
+    patch_frontmatter,
+    patch_frontmatter_batch,
+    read_frontmatter,
+)
+from python_parser.src.main import update_status
+from python_parser.src.models import FrontMatter, basic_markdown_parser
+from python_parser.src.source import decode_text
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "---\ntitle: Test\ntags: ['a', 'b']\n---\n# Header\n",
+        "---\r\ntitle: Test\r\nstatus: new\r\n---\r\nBody\r\n",
+        "---\n\n---\nBody\n",
+        "---\n---\ntitle: first line is content\n---\n",
+        "---\ntitle: Test\n----\nBody\n",
+        "---\ntitle: unclosed\n",
+        "# No frontmatter\n",
+        "",
+    ],
+)
+def test_read_frontmatter_matches_full_parse(tmp_path, text):
+    note = tmp_path / "note.md"
+    note.write_bytes(text.encode("utf-8"))
+    with open(note, "r") as file:
+        expected = basic_markdown_parser.parse(file.read())
+
+    frontmatter, offset = read_frontmatter(str(note))
+    assert frontmatter == expected.frontmatter
+    assert decode_text(note.read_bytes()[offset:]) == expected.content
+
+
+def test_read_frontmatter_stops_at_closing_delimiter(tmp_path):
+    note = tmp_path / "note.md"
+    header = "---\nstatus: processed\n---\n"
+    # The body is not valid UTF-8, so decoding it would fail
+    note.write_bytes(header.encode("utf-8") + b"\xff\xfe" * 1000)
+
+    frontmatter, offset = read_frontmatter(str(note))
+    assert frontmatter == FrontMatter(content={"status": "processed"})
+    assert offset == len(header)
+
+
+NOTE = """---
+title: "Quoted title"   # keep this comment
+status: new
+tags:
+  - a
+  - b
+---
+# Body
+status: not frontmatter
+"""
+
+
+def test_patch_frontmatter_rewrites_only_the_key(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text(NOTE)
+
+    assert patch_frontmatter(str(note), "status", "processed") is True
+    assert note.read_text() == NOTE.replace("status: new", "status: processed")
+    # Same value again: nothing to write
+    assert patch_frontmatter(str(note), "status", "processed") is False
+
+
+def test_patch_frontmatter_block_values_and_missing_keys(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text(NOTE)
+
+    patch_frontmatter(str(note), "tags", ["x", "y"])
+    assert "tags: [x, y]\n---\n" in note.read_text()
+    assert patch_frontmatter(str(note), "missing", 1) is False
+    patch_frontmatter(str(note), "missing", 1, add_missing=True)
+    frontmatter, _ = read_frontmatter(str(note))
+    assert frontmatter.content == {
+        "title": "Quoted title",
+        "status": "new",
+        "tags": ["x", "y"],
+        "missing": 1,
+    }
+
+    bare = tmp_path / "bare.md"
+    bare.write_text("# No frontmatter\n")
+    assert patch_frontmatter(str(bare), "status", "new") is False
+    patch_frontmatter(str(bare), "status", "new", add_missing=True)
+    assert bare.read_text() == "---\nstatus: new\n---\n# No frontmatter\n"
+
+
+def test_patch_frontmatter_keeps_crlf_and_mtime(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_bytes(b"---\r\nstatus: new\r\n---\r\nBody\r\n")
+    os.utime(note, ns=(1_000_000_000, 1_000_000_000))
+
+    patch_frontmatter(str(note), "status", "done", preserve_mtime=True)
+    assert note.read_bytes() == b"---\r\nstatus: done\r\n---\r\nBody\r\n"
+    assert os.stat(note).st_mtime_ns == 1_000_000_000
+    assert [path.name for path in tmp_path.iterdir()] == ["note.md"]
+
+
+def test_patch_frontmatter_writes_through_symlinks(tmp_path):
+    (tmp_path / "vault").mkdir()
+    target = tmp_path / "vault" / "note.md"
+    target.write_text(NOTE)
+    link = tmp_path / "link.md"
+    link.symlink_to(target)
+
+    assert patch_frontmatter(str(link), "status", "processed") is True
+    assert link.is_symlink()
+    assert target.read_text() == NOTE.replace("status: new", "status: processed")
+    assert [path.name for path in (tmp_path / "vault").iterdir()] == ["note.md"]
+
+
+def test_patch_frontmatter_batch(tmp_path):
+    paths = []
+    for i in range(20):
+        note = tmp_path / f"note_{i}.md"
+        note.write_text(NOTE if i % 2 else NOTE.replace("status: new", "status: done"))
+        paths.append(str(note))
+    paths.append(str(tmp_path / "missing.md"))
+
+    changed, errors = patch_frontmatter_batch(paths, "status", "done", workers=4)
+    assert changed == paths[1:20:2]
+    assert list(errors) == [str(tmp_path / "missing.md")]
+    assert errors[str(tmp_path / "missing.md")].startswith("FileNotFoundError")
+    for path in paths[:20]:
+        assert read_frontmatter(path)[0].content["status"] == "done"
+
+
+def test_update_status_reports_missing_key(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text("---\ntitle: No status\n---\nBody\n")
+    assert update_status(str(note), "Body") is False
+    assert note.read_text() == "---\ntitle: No status\n---\nBody\n"
+
+    note.write_text("---\nstatus: new\n---\nBody\n")
+    assert update_status(str(note), "Body") == "Body"
+    assert note.read_text() == "---\nstatus: processed\n---\nBody\n"
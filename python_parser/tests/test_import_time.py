@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from python_parser.benchmarks.bench_import import (
+    ROOT,
+    check_budget,
+    deferred_imports,
+    main,
+    parse_importtime,
+)
+
+IMPORTTIME = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   yaml.error
+import time:      3000 |       3120 | yaml
+import time:       500 |       3620 | python_parser.src.models
+"""
+
+
+def imported_modules(statement):
+    code = f"import sys\n{statement}\nprint('\\n'.join(sys.modules))"
+    process = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(process.stdout.split())
+
+
+def test_models_package_is_lazy():
+    modules = imported_modules("import python_parser.src.models")
+    assert "python_parser.src.models.parsers" not in modules
+    assert "pydantic" not in modules
+
+    modules = imported_modules("from python_parser.src.models import NodeContent")
+    assert "python_parser.src.models.nodes" in modules
+    assert "python_parser.src.models.parsers" not in modules
+
+
+def test_main_defers_optional_imports():
+    modules = imported_modules("import python_parser.src.main")
+    assert deferred_imports({name: (0, 0) for name in modules}) == []
+
+
+def test_lazy_names_resolve():
+    from python_parser.src import models
+
+    for name in models.__all__:
+        assert getattr(models, name) is not None
+    assert "header" in dir(models)
+
+
+def test_parse_importtime_and_budget():
+    times = parse_importtime(IMPORTTIME)
+    assert times["python_parser.src.models"] == (500, 3620)
+    assert deferred_imports(times) == ["yaml", "yaml.error"]
+    budget = {"python_parser.src.models": 20}
+    assert check_budget({"python_parser.src.models": 3.6}, budget) == []
+    assert len(check_budget({"python_parser.src.models": 25.0}, budget)) == 1
+
+
+@pytest.mark.skipif(
+    not os.getenv("PARSER_IMPORT_BUDGET"),
+    reason="Wall-clock budget; set PARSER_IMPORT_BUDGET=1 to check it",
+)
+def test_import_budget():
+    assert main(["--check", "--rounds", "5"]) == 0
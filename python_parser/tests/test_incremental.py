@@ -0,0 +1,90 @@
+import pytest
+from parsy import ParseError
+from python_parser.src.models import document, reparse
+
+
+note = """---
+title: Incremental
+status: new
+---
+
+# Header
+
+First paragraph
+continues here.
+
+- item one
+  - nested item
+
+```python
+def f():
+    return 1
+```
+
+> [!note]
+> callout body
+
+![[image.png]]
+#tag
+
+## Second header
+
+Closing paragraph.
+"""
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        # Edits inside one block
+        (note, note.replace("First paragraph", "First edited paragraph")),
+        (note, note.replace("return 1", "return 2")),
+        (note, note.replace("Closing paragraph.", "Closing paragraph!")),
+        # Edits that change block structure
+        (note, note.replace("\n## Second header\n", "\nNow a paragraph\n")),
+        (note, note.replace("continues here.\n\n", "continues here.\n")),
+        (note, note.replace("```python", "Plain text")),
+        (note, note.replace("```\n\n> [!note]", "\n> [!note]")),
+        (note, note.replace("![[image.png]]", "")),
+        (note, note + "- appended item\n"),
+        # Frontmatter edits
+        (note, note.replace("status: new", "status: processed")),
+        (note, note.replace("---\ntitle", "title", 1)),
+        # No frontmatter
+        ("# A\n\nbody\n", "# A\n\nnew body\n"),
+        ("# A\n\nbody\n", "# B\n\nbody\n"),
+        ("", "# Added\n"),
+        ("text\n", ""),
+    ],
+)
+def test_reparse_matches_full_parse(old, new):
+    assert reparse(document.parse(old), old, new) == document.parse(new)
+
+
+def test_reparse_reuses_unchanged_nodes():
+    old_front, old_content = document.parse(note)
+    new = note.replace("continues here.", "continues here, edited.")
+    new_front, new_content = reparse((old_front, old_content), note, new)
+
+    assert new_front is old_front
+    changed = [
+        i
+        for i, node in enumerate(new_content.nodes)
+        if node is not old_content.nodes[i]
+    ]
+    assert changed == [1]
+    assert new_content.nodes[1].content == "First paragraph\ncontinues here, edited."
+
+
+def test_reparse_unchanged_text_returns_previous_result():
+    previous = document.parse(note)
+    assert reparse(previous, note, note) is previous
+
+
+def test_reparse_raises_full_parse_error():
+    new = note.replace("#tag", "  > indented")
+    with pytest.raises(ParseError) as expected:
+        document.parse(new)
+    with pytest.raises(ParseError) as actual:
+        reparse(document.parse(note), note, new)
+    assert str(actual.value) == str(expected.value)
@@ -0,0 +1,100 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from python_parser.src.index import VaultIndex, link_key, scan_references
+
+NOTES = {
+    "Alpha.md": "---\ntags: [project, Python]\n---\n# Alpha\nSee [[Beta]] and [[Gamma#Intro|gamma]].\n#todo\n",
+    "Beta.md": "---\ntitle: Beta\n---\nBack to [[Alpha]].\n![[diagram.png]]\n#project\n",
+    "notes/Gamma.md": "Links to [[folder/Beta.md]]\n```\n[[NotALink]] #not-a-tag\n```\n![img](https://example.com/x.png)\n",
+}
+
+
+def write_vault(directory):
+    for name, text in NOTES.items():
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return {name: str(directory / name) for name in NOTES}
+
+
+def test_link_key():
+    assert link_key("Note") == "Note"
+    assert link_key("folder/Note.md") == "Note"
+    assert link_key("Note#Heading") == "Note"
+    assert link_key("Note#^block") == "Note"
+
+
+def test_scan_references_skips_code_and_reads_frontmatter_tags():
+    assert scan_references(NOTES["Alpha.md"]) == {
+        "links": ("Beta", "Gamma"),
+        "tags": ("project", "python", "todo"),
+        "images": (),
+    }
+    assert scan_references(NOTES["notes/Gamma.md"]) == {
+        "links": ("Beta",),
+        "tags": (),
+        "images": ("https://example.com/x.png",),
+    }
+
+
+def test_vault_index_queries(tmp_path):
+    paths = write_vault(tmp_path)
+    index = VaultIndex.build(str(tmp_path))
+
+    assert len(index) == 3
+    assert index.backlinks("Beta") == [paths["Alpha.md"], paths["notes/Gamma.md"]]
+    assert index.backlinks(paths["Alpha.md"]) == [paths["Beta.md"]]
+    assert index.backlinks("NotALink") == []
+    assert index.files_with_tag("#Project") == [paths["Alpha.md"], paths["Beta.md"]]
+    assert index.files_with_tag("not-a-tag") == []
+    assert index.files_with_image("diagram.png") == [paths["Beta.md"]]
+    assert index.links_from(paths["Alpha.md"]) == ("Beta", "Gamma")
+    assert index.tags() == ["project", "python", "todo"]
+
+
+def test_vault_index_update_and_remove(tmp_path):
+    paths = write_vault(tmp_path)
+    index = VaultIndex.build(str(tmp_path))
+    alpha = paths["Alpha.md"]
+
+    index.update_file(alpha, "No links any more #done\n")
+    assert index.backlinks("Beta") == [paths["notes/Gamma.md"]]
+    assert index.files_with_tag("todo") == []
+    assert index.files_with_tag("done") == [alpha]
+    # Updates keep the file id, so the reverse arrays stay in path order
+    assert index.paths.index(alpha) == 0
+
+    (tmp_path / "Beta.md").unlink()
+    index.update_file(paths["Beta.md"])
+    assert paths["Beta.md"] not in index
+    assert index.backlinks("Alpha") == []
+    assert index.files_with_image("diagram.png") == []
+
+
+def test_vault_index_save_and_load(tmp_path):
+    write_vault(tmp_path)
+    index = VaultIndex.build(str(tmp_path))
+    index.remove_file(str(tmp_path / "Beta.md"))
+    index_path = str(tmp_path / "index.msgpack")
+    index.save(index_path)
+
+    loaded = VaultIndex.load(index_path)
+    assert loaded.paths == index.paths
+    assert len(loaded) == len(index)
+    for note in ("Alpha", "Beta", "Gamma"):
+        assert loaded.backlinks(note) == index.backlinks(note)
+    assert loaded.tags() == index.tags()
+
+    loaded.update_file(str(tmp_path / "Beta.md"))
+    assert loaded.backlinks("Alpha") == [str(tmp_path / "Beta.md")]
+
+
+def test_vault_index_concurrent_saves(tmp_path):
+    write_vault(tmp_path)
+    index = VaultIndex.build(str(tmp_path))
+    index_path = str(tmp_path / "index.msgpack")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: index.save(index_path), range(16)))
+
+    assert VaultIndex.load(index_path).tags() == index.tags()
+    assert not list(tmp_path.glob("*.tmp"))
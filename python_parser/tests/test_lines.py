@@ -0,0 +1,71 @@
+import pytest
+
+from python_parser.src.models import parsers
+from python_parser.src.models.datatypes_v2 import split_sections
+from python_parser.src.models.lines import BLANK, LineTable
+
+NOTE = """---
+title: Lines
+---
+# Header
+Some text
+  indented text
+
+- item
+  - sub item
+```python
+x = 1
+```
+> [!note]
+> quote
+![[image.png]]
+#tag
+"""
+
+
+def test_line_table_offsets_and_classes():
+    text = "# Head\r\n\r\n  - item\n```\n>q\n![[a]]\n-x\nplain"
+    table = LineTable(text)
+    assert table.kinds == "#b-`>!tt"
+    assert [table.line_text(line) for line in range(len(table))] == text.replace(
+        "\r\n", "\n"
+    ).split("\n")
+    assert table.line_at(table.starts[2]) == 2
+    assert table.line_at(table.starts[2] + 1) is None
+    assert table.line_of(table.starts[2] + 3) == 2
+    assert table.skip_blank(1) == 2
+    assert table.lines_of("#!") == [0, 5]
+
+
+def test_line_table_trailing_newline():
+    assert len(LineTable("a\nb\n")) == 2
+    assert LineTable("a\nb\n").end(1) == 3
+    assert LineTable("").kinds == BLANK
+    assert list(LineTable("a\nb\n\n  \nc").blocks()) == [(0, 2), (4, 5)]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        NOTE,
+        NOTE.replace("\n", "\r\n"),
+        "#tag and text\n  # indented header\n> a\n  > not a callout\n",
+        "```\nunclosed\n",
+        "- a\n-b\n!not an image\n",
+        "text\r# after a bare carriage return\n",
+    ],
+)
+def test_line_block_matches_block(text):
+    reference = parsers.document_parser(parsers.front_matter, parsers.block)
+
+    def run(parser):
+        try:
+            return repr(parser.parse(text))
+        except Exception as e:
+            return f"{type(e).__name__}: {e}"
+
+    assert run(parsers.document) == run(reference)
+
+
+def test_split_sections_at_blank_lines():
+    assert split_sections("a\nb\n\n\n  \nc\r\n\r\nd\n") == ["a\nb", "c", "d"]
@@ -1,3 +1,5 @@
+import time
+
 import pytest
 from python_parser.src.models import (
     Text,
@@ -34,8 +36,11 @@ from python_parser.src.models import (
     front_matter,
     callout,
     code_block,
+    fast_code_block,
     document,
     parse_references,
+    extract_references,
+    reference_parser,
     db_node_tag,
     db_nodes,
     section,
@@ -390,6 +395,32 @@ line 2
         code_block.parse("```\n```")  # No newline after closing
 
 
+def test_fast_code_block():
+    """Test the fence-search code block parser agrees with code_block"""
+    samples = [
+        "```\ncode\n```\n",
+        "```python\ncode\n```\n",
+        "```\nline 1\n\nline 2\n```",
+        "```\n\n```\n",
+        "```\r\nline 1\r\nline 2\r\n  ```  \r\n",
+        "```\n  not closed ```\n```\n",
+    ]
+    for sample in samples:
+        assert fast_code_block.parse(sample) == code_block.parse(sample)
+
+    # Large bodies are sliced in one piece
+    body = "print('hello')\n" * 10_000
+    assert fast_code_block.parse(f"```py\n{body}```\n") == CodeBlock(
+        content=body, language="py"
+    )
+
+    # Test failure cases
+    with pytest.raises(Exception):
+        fast_code_block.parse("```\nunclosed")
+    with pytest.raises(Exception):
+        fast_code_block.parse("```\nbare\rreturn\n```\n")
+
+
 def test_front_matter():
     """Test front matter parsing"""
     simple_front_matter = """---
@@ -715,9 +746,44 @@ Maybe this works too? ![alt with spaces](https://example.com/spaces in url.jpg)
 
     for link in links:
         print(f"Link: {link}")
-    assert (
-        links[0] == "![](https://example.com/img.jpg)"
-    )  # "https://example.com/img.jpg"
+    assert links[0] == ImageLink(
+        path="https://example.com/img.jpg", is_external=True, alt_text=None
+    )
+    assert links[1] == ImageLink(
+        path="image with spaces.jpg", is_external=False, alt_text="alt with spaces"
+    )
+    assert len(links) == 4
+
+
+def test_extract_references():
+    """Test that all reference types are extracted in order"""
+    text = (
+        "See [[Target|alias]] and [[Other]], [docs](https://example.com/a#b)\n"
+        "#tag at line start, mid#word is not a tag, # nor is this\n"
+        "![[image.png|alt]] ![](https://example.com/img.jpg) `code [[not a link]]`"
+    )
+    assert extract_references(text) == [
+        WikiLink(target="Target", alias="alias"),
+        WikiLink(target="Other", alias=None),
+        ExternalLink(url="https://example.com/a#b", text="docs"),
+        Tag(name="tag"),
+        ImageLink(path="image.png", is_external=False, alt_text="alt"),
+        ImageLink(path="https://example.com/img.jpg", is_external=True, alt_text=None),
+        InlineCode(content="code [[not a link]]"),
+    ]
+    assert reference_parser.parse(text) == extract_references(text)
+
+
+def test_extract_references_pathological_input():
+    """Unterminated links and code must not cause quadratic rescanning"""
+    start = time.perf_counter()
+    text = "[[" * 20000 + "![" * 20000 + "`" + "[a" * 20000 + "\n#end"
+    assert extract_references(text) == [Tag(name="end")]
+    # Unclosed link URLs stop at the next link opener
+    assert extract_references("[x](" * 20000) == []
+    assert extract_references("![](" * 20000) == []
+    assert time.perf_counter() - start < 1.0
+    assert extract_references("no references here") == []
 
 
 def test_mixed_tag_quotes():
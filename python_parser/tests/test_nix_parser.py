@@ -0,0 +1,54 @@
+from python_parser.src.models.nix_parse_primitives import (
+    Language,
+    Script,
+    nix_parser,
+    whitespace_or_comment,
+)
+
+DEVENV = """{ pkgs, lib, config, inputs, ...}:
+
+{
+  # Environment
+  env = {
+    GREET = "devenv";
+    MODE = ''dev'';
+  };
+
+  packages = [
+    pkgs.git
+    pkgs.python3 # py
+  ];
+
+  languages = {
+    python = {
+      enable = true;
+      uv = false;
+    };
+  };
+
+  scripts = {
+    hello.exec = ''echo hello'';
+  };
+
+  enterShell = ''hello'';
+  enterTest = ''pytest'';
+}"""
+
+
+def test_whitespace_or_comment_terminates():
+    assert whitespace_or_comment.parse_partial(" \t# note\n  x") == (
+        [" ", "\t", "# note", "\n", " ", " "],
+        "x",
+    )
+
+
+def test_nix_parser():
+    config = nix_parser.parse(DEVENV)
+    assert config.env == {"GREET": "devenv", "MODE": "dev"}
+    assert config.packages == ["git", "python3"]
+    assert config.languages == {
+        "python": Language("python", {"enable": True, "uv": False})
+    }
+    assert config.scripts == {"hello": Script("hello", "echo hello")}
+    assert config.enter_shell == "hello"
+    assert config.enter_test == "pytest"
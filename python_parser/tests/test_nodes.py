@@ -0,0 +1,61 @@
+import pytest
+from python_parser.src.models import (
+    FrontMatter,
+    Header,
+    NodeContent,
+    compact_document,
+    document,
+)
+from python_parser.src.models.nodes import HeaderNode, ParagraphNode, from_model
+
+sample = """---
+title: Nodes
+---
+
+# Header
+Paragraph line
+second line
+
+- item
+  - nested item
+
+```python
+print("hi")
+```
+
+> [!note]
+> callout body
+
+![[image.png|alt]]
+![](https://example.com/img.png)
+#tag
+"""
+
+
+@pytest.mark.parametrize("text", [sample, "# Only a header\n", "", "plain\n"])
+def test_compact_document_converts_to_document_models(text):
+    expected = document.parse(text)
+    result = compact_document.parse(text)
+    if isinstance(expected, tuple):
+        assert result[0] == expected[0]
+        expected, result = expected[1], result[1]
+    assert isinstance(result, NodeContent)
+    assert result.to_model() == expected
+    assert result.to_string() == expected.to_string()
+    assert [from_model(node) for node in expected.nodes] == result.nodes
+
+
+def test_slotted_nodes_have_no_instance_dict():
+    front, content = compact_document.parse(sample)
+    assert isinstance(front, FrontMatter)
+    assert content.nodes[0] == HeaderNode(level=1, content="Header")
+    for node in content.nodes:
+        assert not hasattr(node, "__dict__")
+    with pytest.raises(AttributeError):
+        content.nodes[0].extra = "not allowed"
+
+
+def test_to_model_validates():
+    assert HeaderNode(level=2, content="x").to_model() == Header(level=2, content="x")
+    with pytest.raises(ValueError):
+        ParagraphNode(content=None).to_model()
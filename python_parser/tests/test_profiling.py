@@ -0,0 +1,52 @@
+import pytest
+
+from python_parser.src.models import document, header, parsers
+from python_parser.src.profiling import ParserProfile, profile_files
+
+NOTE = """---
+title: Profiled
+---
+# Header
+Some text
+- item
+"""
+
+
+def test_profile_counts_calls_and_backtracks():
+    with ParserProfile(["header", "paragraph"]) as profile:
+        document.parse(NOTE)
+    stats = profile.parsers["header"]
+    assert stats.successes == 1
+    assert stats.backtracks == stats.calls - 1
+    assert stats.seconds > 0
+    assert profile.parsers["paragraph"].successes == 1
+    assert set(profile.report()["parsers"]) == {"header", "paragraph"}
+
+
+def test_profile_restores_parsers():
+    original = header.wrapped_fn
+    with ParserProfile():
+        assert header.wrapped_fn is not original
+    assert header.wrapped_fn is original
+    assert parsers.header is header
+
+
+def test_profile_per_file(tmp_path):
+    paths = []
+    for name, text in (("a.md", NOTE), ("b.md", NOTE + "# Another\n")):
+        path = tmp_path / name
+        path.write_text(text)
+        paths.append(str(path))
+
+    results, profile = profile_files(paths)
+    assert [result.error for result in results] == [None, None]
+    report = profile.report()
+    assert report["files"][paths[0]]["header"]["successes"] == 1
+    assert report["files"][paths[1]]["header"]["successes"] == 2
+    assert report["parsers"]["header"]["successes"] == 3
+    assert "document" in profile.format()
+
+
+def test_profile_rejects_unknown_parser():
+    with pytest.raises(ValueError):
+        ParserProfile(["not_a_parser"])
@@ -0,0 +1,187 @@
+import io
+import pytest
+from parsy import ParseError
+from python_parser.src.base import ObsidianParserBase
+from python_parser.src.models import (
+    FrontMatter,
+    Header,
+    Paragraph,
+    CodeBlock,
+    Callout,
+    ListItem,
+    ImageLink,
+    Tag,
+    ObsidianFile,
+    code_block,
+    document,
+    fast_document,
+    iter_blocks,
+)
+
+
+sample_document = """---
+title: Test Document
+tags: ['a', 'b']
+---
+
+# Header
+
+This is a paragraph with `code` and [[wiki-link]].
+It continues here.
+
+```python
+def hello():
+
+    print("world")
+```
+
+> [!NOTE]
+> This is a callout
+> With multiple lines
+
+- item
+  - nested item
+    - deeper
+
+![[image.png|Alt text]]
+![alt](https://example.com/img.jpg)
+#tag trailing text
+
+  ## Indented header
+---
+"""
+
+
+# --- Equivalence with document ---
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        sample_document,
+        "",
+        "\n\n   \n",
+        "Just a paragraph\n",
+        "# Header\n\nParagraph here.\n",
+        "# Header",
+        "#tag",
+        "- a\n- b",
+        "text\r\nmore text\r\n\r\n# Header\r\n",
+        "```\n\n```\n",
+        "```\n\n\n```",
+        "```\nunclosed fence\n",
+        "---\nnot: closed\n\nparagraph\n",
+    ],
+)
+def test_fast_document_matches_document(text):
+    """The scanner produces exactly what the combinator document produces"""
+    assert fast_document.parse(text) == document.parse(text)
+
+
+def test_fast_document_node_types():
+    front, content = fast_document.parse(sample_document)
+    assert isinstance(front, FrontMatter)
+    assert [type(node) for node in content.nodes] == [
+        Header,
+        Paragraph,
+        CodeBlock,
+        Callout,
+        ListItem,
+        ListItem,
+        ListItem,
+        ImageLink,
+        ImageLink,
+        Tag,
+        Paragraph,
+        Header,
+        Paragraph,
+    ]
+    assert content.nodes[5] == ListItem(level=1, content="nested item")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "  > indented quote\n",
+        "Paragraph\n  ![[inline.png]]\n",
+        "![[a.png]] ![[b.png]]\n",
+    ],
+)
+def test_fast_document_errors_match_document(text):
+    """Unparseable input raises the same ParseError as document"""
+    with pytest.raises(ParseError) as expected:
+        document.parse(text)
+    with pytest.raises(ParseError) as actual:
+        fast_document.parse(text)
+    assert str(actual.value) == str(expected.value)
+
+
+# --- ObsidianParserBase flag ---
+
+
+def test_obsidian_parser_use_scanner(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text(sample_document)
+
+    combinator = ObsidianParserBase(content_parser=document)
+    scanner = ObsidianParserBase(content_parser=document, use_scanner=True)
+
+    result = scanner(str(note))
+    assert isinstance(result, ObsidianFile)
+    assert result == combinator(str(note))
+
+
+# --- Streaming ---
+
+
+class CountingStream(io.StringIO):
+    """StringIO that records how many characters have been read"""
+
+    chars_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.chars_read += len(chunk)
+        return chunk
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 64 * 1024])
+def test_iter_blocks_matches_document(chunk_size):
+    front, content = document.parse(sample_document)
+    streamed = list(iter_blocks(io.StringIO(sample_document), chunk_size=chunk_size))
+    assert streamed == [front] + content.nodes
+
+
+def test_iter_blocks_from_path(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text("# Header\n\nParagraph here.\n")
+    assert list(iter_blocks(note)) == [
+        Header(level=1, content="Header"),
+        Paragraph(content="Paragraph here."),
+    ]
+
+
+def test_iter_blocks_stops_early():
+    """Only the blocks pulled so far (plus one chunk of lookahead) are read"""
+    text = "# Goals\n\nFirst section\n\n" + "More text\n\n" * 10_000
+    stream = CountingStream(text)
+    blocks = iter_blocks(stream, chunk_size=256)
+    assert next(blocks) == Header(level=1, content="Goals")
+    assert next(blocks) == Paragraph(content="First section")
+    blocks.close()
+    assert stream.chars_read < 1024
+
+
+def test_iter_blocks_waits_for_closing_fence():
+    text = "```\n" + "line\n\n" * 100 + "```\n"
+    assert list(iter_blocks(io.StringIO(text), chunk_size=8)) == [
+        code_block.parse(text)
+    ]
+
+
+def test_iter_blocks_parse_error():
+    stream = io.StringIO("# Header\n\n  > indented quote\n")
+    blocks = iter_blocks(stream)
+    assert next(blocks) == Header(level=1, content="Header")
+    with pytest.raises(ParseError):
+        next(blocks)
@@ -0,0 +1,158 @@
+from python_parser.src.models import (
+    document,
+    Header,
+    Section_Node,
+    SectionTree,
+    section_index,
+)
+from python_parser.src.models.datatypes_v2 import split_content
+from python_parser.src.models.sections import (
+    front_matter_end,
+    section_body,
+    section_text,
+)
+
+NOTE = """---
+title: Sections
+# a YAML comment
+---
+Intro text
+
+# Goals
+Text with a #tag
+
+```python
+# a comment
+```
+#tag on its own line
+## Outline
+  ### Indented
+
+```
+# after an unclosed fence
+"""
+
+
+def test_section_index():
+    index = section_index(NOTE)
+    assert [(level, title) for _, _, level, title in index] == [
+        (1, "Goals"),
+        (2, "Outline"),
+        (3, "Indented"),
+        (1, "after an unclosed fence"),
+    ]
+    # Sections are contiguous and run to the end of the text
+    assert [end for _, end, _, _ in index[:-1]] == [start for start, *_ in index[1:]]
+    assert index[-1][1] == len(NOTE)
+    assert NOTE.startswith("# Goals\n", index[0][0])
+
+
+def test_section_index_matches_document_headers():
+    _, content = document.parse(NOTE)
+    headers = [node for node in content.nodes if isinstance(node, Header)]
+    assert [(header.level, header.content) for header in headers] == [
+        (level, title) for _, _, level, title in section_index(NOTE)
+    ]
+
+
+def test_section_slices():
+    goals = section_index(NOTE)[0]
+    assert section_text(NOTE, goals).startswith("# Goals\nText with a #tag\n\n```")
+    assert section_text(NOTE, goals).endswith("#tag on its own line")
+    assert section_body(NOTE, goals).startswith("Text with a #tag")
+    indented = section_index(NOTE)[2]
+    assert section_body(NOTE, indented) == "\n```"
+
+
+def test_section_index_edge_cases():
+    assert section_index("") == []
+    assert section_index("####### seven\n#tag\n") == []
+    assert section_index("# Only\r\nbody\r\n") == [(0, 14, 1, "Only")]
+    assert front_matter_end("---\na: 1\n---\n# H\n") == 13
+    assert front_matter_end("---\na: 1\n----\n") == 0
+
+
+def test_split_content():
+    parts = split_content(NOTE)
+    assert parts[0] == NOTE[: NOTE.index("\n\n# Goals")]
+    assert [part.split("\n")[0] for part in parts[1:]] == [
+        "# Goals",
+        "## Outline",
+        "  ### Indented",
+        "# after an unclosed fence",
+    ]
+    assert split_content("no headers\n") == ["no headers"]
+
+
+TREE_NOTE = """Preamble
+# Goals %%g1|0.0.1|Section_Node%%
+Goal text
+## Outline
+Outline text
+### Detail
+## Plan
+# Notes
+Note text
+### Skipped level
+"""
+
+
+def test_section_tree_structure():
+    tree = SectionTree(TREE_NOTE)
+    assert tree.titles == [
+        "Goals",
+        "Outline",
+        "Detail",
+        "Plan",
+        "Notes",
+        "Skipped level",
+    ]
+    assert list(tree.parents) == [-1, 0, 1, 0, -1, 4]
+    assert list(tree.roots()) == [0, 4]
+    assert list(tree.children(0)) == [1, 3]
+    assert list(tree.ancestors(2)) == [1, 0]
+    assert list(tree.descendants_end) == [4, 3, 3, 4, 6, 6]
+    assert tree.path(2) == "Goals > Outline > Detail"
+
+
+def test_section_tree_lookup():
+    tree = SectionTree(TREE_NOTE)
+    assert tree.find("Goals > Outline") == 1
+    assert tree.find(" Goals>Outline >Detail ") == 2
+    assert tree.find(["Notes", "Skipped level"]) == 5
+    assert tree.find("Outline") is None
+    assert tree.find_id("g1") == 0
+    assert tree.find_id("missing") is None
+    assert tree.at(TREE_NOTE.index("Outline text")) == 1
+    assert tree.at(0) is None
+
+
+def test_section_tree_bodies():
+    tree = SectionTree(TREE_NOTE)
+    assert tree.body(0) == "Goal text"
+    assert tree.body(2) == ""
+    assert tree.text(1) == "## Outline\nOutline text\n### Detail"
+    assert tree.text(4) == "# Notes\nNote text\n### Skipped level"
+
+    node = tree.node(0)
+    assert isinstance(node, Section_Node)
+    assert (node.level, node.label, node.content) == (1, "Goals", "Goal text")
+    assert node.node_tag.node_id == "g1"
+    assert node.node_tag.node_type == "Section_Node"
+
+
+def test_section_tree_untagged_node():
+    tree = SectionTree("# A\nbody\n")
+    node = tree.node(0)
+    assert node.node_tag.node_type == "Section_Node"
+    assert tree.node(0).node_tag == node.node_tag
+    assert tree.find_id(node.node_tag.node_id) == 0
+    text = node.to_string()
+    assert text.startswith("# %%") and text.endswith("A\nbody")
+
+
+def test_section_tree_empty():
+    tree = SectionTree("no headers\n")
+    assert len(tree) == 0
+    assert list(tree.roots()) == []
+    assert tree.at(3) is None
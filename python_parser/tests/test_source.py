@@ -0,0 +1,74 @@
+from python_parser.src.base import FileParserBase, ObsidianParserBase
+from python_parser.src.models import basic_markdown_parser, document
+from python_parser.src.source import MappedFile
+
+
+note_text = """---
+id: XcEgwWjA6pXuCBmGmckQrX
+tags: ['project']
+---
+# Python_Parser #project
+
+Some text with a #tag and an issue#123 reference.
+"""
+
+
+def test_mapped_file_decode_matches_text_read(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_bytes(note_text.replace("\n", "\r\n").encode("utf-8"))
+    with open(note, "r") as file:
+        expected = file.read()
+    with MappedFile(str(note)) as source:
+        assert source.decode() == expected
+        assert source.decode(0, 3) == "---"
+
+
+def test_mapped_file_frontmatter(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text(note_text)
+    with MappedFile(str(note)) as source:
+        yaml_text, offset = source.frontmatter()
+        assert yaml_text == "id: XcEgwWjA6pXuCBmGmckQrX\ntags: ['project']"
+        assert source.decode(offset).startswith("# Python_Parser")
+
+    no_frontmatter = tmp_path / "plain.md"
+    no_frontmatter.write_text("# Header\n")
+    with MappedFile(str(no_frontmatter)) as source:
+        assert source.frontmatter() is None
+
+
+def test_mapped_file_tags(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text(note_text)
+    with MappedFile(str(note)) as source:
+        assert source.tags() == ["project", "tag"]
+
+    fenced = tmp_path / "fenced.md"
+    fenced.write_text(
+        "---\ntitle: #header\n---\n#before\n```sh\n#comment\n```\n#after\n"
+        "```\n#unclosed fence\n"
+    )
+    with MappedFile(str(fenced)) as source:
+        assert source.tags() == ["before", "after", "unclosed"]
+
+
+def test_mapped_file_empty(tmp_path):
+    note = tmp_path / "empty.md"
+    note.write_text("")
+    with MappedFile(str(note)) as source:
+        assert len(source) == 0
+        assert source.decode() == ""
+        assert source.frontmatter() is None
+
+
+def test_file_parser_use_mmap(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text(note_text)
+
+    for parser_cls, kwargs in [
+        (FileParserBase, {"file_type": "md", "parser": basic_markdown_parser}),
+        (ObsidianParserBase, {"content_parser": document}),
+    ]:
+        buffered = parser_cls(**kwargs)
+        mapped = parser_cls(use_mmap=True, **kwargs)
+        assert mapped(str(note)) == buffered(str(note))
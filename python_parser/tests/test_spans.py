@@ -0,0 +1,85 @@
+import pytest
+from python_parser.src.models import (
+    Header,
+    Paragraph,
+    document,
+    header,
+    patch_text,
+    spanned_document,
+    with_span,
+)
+
+sample = """---
+title: Spans
+status: new
+---
+
+# Header
+
+A paragraph
+over two lines
+
+- item
+```python
+x = 1
+```
+#tag
+"""
+
+
+def dump(result):
+    front, content = result
+    return front.model_dump(), content.model_dump()
+
+
+def test_spanned_document_matches_document():
+    assert dump(spanned_document.parse(sample)) == dump(document.parse(sample))
+
+
+def test_spans_cover_node_source():
+    front, content = spanned_document.parse(sample)
+    assert front.source_text(sample) == "---\ntitle: Spans\nstatus: new\n---\n"
+    assert [node.source_text(sample) for node in content.nodes] == [
+        "# Header\n",
+        "A paragraph\nover two lines\n",
+        "- item\n",
+        "```python\nx = 1\n```\n",
+        "#tag",
+    ]
+    # Blocks are separated only by blank lines
+    ends = [node.span[1] for node in content.nodes]
+    starts = [node.span[0] for node in content.nodes[1:]]
+    assert all(sample[end:start].strip() == "" for end, start in zip(ends, starts))
+
+
+def test_nodes_without_span():
+    node = document.parse("# Header\n").nodes[0]
+    assert node.span is None
+    with pytest.raises(ValueError):
+        node.source_text("# Header\n")
+    assert with_span(header).parse("# Header\n").span == (0, 9)
+
+
+def test_spans_are_private_state():
+    spanned = with_span(header).parse("# Header\n")
+    assert spanned.model_dump() == Header(level=1, content="Header").model_dump()
+    # Equality is pydantic's: it includes private state such as the span
+    assert spanned != Header(level=1, content="Header")
+    assert spanned != Paragraph(content="Header")
+
+
+def test_patch_text_replaces_only_spans():
+    front, content = spanned_document.parse(sample)
+    heading, paragraph = content.nodes[0], content.nodes[1]
+    patched = patch_text(
+        sample,
+        [
+            (paragraph.span, "Replaced paragraph\n"),
+            (heading.span, Header(level=2, content="Renamed").to_string() + "\n"),
+        ],
+    )
+    assert patched == sample.replace("# Header", "## Renamed").replace(
+        "A paragraph\nover two lines", "Replaced paragraph"
+    )
+    with pytest.raises(ValueError):
+        patch_text(sample, [(heading.span, ""), ((heading.span[0], heading.span[0] + 1), "")])
@@ -0,0 +1,63 @@
+import pickle
+
+import pytest
+from python_parser.src.base import ObsidianParserBase
+from python_parser.src.models import document
+from python_parser.src.models.compact import compact_node, expand_node
+from python_parser.src.vault import parse_vault
+
+NOTES = {
+    "a.md": "---\ntitle: A\nstatus: new\n---\n# Header\nSome text with #tag\n",
+    "b.md": "---\ntitle: B\n---\n```python\nprint('b')\n```\n- item one\n- item two\n",
+    "nested/c.md": "---\ntitle: C\n---\n> [!note] Callout\n> body\n![[image.png]]\n",
+    ".hidden/d.md": "---\ntitle: D\n---\nSkipped\n",
+    "notes.txt": "Not markdown\n",
+}
+
+
+def write_vault(directory, notes):
+    for name, text in notes.items():
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_vault_matches_sequential_parse(tmp_path, workers):
+    write_vault(tmp_path, NOTES)
+    results = parse_vault(str(tmp_path), workers=workers, chunksize=1)
+
+    parser = ObsidianParserBase(content_parser=document)
+    expected_paths = sorted(str(tmp_path / name) for name in ("a.md", "b.md", "nested/c.md"))
+    assert [result.path for result in results] == expected_paths
+    for result in results:
+        assert result.error is None
+        assert result.to_obsidian_file() == parser(result.path)
+
+
+def test_parse_vault_non_recursive(tmp_path):
+    write_vault(tmp_path, NOTES)
+    results = parse_vault(str(tmp_path), workers=1, recursive=False)
+    assert [result.path for result in results] == [
+        str(tmp_path / "a.md"),
+        str(tmp_path / "b.md"),
+    ]
+
+
+def test_parse_vault_reports_errors_without_aborting(tmp_path):
+    write_vault(tmp_path, {"bad.md": "---\ntitle: Bad\n---\n  > indented\n", **NOTES})
+    results = parse_vault(str(tmp_path), workers=2)
+
+    errors = {result.path: result.error for result in results if result.error}
+    assert list(errors) == [str(tmp_path / "bad.md")]
+    assert errors[str(tmp_path / "bad.md")].startswith("ParseError")
+    assert len(results) == 4
+
+
+def test_compact_results_round_trip(tmp_path):
+    write_vault(tmp_path, NOTES)
+    parsed = ObsidianParserBase(content_parser=document)(str(tmp_path / "b.md"))
+    records = [compact_node(node) for node in parsed.content.nodes]
+
+    assert pickle.loads(pickle.dumps(records)) == records
+    assert [expand_node(record) for record in records] == parsed.content.nodes
@@ -0,0 +1,58 @@
+from datetime import date
+
+import pytest
+import yaml
+from python_parser.src.models.parsers import parse_frontmatter
+from python_parser.src.models.yaml_loader import _NotFlat, load_flat, load_yaml
+
+FLAT = """id: XcEgwWjA6pXuCBmGmckQrX
+aliases: ['Python_Parser']
+tags: [project, python, 2024]
+created: 2024-01-02
+draft: yes
+count: 0x1F
+ratio: 1.5
+empty:
+quoted: "a: b"
+url: https://example.com/a#b
+"""
+
+NOT_FLAT = [
+    "tags:\n  - a\n  - b\n",
+    "desc: |\n  text\n",
+    "a: &x 1\nb: *x\n",
+    "nested: {a: 1}\n",
+    "tags: [a, [b]]\n",
+    "on: 1\n",
+    "note: a # comment\n",
+    "escaped: \"a\\tb\"\n",
+]
+
+
+def test_load_flat_matches_safe_load():
+    assert load_flat(FLAT) == yaml.safe_load(FLAT)
+    assert load_flat(FLAT)["created"] == date(2024, 1, 2)
+    assert load_flat("# only a comment\n\n") is None
+
+
+@pytest.mark.parametrize("text", NOT_FLAT)
+def test_load_flat_defers_other_yaml(text):
+    with pytest.raises(_NotFlat):
+        load_flat(text)
+    assert load_yaml(text) == yaml.safe_load(text)
+
+
+def test_load_yaml_returns_copies():
+    first = load_yaml(FLAT)
+    first["tags"].append("changed")
+    first["new"] = 1
+    assert load_yaml(FLAT) == yaml.safe_load(FLAT)
+
+
+def test_load_yaml_errors():
+    for text in ("a: [1\n", "a: b: c\n", "key:\tvalue\n\tmore: x\n", "a: 1\n\t"):
+        with pytest.raises(yaml.YAMLError):
+            yaml.safe_load(text)
+        with pytest.raises(yaml.YAMLError):
+            load_yaml(text)
+        assert parse_frontmatter(text).content == {}
@@ -0,0 +1,80 @@
+from datetime import date
+
+import yaml
+from python_parser.src.models import FrontMatter
+from python_parser.src.models.parsers import parse_frontmatter
+from python_parser.src.models.yaml_writer import dump_frontmatter, render_entry, split_entries
+
+SOURCE = """id: XcEgwWjA6pXuCBmGmckQrX
+aliases: ['Python_Parser']   # kept as written
+tags:
+  - project
+  - python
+
+# Links
+nested:
+  a: 1
+desc: |
+  multi
+  line
+status: new"""
+
+
+def test_render_entry_round_trips():
+    for key, value in [
+        ("tags", ["a", "b c", "yes", 1]),
+        ("status", "processed"),
+        ("on", "a: b"),
+        ("created", date(2024, 1, 2)),
+        ("nested", {"a": [1, {"b": None}]}),
+        ("text", "two\nlines"),
+    ]:
+        assert yaml.safe_load(render_entry(key, value)) == {key: value}
+    assert render_entry("tags", ["a", "b"]) == "tags: [a, b]\n"
+    assert render_entry("flag", "yes") == "flag: 'yes'\n"
+
+
+def test_split_entries():
+    entries = split_entries(SOURCE)
+    assert [key for is_entry, key, _ in entries if is_entry] == [
+        "id",
+        "aliases",
+        "tags",
+        "nested",
+        "desc",
+        "status",
+    ]
+    assert "".join(text for _, _, text in entries) == SOURCE
+    assert split_entries("a: 1\n  - broken\n- [") is None
+
+
+def test_unchanged_frontmatter_keeps_its_text():
+    frontmatter = parse_frontmatter(SOURCE)
+    assert frontmatter.to_string() == f"---\n{SOURCE}\n---"
+
+
+def test_changed_keys_are_the_only_diff():
+    frontmatter = parse_frontmatter(SOURCE)
+    frontmatter.update("aliases", ["Parser"])
+    frontmatter.content["tags"].append("new")
+    frontmatter.remove("nested")
+    frontmatter.update("status", "processed")
+    text = frontmatter.to_string()
+
+    assert text.startswith("---\nid: XcEgwWjA6pXuCBmGmckQrX\naliases: [Parser]\n")
+    assert "tags: [project, python, new]\n\n# Links\ndesc: |\n" in text
+    assert text.endswith("status: processed\n---")
+    assert yaml.safe_load(text[4:-4]) == frontmatter.content
+
+
+def test_block_scalar_moved_from_the_end_is_rendered():
+    frontmatter = parse_frontmatter("desc: |\n  multi\n  line")
+    frontmatter.add("status", "new")
+    text = frontmatter.to_string()[4:-4]
+    assert yaml.safe_load(text) == {"desc": "multi\nline", "status": "new"}
+
+
+def test_frontmatter_without_source():
+    frontmatter = FrontMatter(content={"aliases": ["Python_Parser"], "n": {"a": 1}})
+    assert frontmatter.to_string() == "---\naliases: [Python_Parser]\nn:\n  a: 1\n---"
+    assert dump_frontmatter({}) == ""